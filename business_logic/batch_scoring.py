@@ -0,0 +1,133 @@
+# Business Logic - Vektorisierte Lexikon-Bewertung für ganze Korpora
+import numpy as np
+from scipy import sparse
+
+from business_logic.text_analyzer import TextAnalyzer
+
+
+class BatchScorer:
+    """
+    Berechnet die Adjektiv- und Verb-Bewertung von analyze_adjectives() /
+    analyze_verbs() für viele Dokumente gleichzeitig.
+    Jeder bewertete Begriff (Wortart, Lemma bzw. Ausdruck, Modifikatoren wie
+    ("negator", "not")) bekommt eine Integer-ID, daraus entsteht eine
+    dünnbesetzte Dokument×Begriff Zählmatrix. Gewichtete Durchschnitte sind
+    dann Matrix-Vektor-Produkte mit den Score-Vektoren.
+
+    Die Matrix speichert keine Scores: score_matrix() baut den Score-Vektor
+    aus dem aktuellen Lexikon-Stand. Ändern sich nur Scores bzw.
+    Verstärkungsfaktoren, genügt score_matrix() auf der bestehenden Matrix
+    (mit demselben Scorer, die IDs gehören zu seinem Vokabular). Neue Wörter,
+    Ausdrücke oder Lemma-Formen erfordern eine neue Zählung.
+    """
+
+    def __init__(self, analyzer=None):
+        self.analyzer = analyzer if analyzer is not None else TextAnalyzer()
+
+        # Vokabular: alle Lemmas aus adjectives.csv und verbs.csv; Mehrwort-Ausdrücke
+        # und modifizierte Begriffe ("not" + "good") kommen beim Zählen dazu
+        self.vocabulary = []
+        self.term_ids = {}
+        for kind, lexicon in (("adjective", self.analyzer.adjectives), ("verb", self.analyzer.verbs)):
+            for lemma in sorted(lexicon):
+                self._add_term((kind, lemma, ()))
+
+    def _add_term(self, term):
+        """Nimmt einen Begriff (wortart, schlüssel, modifikatoren) ins Vokabular auf und gibt seine ID zurück"""
+        term_id = len(self.vocabulary)
+        self.vocabulary.append(term)
+        self.term_ids[term] = term_id
+        return term_id
+
+    def score_vectors(self, size, snapshot=None):
+        """
+        Score-Vektoren und 0/1-Masken je Wortart über den ersten size Begriffen,
+        berechnet aus snapshot (Standard: aktueller Stand des LexiconStore).
+        Begriffe, die es im Lexikon nicht mehr gibt, zählen nicht mit.
+        """
+        if snapshot is None:
+            snapshot = self.analyzer.lexicon_store.get()
+        lexica = {"adjective": snapshot.adjectives, "verb": snapshot.verbs}
+        phrases = snapshot.phrase_automaton.entries
+        vectors = {kind: (np.zeros(size, dtype=np.int64), np.zeros(size, dtype=np.int64)) for kind in lexica}
+
+        for term_id, (kind, key, modifiers) in enumerate(self.vocabulary[:size]):
+            # Gleiche Reihenfolge wie beim Zählen: Mehrwort-Ausdrücke vor einzelnen Lemmas
+            entry = phrases.get((kind, key))
+            score = entry.value if entry is not None else lexica[kind].get(key)
+            if score is None:
+                continue
+            if modifiers:
+                entries = [phrases.get(modifier) for modifier in modifiers]
+                _, _, score = TextAnalyzer._apply_modifiers(
+                    kind, key, score, [entry for entry in entries if entry is not None]
+                )
+            scores, mask = vectors[kind]
+            scores[term_id] = score
+            mask[term_id] = 1
+        return vectors
+
+    def count_matrix(self, texts):
+        """Baut die dünnbesetzte Dokument×Begriff Zählmatrix (CSR, int64)"""
+        indices = []
+        indptr = [0]
+        term_ids = self.term_ids
+        for text in texts:
+            for term in self.analyzer.find_sentiment_terms(text):
+                term_id = term_ids.get(term)
+                if term_id is None:
+                    term_id = self._add_term(term)
+                indices.append(term_id)
+            indptr.append(len(indices))
+
+        data = np.ones(len(indices), dtype=np.int64)
+        counts = sparse.csr_matrix(
+            (data, np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+            shape=(len(indptr) - 1, len(self.vocabulary))
+        )
+        counts.sum_duplicates()
+        return counts
+
+    def score_matrix(self, counts, snapshot=None):
+        """
+        Bewertet eine Zählmatrix aus count_matrix() desselben Scorers mit dem
+        aktuellen Lexikon-Stand (oder snapshot). Gibt je Wortart Durchschnitt,
+        Stimmung und Anzahl verschiedener Begriffe pro Dokument zurück (wie die
+        Einzelpfade).
+        """
+        present = (counts > 0).astype(np.int64)
+        vectors = self.score_vectors(counts.shape[1], snapshot)
+        adjective_scores, adjective_mask = vectors["adjective"]
+        verb_scores, verb_mask = vectors["verb"]
+        return {
+            'adjectives': self._score_part(counts, present, adjective_scores, adjective_mask,
+                                           "positive", "negative"),
+            'verbs': self._score_part(counts, present, verb_scores, verb_mask,
+                                      "positiv", "negativ"),
+        }
+
+    def score_texts(self, texts):
+        """Zählt und bewertet eine Liste von Texten in einem Schritt"""
+        return self.score_matrix(self.count_matrix(texts))
+
+    @staticmethod
+    def _score_part(counts, present, scores, mask, positive_label, negative_label):
+        """Gewichteter Durchschnitt und Stimmung für eine Wortart"""
+        total_score = counts @ scores
+        total_count = counts @ mask
+        distinct = present @ mask
+
+        has_hits = total_count > 0
+        avg = np.full(counts.shape[0], 50.0)
+        avg[has_hits] = total_score[has_hits] / total_count[has_hits]
+
+        sentiment = np.where(avg >= 60, positive_label,
+                             np.where(avg >= 40, "neutral", negative_label))
+        sentiment[~has_hits] = "neutral"
+
+        return {
+            # Python-round, damit die Rundung exakt dem Einzelpfad entspricht
+            'average_score': np.array([round(value, 1) for value in avg.tolist()]),
+            'sentiment': sentiment,
+            'count': distinct
+        }
@@ -0,0 +1,352 @@
+# Business Logic - Kompiliertes Binärformat der Lexika (mmap)
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping, Set
+
+from business_logic.text_analyzer import (
+    CSV_DIR,
+    LemmaCache,
+    LexiconSnapshot,
+    build_lemma_table,
+    build_phrase_automaton,
+    hash_lexicon_files,
+    lexicon_version,
+    load_irregular_forms,
+    load_modifiers,
+    load_phrases,
+    load_scores,
+    load_stopwords,
+)
+from business_logic.suffix_rules import (
+    DEFAULT_LANGUAGE,
+    SUFFIX_RULES_DIR,
+    SuffixRuleSet,
+    load_suffix_rules,
+    suffix_rules_path,
+)
+
+BINARY_LEXICON_PATH = os.path.join("data", "lexicon.bin")
+# Obergrenze für zwischengespeicherte Wort-Indizes (LRU vor der binären Suche)
+FIND_CACHE_SIZE = 100000
+
+MAGIC = b"BIASLEX1"
+# magic, Byte-Reihenfolge, Version (12 Zeichen), Anzahl Strings,
+# Anzahl Adjektive, Verben, Stopwords, unregelmäßige Verben/Adjektive, Tabellenformen,
+# Länge des JSON-Abschnitts mit Mehrwort-Ausdrücken und Modifikatoren (am Dateiende)
+HEADER = struct.Struct("<8s8s12s4x8I")
+MISSING_SCORE = -32768
+NO_LINK = -1
+
+
+def _align(offset):
+    """Richtet Abschnitte auf 8 Byte aus, damit memoryview.cast() funktioniert"""
+    return (offset + 7) & ~7
+
+
+def compile_lexicon(csv_dir=CSV_DIR, output_path=BINARY_LEXICON_PATH, language=DEFAULT_LANGUAGE,
+                    rules_dir=SUFFIX_RULES_DIR):
+    """
+    Kompiliert die CSV-Lexika in eine Binärdatei:
+    sortierte String-Tabelle (UTF-8) plus typisierte Spalten pro String
+    (Adjektiv-/Verb-Score als int16, Lemma-Verweise als int32-Index,
+    Stopword-Flag als uint8). Mehrwort-Ausdrücke, Modifikatoren und die
+    Suffix-Regeln (wenige Einträge) folgen als JSON am Dateiende.
+    Die Datei wird atomar ersetzt.
+    """
+    with open(suffix_rules_path(language, rules_dir), 'r', encoding='utf-8') as file:
+        rules_spec = json.load(file)
+    stopwords = load_stopwords(csv_dir)
+    irregular_verbs = load_irregular_forms("lemma_verbs.csv", csv_dir)
+    irregular_adjectives = load_irregular_forms("lemma_adjectives.csv", csv_dir)
+    adjectives = load_scores("adjectives.csv", "adjective", csv_dir)
+    verbs = load_scores("verbs.csv", "verb", csv_dir)
+    lemma_table = build_lemma_table(
+        irregular_verbs, irregular_adjectives, adjectives, verbs, SuffixRuleSet(rules_spec)
+    )
+    phrase_data = json.dumps({
+        'language': language,
+        'suffix_rules': rules_spec,
+        'phrases': load_phrases(csv_dir),
+        'modifiers': load_modifiers(csv_dir)
+    }).encode('utf-8')
+
+    strings = set(stopwords) | set(adjectives) | set(verbs) | set(lemma_table) | set(lemma_table.values())
+    strings |= set(irregular_verbs.values()) | set(irregular_adjectives.values())
+    encoded = sorted(word.encode('utf-8') for word in strings)
+    ids = {word.decode('utf-8'): i for i, word in enumerate(encoded)}
+    n = len(encoded)
+
+    string_offsets = array('I', [0]) * (n + 1)
+    position = 0
+    for i, word in enumerate(encoded):
+        position += len(word)
+        string_offsets[i + 1] = position
+
+    def score_column(lexicon):
+        column = array('h', [MISSING_SCORE]) * n
+        for word, score in lexicon.items():
+            column[ids[word]] = score
+        return column
+
+    def link_column(links):
+        column = array('i', [NO_LINK]) * n
+        for form, lemma in links.items():
+            column[ids[form]] = ids[lemma]
+        return column
+
+    stopword_flags = array('B', [0]) * n
+    for word in stopwords:
+        stopword_flags[ids[word]] = 1
+
+    sections = [
+        string_offsets,
+        score_column(adjectives),
+        score_column(verbs),
+        link_column(irregular_verbs),
+        link_column(irregular_adjectives),
+        link_column(lemma_table),
+        stopword_flags,
+    ]
+
+    # Gleiche Versionskennung wie LexiconStore für dieselben Quelldateien
+    version = lexicon_version(hash_lexicon_files(csv_dir, language, rules_dir))
+    header = HEADER.pack(
+        MAGIC, sys.byteorder.encode('ascii').ljust(8), version.encode('ascii'),
+        n, len(adjectives), len(verbs), len(stopwords),
+        len(irregular_verbs), len(irregular_adjectives), len(lemma_table), len(phrase_data)
+    )
+
+    tmp_path = f"{output_path}.tmp{os.getpid()}"
+    with open(tmp_path, 'wb') as file:
+        file.write(header)
+        for section in sections + [b"".join(encoded)]:
+            padding = _align(file.tell()) - file.tell()
+            file.write(b"\0" * padding)
+            file.write(section if isinstance(section, bytes) else section.tobytes())
+        file.write(phrase_data)
+    os.replace(tmp_path, output_path)
+    print(f"Lexikon kompiliert: {n} Strings -> {output_path}")
+    return output_path
+
+
+class BinaryLexicon:
+    """
+    Öffnet ein mit compile_lexicon() erzeugtes Lexikon per mmap.
+    Alle Prozesse, die dieselbe Datei öffnen, teilen sich die Speicherseiten.
+    Die Views (adjectives, verbs, ...) verhalten sich wie die bisherigen
+    Dictionaries bzw. das Stopword-Set, lesen aber direkt aus der Datei.
+    Ein Lookup ist eine binäre Suche über die String-Tabelle und 20-60x
+    langsamer als ein Dictionary-Lookup (siehe benchmark_binary_lexicon.py);
+    ein begrenzter LRU-Cache (self.cache) vor find() bringt wiederholte
+    Wörter annähernd auf Dictionary-Niveau.
+    Der Cache ist privater Speicher pro Prozess (höchstens cache_size Einträge).
+    """
+
+    def __init__(self, path=BINARY_LEXICON_PATH, cache_size=FIND_CACHE_SIZE):
+        self.path = path
+        self.cache = LemmaCache(self._bisect, cache_size)
+        self.find = self.cache.lookup
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(self._mmap)
+
+        (magic, byteorder, version, n, n_adjectives, n_verbs, n_stopwords,
+         n_irregular_verbs, n_irregular_adjectives, n_table, n_phrase_data) = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError(f"{path} ist keine kompilierte Lexikon-Datei")
+        if byteorder.strip() != sys.byteorder.encode('ascii'):
+            raise ValueError(f"{path} wurde mit anderer Byte-Reihenfolge kompiliert")
+
+        self.version = version.decode('ascii')
+        self.size = n
+
+        position = HEADER.size
+        columns = []
+        for typecode, length in (('I', n + 1), ('h', n), ('h', n), ('i', n), ('i', n), ('i', n), ('B', n)):
+            position = _align(position)
+            item_size = array(typecode).itemsize
+            columns.append(buffer[position:position + item_size * length].cast(typecode))
+            position += item_size * length
+        position = _align(position)
+
+        (self._offsets, adjective_scores, verb_scores, irregular_verb_links,
+         irregular_adjective_links, table_links, stopword_flags) = columns
+        self._blob = buffer[position:len(buffer) - n_phrase_data]
+
+        phrase_data = json.loads(bytes(buffer[len(buffer) - n_phrase_data:]).decode('utf-8'))
+        self.phrases = [tuple(row) for row in phrase_data['phrases']]
+        self.modifiers = [tuple(row) for row in phrase_data['modifiers']]
+        if 'suffix_rules' in phrase_data:
+            self.suffix_rules = SuffixRuleSet(phrase_data['suffix_rules'])
+        else:
+            # Ältere Dateien ohne eingebettete Regeln
+            self.suffix_rules = load_suffix_rules(phrase_data.get('language', DEFAULT_LANGUAGE))
+
+        self.adjectives = ScoreView(self, adjective_scores, n_adjectives)
+        self.verbs = ScoreView(self, verb_scores, n_verbs)
+        self.irregular_verbs = LinkView(self, irregular_verb_links, n_irregular_verbs)
+        self.irregular_adjectives = LinkView(self, irregular_adjective_links, n_irregular_adjectives)
+        self.lemma_table = LinkView(self, table_links, n_table)
+        self.stopwords = FlagView(self, stopword_flags, n_stopwords)
+
+    def word(self, index):
+        """Gibt den String mit dem Index zurück"""
+        return str(self._blob[self._offsets[index]:self._offsets[index + 1]], 'utf-8')
+
+    def _bisect(self, word):
+        """Binäre Suche in der sortierten String-Tabelle, -1 wenn nicht vorhanden (über find())"""
+        if not isinstance(word, str):
+            return -1
+        key = word.encode('utf-8')
+        index = bisect_left(self, key)
+        if index < self.size and self[index] == key:
+            return index
+        return -1
+
+    def __getitem__(self, index):
+        # Rohe UTF-8 Bytes eines Eintrags (wird von bisect verwendet)
+        return self._blob[self._offsets[index]:self._offsets[index + 1]].tobytes()
+
+    def __len__(self):
+        return self.size
+
+    def snapshot(self):
+        """Erstellt einen LexiconSnapshot für den TextAnalyzer"""
+        return LexiconSnapshot(
+            version=self.version,
+            stopwords=self.stopwords,
+            irregular_verbs=self.irregular_verbs,
+            irregular_adjectives=self.irregular_adjectives,
+            adjectives=self.adjectives,
+            verbs=self.verbs,
+            lemma_table=self.lemma_table,
+            phrase_automaton=build_phrase_automaton(self.phrases, self.modifiers, self.lemma_table),
+            suffix_rules=self.suffix_rules,
+        )
+
+
+class ScoreView(Mapping):
+    """Wort -> Score, nur Einträge mit gesetztem Score"""
+
+    def __init__(self, lexicon, column, length):
+        self._lexicon = lexicon
+        self._column = column
+        self._length = length
+
+    def __getitem__(self, word):
+        index = self._lexicon.find(word)
+        if index < 0 or self._column[index] == MISSING_SCORE:
+            raise KeyError(word)
+        return self._column[index]
+
+    def __contains__(self, word):
+        index = self._lexicon.find(word)
+        return index >= 0 and self._column[index] != MISSING_SCORE
+
+    def __iter__(self):
+        for index in range(self._lexicon.size):
+            if self._column[index] != MISSING_SCORE:
+                yield self._lexicon.word(index)
+
+    def __len__(self):
+        return self._length
+
+
+class LinkView(Mapping):
+    """Wortform -> Lemma über Integer-Verweise in die String-Tabelle"""
+
+    def __init__(self, lexicon, column, length):
+        self._lexicon = lexicon
+        self._column = column
+        self._length = length
+
+    def __getitem__(self, word):
+        index = self._lexicon.find(word)
+        if index < 0 or self._column[index] == NO_LINK:
+            raise KeyError(word)
+        return self._lexicon.word(self._column[index])
+
+    def get(self, word, default=None):
+        index = self._lexicon.find(word)
+        if index < 0 or self._column[index] == NO_LINK:
+            return default
+        return self._lexicon.word(self._column[index])
+
+    def __contains__(self, word):
+        index = self._lexicon.find(word)
+        return index >= 0 and self._column[index] != NO_LINK
+
+    def __iter__(self):
+        for index in range(self._lexicon.size):
+            if self._column[index] != NO_LINK:
+                yield self._lexicon.word(index)
+
+    def __len__(self):
+        return self._length
+
+
+class FlagView(Set):
+    """Menge aller Wörter mit gesetztem Flag (z.B. Stopwords)"""
+
+    def __init__(self, lexicon, column, length):
+        self._lexicon = lexicon
+        self._column = column
+        self._length = length
+
+    def __contains__(self, word):
+        index = self._lexicon.find(word)
+        return index >= 0 and self._column[index] != 0
+
+    def __iter__(self):
+        for index in range(self._lexicon.size):
+            if self._column[index]:
+                yield self._lexicon.word(index)
+
+    def __len__(self):
+        return self._length
+
+
+class BinaryLexiconStore:
+    """
+    Gleiche Schnittstelle wie LexiconStore, liest aber die kompilierte Datei.
+    Wird die Datei neu kompiliert (os.replace), wird sie beim nächsten get()
+    neu geöffnet; bestehende Snapshots behalten ihre alte Abbildung.
+    """
+
+    def __init__(self, path=BINARY_LEXICON_PATH, check_interval=1.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._file_stat = None
+        self._last_check = 0.0
+
+    def __getstate__(self):
+        # Für Worker-Prozesse: nur die Konfiguration übertragen, nicht die Abbildung
+        return {'path': self.path, 'check_interval': self.check_interval}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def get(self):
+        """Gibt den aktuellen Snapshot zurück und öffnet die Datei bei Bedarf neu"""
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if snapshot is not None and now - self._last_check < self.check_interval:
+            return snapshot
+
+        st = os.stat(self.path)
+        file_stat = (st.st_ino, st.st_mtime_ns, st.st_size)
+        with self._lock:
+            if self._snapshot is None or file_stat != self._file_stat:
+                self._snapshot = BinaryLexicon(self.path).snapshot()
+                self._file_stat = file_stat
+            self._last_check = now
+            return self._snapshot
@@ -0,0 +1,203 @@
+# Business Logic - Kompakte, array-basierte Lexika für grosse Wortlisten
+import sys
+from array import array
+from collections.abc import Mapping
+
+from business_logic.binary_lexicon import (
+    MISSING_SCORE,
+    NO_LINK,
+    FlagView,
+    LinkView,
+    ScoreView,
+)
+from business_logic.text_analyzer import (
+    LemmaCache,
+    LexiconSnapshot,
+    LexiconStore,
+    build_phrase_automaton,
+    lexicon_version,
+    load_irregular_forms,
+    load_modifiers,
+    load_phrases,
+    load_scores,
+    load_stopwords,
+)
+from business_logic.suffix_rules import load_suffix_rules
+
+# Obergrenze für zwischengespeicherte Lemma-Lookups (LRU, älteste werden verdrängt)
+LEMMA_CACHE_SIZE = 100000
+
+
+class CompactLexicon:
+    """
+    Alle Lexika in einer gemeinsamen, internierten String-Tabelle:
+    jedes Wort existiert genau einmal (Liste + ein Index-Dictionary),
+    Scores liegen in array('h')-Spalten, Lemma-Verweise als int32-Index.
+    Die regelmäßigen Wortformen werden nicht gespeichert, sondern beim
+    Lookup über die Suffix-Regeln aufgelöst (siehe LemmaTableView).
+    """
+
+    def __init__(self, stopwords, irregular_verbs, irregular_adjectives, adjectives, verbs, suffix_rules):
+        self.suffix_rules = suffix_rules
+        index = {}
+        words = []
+
+        def intern(word):
+            word_id = index.get(word)
+            if word_id is None:
+                word = sys.intern(word)
+                word_id = index[word] = len(words)
+                words.append(word)
+            return word_id
+
+        for lexicon in (adjectives, verbs):
+            for word in lexicon:
+                intern(word)
+        for links in (irregular_verbs, irregular_adjectives):
+            for form, lemma in links.items():
+                intern(form)
+                intern(lemma)
+        for word in stopwords:
+            intern(word)
+
+        n = len(words)
+        self._index = index
+        self.words = words
+        self.size = n
+
+        self.adjective_scores = array('h', [MISSING_SCORE]) * n
+        self.verb_scores = array('h', [MISSING_SCORE]) * n
+        for column, lexicon in ((self.adjective_scores, adjectives), (self.verb_scores, verbs)):
+            for word, score in lexicon.items():
+                column[index[word]] = score
+
+        self.irregular_verb_links = array('i', [NO_LINK]) * n
+        self.irregular_adjective_links = array('i', [NO_LINK]) * n
+        for column, links in ((self.irregular_verb_links, irregular_verbs),
+                              (self.irregular_adjective_links, irregular_adjectives)):
+            for form, lemma in links.items():
+                column[index[form]] = index[lemma]
+
+        self.stopword_flags = bytearray(n)
+        for word in stopwords:
+            self.stopword_flags[index[word]] = 1
+
+        self.adjectives = ScoreView(self, self.adjective_scores, len(adjectives))
+        self.verbs = ScoreView(self, self.verb_scores, len(verbs))
+        self.irregular_verbs = LinkView(self, self.irregular_verb_links, len(irregular_verbs))
+        self.irregular_adjectives = LinkView(self, self.irregular_adjective_links, len(irregular_adjectives))
+        self.stopwords = FlagView(self, self.stopword_flags, len(stopwords))
+        self.lemma_table = LemmaTableView(self)
+
+    def find(self, word):
+        """Index des Wortes in der String-Tabelle, -1 wenn nicht vorhanden"""
+        return self._index.get(word, -1)
+
+    def word(self, index):
+        """Gibt den String mit dem Index zurück"""
+        return self.words[index]
+
+    def is_lemma(self, index):
+        """True, wenn das Wort ein bewertetes Adjektiv oder Verb ist"""
+        return self.adjective_scores[index] != MISSING_SCORE or self.verb_scores[index] != MISSING_SCORE
+
+
+class LemmaTableView(Mapping):
+    """
+    Wortform -> Lemma mit denselben Ergebnissen wie build_lemma_table(),
+    ohne die (bei grossen Lexika millionenfachen) regelmäßigen Formen zu
+    speichern. Aufgelöste Formen liegen in einem begrenzten LemmaCache
+    (Statistik über lemma_table.cache.stats()). Die Standard-Lexika brauchen
+    keinen Cache: ihre vorberechnete Lemma-Tabelle ist ein einziger Lookup.
+    """
+
+    def __init__(self, lexicon, cache_size=LEMMA_CACHE_SIZE):
+        self._lexicon = lexicon
+        self.cache = LemmaCache(self._resolve, cache_size)
+        self._lookup = self.cache.lookup
+        self._length = None
+
+    def _resolve(self, word):
+        """Gleiche Prioritäten wie die Lemma-Tabelle: unregelmäßig > Grundform > Suffix-Regeln"""
+        lexicon = self._lexicon
+        index = lexicon.find(word)
+        if index >= 0:
+            link = lexicon.irregular_verb_links[index]
+            if link == NO_LINK:
+                link = lexicon.irregular_adjective_links[index]
+            if link != NO_LINK:
+                return lexicon.words[link]
+            if lexicon.is_lemma(index):
+                return lexicon.words[index]
+
+        candidate = lexicon.suffix_rules.apply(word)
+        if candidate != word:
+            index = lexicon.find(candidate)
+            if index >= 0 and lexicon.is_lemma(index):
+                return lexicon.words[index]
+        return None
+
+    def get(self, word, default=None):
+        lemma = self._lookup(word)
+        return default if lemma is None else lemma
+
+    def __getitem__(self, word):
+        lemma = self.get(word)
+        if lemma is None:
+            raise KeyError(word)
+        return lemma
+
+    def __contains__(self, word):
+        return self.get(word) is not None
+
+    def __iter__(self):
+        lexicon = self._lexicon
+        # Gespeicherte Wörter (Grundformen und unregelmäßige Formen)
+        for word in lexicon.words:
+            if self.get(word) is not None:
+                yield word
+        # Regelmäßige Formen, die auf ihr Lemma zurückführen
+        for index, lemma in enumerate(lexicon.words):
+            if not lexicon.is_lemma(index):
+                continue
+            for form in lexicon.suffix_rules.candidate_forms(lemma):
+                if lexicon.find(form) < 0 and self._resolve(form) == lemma:
+                    yield form
+
+    def __len__(self):
+        if self._length is None:
+            self._length = sum(1 for _ in self)
+        return self._length
+
+
+class CompactLexiconStore(LexiconStore):
+    """
+    LexiconStore mit kompakter Speicherung (für Lexika mit 100k+ Einträgen).
+    Hot-Reload und Pickling funktionieren wie beim LexiconStore.
+    """
+
+    def _load(self, file_hashes):
+        """Lädt alle CSV-Dateien in eine CompactLexicon und erstellt daraus den Snapshot"""
+        version = lexicon_version(file_hashes)
+        lexicon = CompactLexicon(
+            stopwords=load_stopwords(self.csv_dir),
+            irregular_verbs=load_irregular_forms("lemma_verbs.csv", self.csv_dir),
+            irregular_adjectives=load_irregular_forms("lemma_adjectives.csv", self.csv_dir),
+            adjectives=load_scores("adjectives.csv", "adjective", self.csv_dir),
+            verbs=load_scores("verbs.csv", "verb", self.csv_dir),
+            suffix_rules=load_suffix_rules(self.language, self.rules_dir),
+        )
+        phrase_automaton = build_phrase_automaton(
+            load_phrases(self.csv_dir), load_modifiers(self.csv_dir), lexicon.lemma_table
+        )
+        return LexiconSnapshot(
+            version=version,
+            stopwords=lexicon.stopwords,
+            irregular_verbs=lexicon.irregular_verbs,
+            irregular_adjectives=lexicon.irregular_adjectives,
+            adjectives=lexicon.adjectives,
+            verbs=lexicon.verbs,
+            lemma_table=lexicon.lemma_table,
+            phrase_automaton=phrase_automaton,
+            suffix_rules=lexicon.suffix_rules,
+        )
@@ -1,51 +1,283 @@
+import csv
+import os
+from pathlib import Path
+
+import numpy as np
+import srsly
+from spacy.attrs import LEMMA, LOWER
 from spacy.language import Language
-from spacy.tokens import Doc
+from spacy.matcher import PhraseMatcher
+from spacy.tokens import Doc, Span
+from spacy.util import filter_spans, minibatch
 # Doc ist eine Datenstruktur in spaCy für einen kompletten text mit Tokens, Annotationen etc.
 # Language ist die Basisklasse für spaCy-Sprachmodelle und ermöglicht das Hinzufügen von Komponenten zur Verarbeitungspipeline (ermöglicht die Erstellung benutzerdefinierter NLP-Komponenten).
 
-# Frame-Definitionen: einfache Wortlisten je Frame (serh vereinfachte Version)
-FRAMES = {
-    "conflict": {"vs", "battle", "fight", "clash"},
-    "economic": {"cost", "market", "jobs", "growth", "workloads"},
-    "human_interest": {"child", "family", "story", "heart"},
-}
+# Frame-Labels in derselben Reihenfolge wie in data/frames_train.jsonl (Position im Zählvektor)
+FRAME_LABELS = (
+    "conflict", "economic", "human_interest", "policy_regulation",
+    "public_safety", "environment", "health", "technology",
+)
+
+# Stichwörter je Frame (Spalten cue,frame); Mehrwort-Stichwörter werden mit dem PhraseMatcher gesucht
+FRAME_CUES_PATH = os.path.join("data", "CSV-Data", "frame_cues.csv")
+
+
+def load_frame_cues(path=FRAME_CUES_PATH):
+    """Lädt die Frame-Stichwörter als Dictionary frame -> Menge von Stichwörtern"""
+    frames = {label: set() for label in FRAME_LABELS}
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            for row in csv.DictReader(file):
+                frame = row['frame'].strip()
+                if frame not in frames:
+                    raise ValueError(f"Unbekanntes Frame '{frame}' in {path}")
+                frames[frame].add(" ".join(row['cue'].lower().split()))
+        print(f"Frame-Stichwörter geladen: {sum(len(cues) for cues in frames.values())} Einträge")
+    except FileNotFoundError:
+        print(f"Datei {path} nicht gefunden - keine Frame-Stichwörter")
+    return frames
 
 # Sentiment-Stichwortlisten (sehr vereinfachte Version)
 POS_WORDS = {"great", "good", "excellent", "love", "amazing"}
 NEG_WORDS = {"bad", "terrible", "hate", "awful", "waste"}
 
-@Language.factory("framing_component") #erstellt eine Fabrikfunktion für die Framing-Komponente
-def create_framing_component(nlp, name):
-    # Custom-Attribut am Doc: doc._.frames wird am doc angehängt
-    Doc.set_extension("frames", default=dict, force=True)
+# Standard-Batchgrösse von pipe(), wenn nlp.pipe() keine vorgibt
+DEFAULT_BATCH_SIZE = 256
 
-    def pipe(doc: Doc): # Die Pipe-Funktion analysiert den Text und zählt Vorkommen von Wörtern aus den definierten Frames. 
-        # Es wird ein Dictionary mit den Zählungen der Frames erstellt und dem Doc-Objekt hinzugefügt. im Format doc._.frames = {'conflict': 2, 'economic': 1, 'human_interest': 0}
-        counts = {k: 0 for k in FRAMES}
-        for t in doc:
-            lemma = t.lemma_.lower()  # Grundform eines Wortes, z. B. "grow" statt "grows"
-            for k, lex in FRAMES.items(): 
-                if lemma in lex:
-                    counts[k] += 1
-        doc._.frames = counts
-        return doc
-
-    return pipe
-
-@Language.factory("sentiment_rule") # Diese "sentimentanalyse" wird nicht so tiefgehend sein wie spacy's eingebaute Textkategorisierung, jedoch kann so der Unterschied betrachtet werden.
-def create_sentiment_rule(nlp, name):
-    # weiteres Custom-Attribut: doc._.sentiment_rule wird am doc angehängt
+
+def _register_extensions():
+    """Custom-Attribute am Doc (auch in Worker-Prozessen nach dem Unpickling nötig)"""
+    Doc.set_extension("frames", default=dict, force=True)
+    Doc.set_extension("frame_vector", default=None, force=True)
     Doc.set_extension("sentiment_rule", default=0, force=True)
 
-    def pipe(doc: Doc): # Die Pipe-Funktion analysiert den Text und berechnet eine Sentiment-Bewertung basierend auf vordefinierten positiven und negativen Wörtern.
-        score = 0
+
+def _find_rows(keys, values):
+    """Zeile jedes Werts in den sortierten Hash-IDs keys, -1 wenn nicht enthalten"""
+    if len(keys) == 0:
+        return np.full(len(values), -1, dtype=np.intp)
+    rows = np.searchsorted(keys, values)
+    rows[rows == len(keys)] = 0
+    return np.where(keys[rows] == values, rows, -1)
+
+
+class FramingComponent:
+    """
+    Zählt Frame-Stichwörter: invertierter Index Hash-ID -> Frame-IDs für
+    einzelne Wörter (ein Lookup pro Token, egal wie viele Frames/Stichwörter),
+    PhraseMatcher für Mehrwort-Stichwörter ("climate change").
+    Die Stichwörter werden beim Start in StringStore-Hash-IDs umgewandelt,
+    verglichen werden die Integer-Attribute token.lemma / token.lower.
+    Mit use_array=True wird pro Batch vektorisiert über doc.to_array([LOWER, LEMMA]) gezählt;
+    das ist hier langsamer als die Hash-ID-Lookups (scripts/benchmark_rule_components.py),
+    daher ist use_array=False der Standard.
+    Ergebnis: doc._.frames = {'conflict': 2, 'economic': 1, ...} und
+    doc._.frame_vector (NumPy-Zählvektor in der Reihenfolge von FRAME_LABELS).
+    """
+
+    def __init__(self, nlp, name, cues_path=FRAME_CUES_PATH, use_array=False):
+        _register_extensions()
+        self.name = name
+        self.vocab = nlp.vocab
+        self.use_array = use_array
+        self.frames = load_frame_cues(cues_path)
+        self._build_index()
+
+    def _build_index(self):
+        strings = self.vocab.strings
+        cue_frames = {}
+        for frame_id, label in enumerate(FRAME_LABELS):
+            for cue in self.frames[label]:
+                cue_frames.setdefault(cue, []).append(frame_id)
+
+        # Hash-ID -> Frame-IDs; Lemmas von Eigennamen sind gross geschrieben ("War", "NASA")
+        self.cue_index = {}
+        for cue, frame_ids in cue_frames.items():
+            for variant in {cue, cue.capitalize(), cue.upper()}:
+                self.cue_index[strings.add(variant)] = tuple(frame_ids)
+
+        # Array-Pfad: sortierte Hash-IDs und 0/1-Matrix Hash-ID x Frame
+        self.cue_keys = np.array(sorted(self.cue_index), dtype=np.uint64)
+        self.cue_frames = np.zeros((len(self.cue_keys), len(FRAME_LABELS)), dtype=np.int64)
+        for row, key in enumerate(self.cue_keys.tolist()):
+            self.cue_frames[row, list(self.cue_index[key])] = 1
+
+        self.phrase_matcher = PhraseMatcher(self.vocab, attr="LOWER")
+        for cue in cue_frames:
+            if " " in cue:
+                self.phrase_matcher.add(cue, [Doc(self.vocab, words=cue.split())])
+
+    def _phrase_spans(self, doc):
+        """Mehrwort-Stichwörter, überlappende Treffer nur einmal"""
+        if not len(self.phrase_matcher):
+            return []
+        return filter_spans([Span(doc, start, end, label=match_id)
+                             for match_id, start, end in self.phrase_matcher(doc)])
+
+    def _frame_ids(self, doc):
+        """Frame-IDs aller Treffer im Doc (Token für Token über die Hash-IDs)"""
+        cue_index = self.cue_index
+        frame_ids = []
+        covered = set()
+        for span in self._phrase_spans(doc):
+            frame_ids.extend(cue_index[span.label])
+            covered.update(range(span.start, span.end))
+
         for t in doc:
-            w = t.lower_
-            if w in POS_WORDS:
-                score += 1
-            if w in NEG_WORDS:
-                score -= 1
-        doc._.sentiment_rule = score
-        return doc
-
-    return pipe
+            if t.i in covered:
+                continue
+            # Grundform eines Wortes (z. B. "grow" statt "grows"), ohne Lemmatizer die Kleinschreibung
+            ids = cue_index.get(t.lemma) or cue_index.get(t.lower)
+            if ids:
+                frame_ids.extend(ids)
+        return frame_ids
+
+    def _count_batch(self, batch):
+        """Zählmatrix Doc x Frame für einen Batch"""
+        n_frames = len(FRAME_LABELS)
+        if not self.use_array:
+            # Ein np.bincount pro Batch: Position = Doc-Index * Anzahl Frames + Frame-ID
+            positions = []
+            for doc_index, doc in enumerate(batch):
+                offset = doc_index * n_frames
+                positions.extend(offset + frame_id for frame_id in self._frame_ids(doc))
+            counts = np.bincount(np.asarray(positions, dtype=np.intp), minlength=len(batch) * n_frames)
+            return counts.reshape(len(batch), n_frames)
+
+        # Vektorisiert: alle Tokens des Batches in einem Array (Spalten LOWER, LEMMA)
+        counts = np.zeros((len(batch), n_frames), dtype=np.int64)
+        arrays = [doc.to_array([LOWER, LEMMA]).reshape(-1, 2) for doc in batch]
+        attrs = np.concatenate(arrays)
+        doc_index = np.repeat(np.arange(len(batch)), [len(array) for array in arrays])
+
+        rows = _find_rows(self.cue_keys, attrs[:, 1])
+        missing = rows < 0
+        rows[missing] = _find_rows(self.cue_keys, attrs[missing, 0])
+
+        token_offset = 0
+        for i, doc in enumerate(batch):
+            for span in self._phrase_spans(doc):
+                counts[i, list(self.cue_index[span.label])] += 1
+                rows[token_offset + span.start:token_offset + span.end] = -1
+            token_offset += len(doc)
+
+        found = rows >= 0
+        np.add.at(counts, doc_index[found], self.cue_frames[rows[found]])
+        return counts
+
+    def __call__(self, doc: Doc):
+        return next(iter(self.pipe([doc], batch_size=1)))
+
+    def pipe(self, stream, batch_size=DEFAULT_BATCH_SIZE):
+        for batch in minibatch(stream, size=batch_size):
+            for doc, vector in zip(batch, self._count_batch(batch)):
+                doc._.frame_vector = vector
+                doc._.frames = dict(zip(FRAME_LABELS, vector.tolist()))
+                yield doc
+
+    # --- Serialisierung (Pickling für n_process, to_disk/from_disk für gespeicherte Pipelines) ---
+    def __getstate__(self):
+        return {'name': self.name, 'vocab': self.vocab, 'use_array': self.use_array, 'frames': self.frames}
+
+    def __setstate__(self, state):
+        _register_extensions()
+        self.__dict__.update(state)
+        self._build_index()
+
+    def to_disk(self, path, exclude=tuple()):
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        srsly.write_json(path / "frame_cues.json", {label: sorted(cues) for label, cues in self.frames.items()})
+
+    def from_disk(self, path, exclude=tuple()):
+        data = srsly.read_json(Path(path) / "frame_cues.json")
+        self.frames = {label: set(data.get(label, ())) for label in FRAME_LABELS}
+        self._build_index()
+        return self
+
+
+class SentimentRuleComponent:
+    """
+    Diese "sentimentanalyse" wird nicht so tiefgehend sein wie spacy's eingebaute
+    Textkategorisierung, jedoch kann so der Unterschied betrachtet werden:
+    doc._.sentiment_rule = Anzahl positiver minus Anzahl negativer Stichwörter.
+    Verglichen wird token.lower (Hash-ID), mit use_array=True vektorisiert pro Batch.
+    """
+
+    def __init__(self, nlp, name, use_array=True):
+        _register_extensions()
+        self.name = name
+        self.vocab = nlp.vocab
+        self.use_array = use_array
+        self.pos_words = set(POS_WORDS)
+        self.neg_words = set(NEG_WORDS)
+        self._build_index()
+
+    def _build_index(self):
+        # Hash-ID -> Beitrag zum Score (+1 / -1, 0 wenn in beiden Listen)
+        strings = self.vocab.strings
+        self.word_scores = {}
+        for word in self.pos_words:
+            key = strings.add(word)
+            self.word_scores[key] = self.word_scores.get(key, 0) + 1
+        for word in self.neg_words:
+            key = strings.add(word)
+            self.word_scores[key] = self.word_scores.get(key, 0) - 1
+
+        self.word_keys = np.array(sorted(self.word_scores), dtype=np.uint64)
+        self.key_scores = np.array([self.word_scores[key] for key in self.word_keys.tolist()], dtype=np.int64)
+
+    def _score_batch(self, batch):
+        """Regel-Score pro Doc eines Batches"""
+        if not self.use_array:
+            word_scores = self.word_scores
+            return [sum(word_scores.get(t.lower, 0) for t in doc) for doc in batch]
+
+        arrays = [doc.to_array(LOWER) for doc in batch]
+        lowers = np.concatenate(arrays)
+        doc_index = np.repeat(np.arange(len(batch)), [len(array) for array in arrays])
+        rows = _find_rows(self.word_keys, lowers)
+        found = rows >= 0
+        scores = np.zeros(len(batch), dtype=np.int64)
+        np.add.at(scores, doc_index[found], self.key_scores[rows[found]])
+        return scores.tolist()
+
+    def __call__(self, doc: Doc):
+        return next(iter(self.pipe([doc], batch_size=1)))
+
+    def pipe(self, stream, batch_size=DEFAULT_BATCH_SIZE):
+        for batch in minibatch(stream, size=batch_size):
+            for doc, score in zip(batch, self._score_batch(batch)):
+                doc._.sentiment_rule = score
+                yield doc
+
+    def __getstate__(self):
+        return {'name': self.name, 'vocab': self.vocab, 'use_array': self.use_array,
+                'pos_words': self.pos_words, 'neg_words': self.neg_words}
+
+    def __setstate__(self, state):
+        _register_extensions()
+        self.__dict__.update(state)
+        self._build_index()
+
+    def to_disk(self, path, exclude=tuple()):
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        srsly.write_json(path / "words.json", {'pos': sorted(self.pos_words), 'neg': sorted(self.neg_words)})
+
+    def from_disk(self, path, exclude=tuple()):
+        data = srsly.read_json(Path(path) / "words.json")
+        self.pos_words = set(data['pos'])
+        self.neg_words = set(data['neg'])
+        self._build_index()
+        return self
+
+
+@Language.factory("framing_component", default_config={"cues_path": FRAME_CUES_PATH, "use_array": False}) #erstellt eine Fabrikfunktion für die Framing-Komponente
+def create_framing_component(nlp, name, cues_path, use_array):
+    return FramingComponent(nlp, name, cues_path, use_array)
+
+
+@Language.factory("sentiment_rule", default_config={"use_array": True})
+def create_sentiment_rule(nlp, name, use_array):
+    return SentimentRuleComponent(nlp, name, use_array)
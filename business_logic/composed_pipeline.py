@@ -0,0 +1,94 @@
+# Business Logic - Eine zusammengesetzte Pipeline für ML-Modelle und Regeln
+from pathlib import Path
+
+import spacy
+from spacy.language import Language
+from spacy.lookups import Table
+from spacy.tokens import Doc
+
+from business_logic.model_registry import resolve_model_dir
+from business_logic.rule_pipeline import RULE_BASE_MODEL, rule_pipeline_exclude
+
+SENT_MODEL_DIR = Path("models/textcat-mini")
+FRAMES_MODEL_DIR = Path("models/frames-mini")
+
+
+class LexemeNormComponent:
+    """
+    Setzt token.norm nach der Tabelle lexeme_norm eines anderen Modells.
+    textcat-mini/frames-mini wurden ohne diese Tabelle trainiert (NORM =
+    Kleinschreibung), tok2vec/tagger aus en_core_web_sm mit ihr. Die Komponente
+    läuft nach den ML-Textkategorisierern und vor den übernommenen
+    en_core_web_sm-Komponenten, damit beide dieselben Merkmale sehen wie im
+    eigenen Modell.
+    """
+
+    def __init__(self, nlp, name):
+        self.name = name
+        self.table = Table(name="lexeme_norm")
+
+    def set_table(self, table):
+        self.table = Table.from_dict(dict(table.items()), name="lexeme_norm")
+
+    def __call__(self, doc: Doc):
+        table = self.table
+        if not table:
+            return doc
+        for token in doc:
+            # Normen aus Tokenizer-Ausnahmen ("n't" -> "not") haben Vorrang, wie im Vokabular
+            if token.norm == token.lex.norm:
+                norm = table.get(token.orth)
+                if norm is not None:
+                    token.norm_ = norm
+        return doc
+
+    def to_disk(self, path, exclude=tuple()):
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        self.table.to_disk(path / "lexeme_norm.bin")
+
+    def from_disk(self, path, exclude=tuple()):
+        self.table = Table(name="lexeme_norm").from_disk(Path(path) / "lexeme_norm.bin")
+        return self
+
+
+@Language.factory("lexeme_norms")
+def create_lexeme_norms(nlp, name):
+    return LexemeNormComponent(nlp, name)
+
+
+def create_ml_pipeline(sent_model_dir=SENT_MODEL_DIR, frames_model_dir=FRAMES_MODEL_DIR):
+    """
+    textcat aus textcat-mini und framecat aus frames-mini in einer Pipeline
+    (ohne Regeln). Im UI trainierte Modelle werden über ihren Zeiger
+    <modell>.current aufgelöst, auch ausserhalb der Registry (Skripte).
+    """
+    nlp = spacy.load(resolve_model_dir(sent_model_dir))
+    nlp.add_pipe("framecat", source=spacy.load(resolve_model_dir(frames_model_dir)))
+    return nlp
+
+
+def create_composed_pipeline(sent_model_dir=SENT_MODEL_DIR, frames_model_dir=FRAMES_MODEL_DIR,
+                             rule_model=RULE_BASE_MODEL, use_array=None):
+    """
+    Eine Pipeline, ein Tokenizer-Durchlauf: textcat aus textcat-mini,
+    framecat aus frames-mini, tok2vec/tagger/attribute_ruler/lemmatizer aus
+    dem Basismodell und die Regel-Komponenten. Tokenizer und Vokabular
+    stammen aus textcat-mini, damit die ML-Vorhersagen unverändert bleiben.
+    Ergebnis: doc.cats enthält die Sentiment- und Frame-Wahrscheinlichkeiten,
+    doc._.frames / doc._.sentiment_rule die Regel-Ergebnisse.
+    use_array=None übernimmt den Standard der jeweiligen Regel-Komponente.
+    """
+    nlp = create_ml_pipeline(sent_model_dir, frames_model_dir)
+
+    rules_nlp = spacy.load(rule_model, exclude=rule_pipeline_exclude(framing=True))
+    norms = nlp.add_pipe("lexeme_norms")
+    if rules_nlp.vocab.lookups.has_table("lexeme_norm"):
+        norms.set_table(rules_nlp.vocab.lookups.get_table("lexeme_norm"))
+    for name in rules_nlp.pipe_names:
+        nlp.add_pipe(name, source=rules_nlp)
+
+    config = {} if use_array is None else {"use_array": use_array}
+    nlp.add_pipe("framing_component", config=config)
+    nlp.add_pipe("sentiment_rule", config=config)
+    return nlp
@@ -0,0 +1,101 @@
+# Business Logic - Cache für tokenisierte Trainings-/Dev-Daten (DocBin)
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+import spacy
+from spacy.tokens import DocBin
+
+CACHE_DIR = os.path.join("data", ".cache")
+
+
+class CacheInfo(NamedTuple):
+    """Ergebnis eines Cache-Zugriffs (für die Anzeige der gesparten Zeit)"""
+    hit: bool
+    path: str
+    seconds: float          # Laufzeit dieses Aufrufs (Laden bzw. Tokenisieren + Speichern)
+    tokenize_seconds: float  # Dauer der Tokenisierung beim Erstellen des Caches
+    saved_seconds: float     # bei einem Treffer: tokenize_seconds - seconds
+
+
+def tokenizer_fingerprint(nlp):
+    """Hash der Tokenizer-Konfiguration (Regeln, Ausnahmen), Sprache und spaCy-Version"""
+    sha = hashlib.sha1()
+    sha.update(f"{nlp.lang}|{spacy.__version__}".encode('utf-8'))
+    sha.update(nlp.tokenizer.to_bytes(exclude=["vocab"]))
+    return sha.hexdigest()
+
+
+def cache_key(nlp, source_path):
+    """Schlüssel aus dem Inhalt der Quelldatei und der Tokenizer-Konfiguration"""
+    sha = hashlib.sha1()
+    with open(source_path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            sha.update(block)
+    sha.update(tokenizer_fingerprint(nlp).encode('utf-8'))
+    return sha.hexdigest()[:16]
+
+
+def read_jsonl_records(path):
+    """Liest data/*.jsonl als Liste von Dictionaries mit 'text' und 'cats'"""
+    lines = Path(path).read_text(encoding='utf-8').splitlines()
+    return [json.loads(line) for line in lines if line.strip()]
+
+
+def cached_docs(nlp, source_path, cache_dir=CACHE_DIR):
+    """
+    Gibt die Texte aus source_path als tokenisierte Docs mit doc.cats zurück.
+    Beim ersten Aufruf wird tokenisiert und als <name>-<schlüssel>.spacy
+    gespeichert, danach nur noch der DocBin gelesen. Ändert sich die Datei
+    oder der Tokenizer, ändert sich der Schlüssel und es wird neu tokenisiert;
+    veraltete Cache-Dateien derselben Quelle werden gelöscht.
+    Gibt (docs, CacheInfo) zurück.
+    """
+    start = time.perf_counter()
+    cache_dir = Path(cache_dir)
+    stem = Path(source_path).stem
+    key = cache_key(nlp, source_path)
+    cache_path = cache_dir / f"{stem}-{key}.spacy"
+    meta_path = cache_path.with_suffix(".json")
+
+    if cache_path.exists() and meta_path.exists():
+        docs = list(DocBin().from_disk(cache_path).get_docs(nlp.vocab))
+        seconds = time.perf_counter() - start
+        tokenize_seconds = json.loads(meta_path.read_text(encoding='utf-8'))['tokenize_seconds']
+        return docs, CacheInfo(True, str(cache_path), seconds, tokenize_seconds, tokenize_seconds - seconds)
+
+    docs = []
+    for record in read_jsonl_records(source_path):
+        doc = nlp.make_doc(record['text'])
+        doc.cats = record['cats']
+        docs.append(doc)
+    tokenize_seconds = time.perf_counter() - start
+
+    # Atomar schreiben: erst eine temporäre Datei, dann umbenennen
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for old_path in cache_dir.glob(f"{stem}-*.*"):
+        old_stem, _, old_key = old_path.stem.rpartition("-")
+        if old_path.suffix in (".spacy", ".json") and old_stem == stem and old_key != key:
+            old_path.unlink(missing_ok=True)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    DocBin(docs=docs).to_disk(tmp_path)
+    os.replace(tmp_path, cache_path)
+    meta_path.write_text(json.dumps({'source': str(source_path), 'tokenize_seconds': tokenize_seconds,
+                                     'docs': len(docs)}), encoding='utf-8')
+
+    seconds = time.perf_counter() - start
+    return docs, CacheInfo(False, str(cache_path), seconds, tokenize_seconds, 0.0)
+
+
+def cache_summary(infos):
+    """Kurzer Hinweis zur Tokenisierung einer oder mehrerer Dateien (für die UI)"""
+    for info in infos:
+        print(f"DocBin-Cache {'Treffer' if info.hit else 'neu erstellt'}: {info.path} ({info.seconds:.2f}s)")
+    if all(info.hit for info in infos):
+        saved = sum(info.saved_seconds for info in infos)
+        return f"Tokenisierte Daten aus dem Cache geladen: {saved:.2f}s gespart."
+    tokenize_seconds = sum(info.tokenize_seconds for info in infos if not info.hit)
+    return f"Daten tokenisiert ({tokenize_seconds:.2f}s) und im Cache gespeichert ({Path(infos[0].path).parent})."
@@ -0,0 +1,86 @@
+# Business Logic - Evaluation der Textkategorisierer auf einem vortokenisierten Dev-Set
+import time
+
+import numpy as np
+from sklearn.metrics import accuracy_score, classification_report, f1_score
+from spacy.util import minibatch
+
+EVAL_BATCH_SIZE = 256
+
+
+class DevSet:
+    """
+    Dev-Daten, einmal tokenisiert: die Docs (nlp.make_doc) und die
+    Gold-Matrix y_true (Dokumente x Labels, 0/1) werden nur beim Erstellen
+    berechnet und in jeder Epoche wiederverwendet.
+    """
+
+    def __init__(self, docs, gold_cats, labels):
+        self.docs = docs
+        self.labels = list(labels)
+        self.y_true = np.array(
+            [[int(round(cats.get(label, 0.0))) for label in self.labels] for cats in gold_cats], dtype=int
+        ).reshape(len(docs), len(self.labels))
+
+    def __len__(self):
+        return len(self.docs)
+
+
+def predict_scores(nlp, docs, component, batch_size=EVAL_BATCH_SIZE):
+    """
+    Wahrscheinlichkeiten der Komponente für alle Docs (Docs x Labels in der
+    Reihenfolge von component.labels). Vorherige Komponenten laufen über
+    pipe(), die Textkategorisierung direkt über predict() ohne doc.cats zu setzen.
+    """
+    textcat = nlp.get_pipe(component)
+    before = []
+    for name, proc in nlp.pipeline:
+        if name == component:
+            break
+        before.append(proc)
+
+    scores = []
+    for batch in minibatch(docs, size=batch_size):
+        for proc in before:
+            batch = list(proc.pipe(batch))
+        scores.append(textcat.model.ops.to_numpy(textcat.predict(batch)))
+    if not scores:
+        return np.zeros((0, len(textcat.labels)))
+    return np.concatenate(scores)
+
+
+def evaluate_textcat(nlp, dev_set, component="textcat", multilabel=False, threshold=0.5,
+                     batch_size=EVAL_BATCH_SIZE):
+    """
+    Bewertet textcat (eine Klasse pro Text, argmax) oder textcat_multilabel
+    (jedes Label mit Schwellwert) auf dem Dev-Set.
+    Gibt accuracy, f1_macro, den sklearn-Report (Dictionary) und den
+    Durchsatz der Evaluation (docs_per_second) zurück.
+    """
+    start = time.perf_counter()
+    scores = predict_scores(nlp, dev_set.docs, component, batch_size)
+
+    # Spalten auf die Label-Reihenfolge des Dev-Sets bringen
+    component_labels = list(nlp.get_pipe(component).labels)
+    scores = scores[:, [component_labels.index(label) for label in dev_set.labels]]
+    seconds = time.perf_counter() - start
+
+    if multilabel:
+        y_true = dev_set.y_true
+        y_pred = (scores >= threshold).astype(int)
+        report_args = {}
+    else:
+        y_true = dev_set.y_true.argmax(axis=1)
+        y_pred = scores.argmax(axis=1)
+        report_args = {'labels': list(range(len(dev_set.labels)))}
+
+    return {
+        'accuracy': accuracy_score(y_true, y_pred),
+        'f1_macro': f1_score(y_true, y_pred, average='macro', zero_division=0, **report_args),
+        'report': classification_report(y_true, y_pred, target_names=dev_set.labels, zero_division=0,
+                                        output_dict=True, **report_args),
+        'y_true': y_true,
+        'y_pred': y_pred,
+        'seconds': seconds,
+        'docs_per_second': len(dev_set) / seconds if seconds else 0.0,
+    }
@@ -0,0 +1,213 @@
+# Business Logic - Prozessweite Registry für geladene spaCy-Pipelines
+import hashlib
+import os
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import NamedTuple
+
+import spacy
+
+
+class ModelEntry(NamedTuple):
+    """Eine geladene Pipeline mit Version (Hash von meta.json und Gewichten)"""
+    name: str
+    paths: tuple
+    version: str
+    nlp: object
+    load_seconds: float
+    loaded_at: float
+
+
+# Trainierte Modelle werden versioniert gespeichert: <modell>.versions/<version>/,
+# die Datei <modell>.current enthält den Namen der aktuellen Version
+VERSIONS_SUFFIX = ".versions"
+POINTER_SUFFIX = ".current"
+KEEP_VERSIONS = 3
+
+
+def resolve_model_dir(model_dir):
+    """Verzeichnis der aktuellen Version (über <modell>.current), sonst model_dir selbst"""
+    model_dir = Path(model_dir)
+    pointer = model_dir.with_name(model_dir.name + POINTER_SUFFIX)
+    try:
+        version = pointer.read_text(encoding='utf-8').strip()
+    except FileNotFoundError:
+        return model_dir
+    return model_dir.with_name(model_dir.name + VERSIONS_SUFFIX) / version
+
+
+def save_model_version(nlp, model_dir, keep=KEEP_VERSIONS):
+    """
+    Speichert nlp atomar als neue Version von model_dir: erst in ein
+    temporäres Verzeichnis, dann umbenennen und den Zeiger <modell>.current
+    ersetzen (os.replace). Leser sehen immer eine vollständige Version.
+    Ältere Versionen über keep hinaus werden gelöscht. Gibt das Verzeichnis zurück.
+    """
+    model_dir = Path(model_dir)
+    versions_dir = model_dir.with_name(model_dir.name + VERSIONS_SUFFIX)
+    versions_dir.mkdir(parents=True, exist_ok=True)
+    # Nanosekunden mit fester Breite: die Namen sortieren nach Speicherzeitpunkt
+    version = f"{time.time_ns():020d}-{uuid.uuid4().hex[:6]}"
+
+    tmp_dir = versions_dir / f".tmp-{version}"
+    nlp.to_disk(tmp_dir)
+    os.rename(tmp_dir, versions_dir / version)
+
+    pointer = model_dir.with_name(model_dir.name + POINTER_SUFFIX)
+    tmp_pointer = pointer.with_name(pointer.name + f".tmp-{version}")
+    tmp_pointer.write_text(version, encoding='utf-8')
+    os.replace(tmp_pointer, pointer)
+
+    # Die Version, auf die der Zeiger gerade zeigt (ggf. von einem anderen Prozess), bleibt immer erhalten
+    current = resolve_model_dir(model_dir)
+    versions = sorted(path for path in versions_dir.iterdir() if path.is_dir() and not path.name.startswith("."))
+    for old_dir in versions[:-keep]:
+        if old_dir != current:
+            shutil.rmtree(old_dir, ignore_errors=True)
+    return versions_dir / version
+
+
+def model_exists(model_dir):
+    """True, wenn unter model_dir (bzw. seiner aktuellen Version) ein gespeichertes Modell liegt"""
+    return (resolve_model_dir(model_dir) / "meta.json").exists()
+
+
+def model_source_paths(model_dir):
+    """Dateien, die eine gespeicherte Pipeline ausmachen: meta.json und die Gewichte (<komponente>/model)"""
+    model_dir = Path(model_dir)
+    return [model_dir / "meta.json"] + sorted(model_dir.glob("*/model"))
+
+
+class ModelRegistry:
+    """
+    Lädt jede Pipeline nur einmal pro Prozess und gibt allen Sessions dieselbe
+    Instanz zurück. Einträge sind nach Modellverzeichnis und Version
+    (SHA-1 über meta.json und Gewichte) abgelegt: schreibt das Training ein
+    neues Modell, ändern sich mtime/Grösse und Inhalt, der alte Eintrag wird
+    verworfen und beim nächsten get() neu geladen (wie beim LexiconStore).
+    Versionierte Modelle (save_model_version) werden über ihren Zeiger
+    <modell>.current aufgelöst.
+    """
+
+    def __init__(self, check_interval=1.0):
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._entries = {}       # name -> ModelEntry
+        self._file_stats = {}    # name -> (mtime, Grösse) der Modelldateien
+        self._last_check = {}    # name -> Zeitpunkt der letzten Prüfung
+        self._hits = {}          # name -> Anzahl get()-Aufrufe
+
+    def get(self, model_dir, loader=spacy.load, name=None):
+        """
+        Gibt die Pipeline aus model_dir zurück und lädt sie bei Bedarf (neu).
+        model_dir kann auch ein Tupel von Verzeichnissen sein (zusammengesetzte
+        Pipeline), loader(*verzeichnisse) erstellt die Pipeline; name
+        unterscheidet mehrere Pipelines aus denselben Verzeichnissen
+        (Standard: die Verzeichnisse selbst).
+        """
+        model_dirs = model_dir if isinstance(model_dir, (list, tuple)) else (model_dir,)
+        paths = tuple(os.path.abspath(path) for path in model_dirs)
+        name = name or " + ".join(paths)
+        # Versionierte Modelle: der Zeiger <modell>.current bestimmt das geladene Verzeichnis
+        resolved = tuple(str(resolve_model_dir(path)) for path in paths)
+        self._hits[name] = self._hits.get(name, 0) + 1
+
+        entry = self._entries.get(name)
+        now = time.monotonic()
+        if entry is not None and now - self._last_check.get(name, 0.0) < self.check_interval:
+            return entry.nlp
+
+        file_stats = self._stat_files(resolved)
+        if entry is not None and file_stats == self._file_stats.get(name):
+            self._last_check[name] = now
+            return entry.nlp
+
+        with self._lock:
+            # Ein anderer Thread kann inzwischen neu geladen haben
+            entry = self._entries.get(name)
+            if entry is not None and file_stats == self._file_stats.get(name):
+                self._last_check[name] = now
+                return entry.nlp
+
+            version = self._version(resolved)
+            if entry is None or entry.version != version:
+                start = time.perf_counter()
+                try:
+                    nlp = loader(*resolved)
+                except (OSError, ValueError, KeyError) as e:
+                    # Modell wird gerade geschrieben: alten Stand behalten und später erneut prüfen
+                    if entry is None:
+                        raise
+                    print(f"Modell {name} konnte nicht neu geladen werden: {e}")
+                    # Nächster Versuch erst nach check_interval (wie beim LexiconStore)
+                    self._last_check[name] = now
+                    return entry.nlp
+                entry = ModelEntry(name, paths, version, nlp, time.perf_counter() - start, time.time())
+                self._entries[name] = entry
+                print(f"Modell geladen: {name} (Version {version}, {entry.load_seconds:.2f}s)")
+            self._file_stats[name] = file_stats
+            self._last_check[name] = now
+            return entry.nlp
+
+    def invalidate(self, model_dir):
+        """Verwirft alle Einträge, die model_dir verwenden (z.B. direkt nach dem Speichern eines neuen Modells)"""
+        path = os.path.abspath(model_dir)
+        with self._lock:
+            for name in [name for name, entry in self._entries.items() if path in entry.paths]:
+                del self._entries[name]
+                self._file_stats.pop(name, None)
+                self._last_check.pop(name, None)
+
+    def stats(self):
+        """Übersicht der geladenen Pipelines (für die Anzeige in der UI)"""
+        return [
+            {
+                'name': entry.name,
+                'version': entry.version,
+                'pipe_names': ", ".join(entry.nlp.pipe_names),
+                'load_seconds': round(entry.load_seconds, 3),
+                'loaded_at': time.strftime("%H:%M:%S", time.localtime(entry.loaded_at)),
+                'hits': self._hits.get(entry.name, 0),
+            }
+            for entry in self._entries.values()
+        ]
+
+    @staticmethod
+    def _stat_files(paths):
+        """Liest mtime und Grösse der Modelldateien"""
+        stats = []
+        for path in paths:
+            for file_path in model_source_paths(path):
+                try:
+                    st = os.stat(file_path)
+                    stats.append((str(file_path), st.st_mtime_ns, st.st_size))
+                except FileNotFoundError:
+                    stats.append((str(file_path), None))
+        return tuple(stats)
+
+    @staticmethod
+    def _version(paths):
+        """Kurze Versionskennung: SHA-1 über meta.json und alle Gewichte"""
+        sha = hashlib.sha1()
+        for path in paths:
+            for file_path in model_source_paths(path):
+                sha.update(str(file_path.relative_to(path)).encode('utf-8'))
+                try:
+                    with open(file_path, 'rb') as file:
+                        for block in iter(lambda: file.read(1 << 20), b''):
+                            sha.update(block)
+                except FileNotFoundError:
+                    sha.update(b'-')
+        return sha.hexdigest()[:12]
+
+
+# Eine Registry pro Prozess (von allen Streamlit-Sessions geteilt)
+MODEL_REGISTRY = ModelRegistry()
+
+
+def get_model(model_dir, loader=spacy.load, name=None):
+    """Kurzform für MODEL_REGISTRY.get()"""
+    return MODEL_REGISTRY.get(model_dir, loader, name)
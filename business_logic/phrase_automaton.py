@@ -0,0 +1,93 @@
+# Business Logic - Aho-Corasick Automat für Mehrwort-Ausdrücke und Modifikatoren
+from collections import deque
+from typing import NamedTuple
+
+
+class PhraseEntry(NamedTuple):
+    """Eintrag im Automaten: Wortart bzw. Modifikator-Typ, Anzeigename und Wert"""
+    kind: str   # "adjective", "verb", "negator" oder "intensifier"
+    key: str    # z.B. "fall apart" oder "not"
+    value: float  # Score (0-100) bzw. Verstärkungsfaktor
+
+
+class PhraseAutomaton:
+    """
+    Aho-Corasick Automat über Token-Folgen (Lemmas statt Zeichen).
+    Alle Muster werden in einem einzigen linearen Durchlauf über den
+    Token-Strom gefunden; die Kosten pro Token hängen nicht von der Anzahl
+    der Muster ab.
+    """
+
+    def __init__(self, patterns):
+        # patterns: Iterable aus (Lemma-Tupel, PhraseEntry)
+        self._goto = [{}]
+        self._fail = [0]
+        self._outputs = [()]
+        # (Art, Schlüssel) -> PhraseEntry, z.B. um Scores ohne neuen Textdurchlauf nachzuschlagen
+        self.entries = {}
+
+        for symbols, entry in patterns:
+            if not symbols:
+                continue
+            state = 0
+            for symbol in symbols:
+                next_state = self._goto[state].get(symbol)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][symbol] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._outputs.append(())
+                state = next_state
+            # Bei doppelten Mustern gewinnt der letzte Eintrag
+            self._outputs[state] = ((len(symbols), entry),)
+            self.entries[(entry.kind, entry.key)] = entry
+
+        self._build_failure_links()
+        self.size = len(self._goto)
+
+    def _build_failure_links(self):
+        """Breitensuche: Fehlerverweise setzen und Ausgaben entlang der Verweise vererben"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for symbol, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and symbol not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(symbol, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+
+    def find_matches(self, symbols):
+        """
+        Findet alle Muster in der Symbolfolge und wählt daraus die
+        nicht überlappenden Treffer (links zuerst, bei gleichem Start der
+        längste). Gibt ein Dictionary start_index -> (end_index, entry) zurück.
+        """
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+
+        found = []
+        state = 0
+        for index, symbol in enumerate(symbols):
+            while state and symbol not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(symbol, 0)
+            if not state:
+                continue
+            for length, entry in outputs[state]:
+                found.append((index + 1 - length, index + 1, entry))
+
+        matches = {}
+        if not found:
+            return matches
+        found.sort(key=lambda match: (match[0], match[0] - match[1]))
+        covered_until = 0
+        for start, end, entry in found:
+            if start >= covered_until:
+                matches[start] = (end, entry)
+                covered_until = end
+        return matches
@@ -0,0 +1,53 @@
+# Business Logic - Schlanke spaCy-Pipeline für die Regel-Komponenten
+from pathlib import Path
+
+import spacy
+
+# Registriert die @Language.factory-Komponenten framing_component und sentiment_rule
+from business_logic.components import create_framing_component, create_sentiment_rule  # noqa: F401
+
+RULE_BASE_MODEL = "en_core_web_sm"
+
+# Komponenten, die der Lemmatizer von en_core_web_sm braucht: er arbeitet regelbasiert
+# mit den POS-Tags (tagger -> attribute_ruler), der tagger hört auf tok2vec.
+LEMMA_COMPONENTS = ("tok2vec", "tagger", "attribute_ruler", "lemmatizer")
+
+# Werden von keiner Regel gelesen und gar nicht erst geladen
+RULE_EXCLUDE = ("parser", "ner", "senter")
+
+
+def rule_pipeline_exclude(framing=True):
+    """
+    Komponenten, die für die Regeln nicht geladen werden müssen:
+    framing_component vergleicht token.lemma (braucht den Lemmatizer),
+    sentiment_rule nur token.lower (Tokenizer genügt).
+    """
+    if framing:
+        return list(RULE_EXCLUDE)
+    return list(RULE_EXCLUDE + LEMMA_COMPONENTS)
+
+
+def create_rule_pipeline(model=RULE_BASE_MODEL, framing=True, sentiment=True, use_array=None):
+    """
+    Lädt das Basismodell ohne die nicht benötigten Komponenten (exclude statt
+    disable: sie werden weder geladen noch im Speicher gehalten) und hängt
+    die Regel-Komponenten an. use_array=None übernimmt den Standard der
+    jeweiligen Komponente. Wirft OSError, wenn das Modell fehlt.
+    """
+    nlp = spacy.load(model, exclude=rule_pipeline_exclude(framing))
+    config = {} if use_array is None else {"use_array": use_array}
+    if framing:
+        nlp.add_pipe("framing_component", last=True, config=config)
+    if sentiment:
+        nlp.add_pipe("sentiment_rule", last=True, config=config)
+    return nlp
+
+
+def rule_model_path(model=RULE_BASE_MODEL):
+    """Datenverzeichnis des Basismodells (installiertes Paket oder Pfad), z.B. für die Model-Registry"""
+    if spacy.util.is_package(model):
+        package_path = spacy.util.get_package_path(model)
+        for meta_path in package_path.glob(f"{model}-*/meta.json"):
+            return meta_path.parent
+        return package_path
+    return Path(model)
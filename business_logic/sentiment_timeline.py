@@ -0,0 +1,99 @@
+# Business Logic - Stimmungsverlauf über die Textposition (Präfixsummen)
+import re
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+
+KINDS = ("adjective", "verb")
+
+# Satzende: Satzzeichen (ggf. mit Anführungszeichen/Klammer) gefolgt von Leerraum, oder Leerzeile
+SENTENCE_END = re.compile(r"[.!?]+[\"'’”)\]]*\s+|\n\s*\n")
+
+
+def split_sentences(text):
+    """Gibt die (start, ende)-Bereiche der Sätze eines Textes zurück"""
+    sentences = []
+    position = 0
+    for match in SENTENCE_END.finditer(text):
+        if text[position:match.start()].strip():
+            sentences.append((position, match.start() + len(match.group().rstrip())))
+        position = match.end()
+    if text[position:].strip():
+        sentences.append((position, len(text.rstrip())))
+    return sentences
+
+
+class SentimentTimeline:
+    """
+    Scores und Anzahl Treffer pro Token, getrennt nach Wortart, plus
+    Präfixsummen darüber. Damit lässt sich jeder Bereich (Satz, Absatz,
+    gleitendes Fenster) in O(1) bewerten, ohne den Text neu zu analysieren.
+    Ein Treffer zählt für das Token, an dem seine Fundstelle beginnt.
+    """
+
+    def __init__(self, token_starts, items):
+        # token_starts: Start-Offsets aller Tokens (aufsteigend)
+        # items: (wortart, score, start-offset), nach Offset sortiert
+        self.token_starts = array('l', token_starts)
+        n = len(self.token_starts)
+        self.scores = {kind: array('l', [0]) * n for kind in KINDS}
+        self.counts = {kind: array('l', [0]) * n for kind in KINDS}
+
+        # Beide Folgen sind sortiert: ein gemeinsamer Durchlauf genügt
+        index = 0
+        for kind, score, start in items:
+            while index + 1 < n and self.token_starts[index + 1] <= start:
+                index += 1
+            if n:
+                self.scores[kind][index] += score
+                self.counts[kind][index] += 1
+
+        # Präfixsummen pro Wortart und kombiniert (Schlüssel None)
+        self._score_sums = {kind: array('q', accumulate(self.scores[kind], initial=0)) for kind in KINDS}
+        self._count_sums = {kind: array('q', accumulate(self.counts[kind], initial=0)) for kind in KINDS}
+        self._score_sums[None] = array('q', map(sum, zip(*(self._score_sums[kind] for kind in KINDS))))
+        self._count_sums[None] = array('q', map(sum, zip(*(self._count_sums[kind] for kind in KINDS))))
+
+    def __len__(self):
+        return len(self.token_starts)
+
+    def token_index(self, offset):
+        """Index des ersten Tokens, das bei oder nach dem Zeichen-Offset beginnt"""
+        return bisect_left(self.token_starts, offset)
+
+    def window(self, start, end, kind=None):
+        """Summe der Scores und Anzahl Treffer der Tokens [start, end) in O(1)"""
+        start = max(0, start)
+        end = min(len(self), end)
+        if end <= start:
+            return 0, 0
+        score_sums = self._score_sums[kind]
+        count_sums = self._count_sums[kind]
+        return score_sums[end] - score_sums[start], count_sums[end] - count_sums[start]
+
+    def average(self, start, end, kind=None):
+        """Durchschnittsscore der Tokens [start, end), None ohne Treffer"""
+        total, count = self.window(start, end, kind)
+        return total / count if count else None
+
+    def span_average(self, char_start, char_end, kind=None):
+        """Durchschnittsscore eines Zeichenbereichs (z.B. Satz oder Absatz)"""
+        return self.average(self.token_index(char_start), self.token_index(char_end), kind)
+
+    def sliding_averages(self, size, step=1, kind=None):
+        """Gleitendes Fenster über size Tokens: Liste von (Token-Position, Durchschnitt)"""
+        n = len(self)
+        if n == 0:
+            return []
+        size = max(1, min(size, n))
+        score_sums = self._score_sums[kind]
+        count_sums = self._count_sums[kind]
+        averages = []
+        for start in range(0, n - size + 1, max(1, step)):
+            count = count_sums[start + size] - count_sums[start]
+            averages.append((start, (score_sums[start + size] - score_sums[start]) / count if count else None))
+        return averages
+
+    def span_averages(self, spans, kind=None):
+        """Durchschnitt pro Zeichenbereich: Liste von (start, ende, Durchschnitt)"""
+        return [(start, end, self.span_average(start, end, kind)) for start, end in spans]
@@ -0,0 +1,191 @@
+# Business Logic - Tabellengesteuerte Suffix-Regeln (Rückwärts-Trie)
+import json
+import os
+from typing import NamedTuple
+
+SUFFIX_RULES_DIR = os.path.join("data", "suffix_rules")
+DEFAULT_LANGUAGE = "en"
+
+
+class SuffixBranch(NamedTuple):
+    """Bedingte Umschreibung des Stamms (z.B. verdoppelter Konsonant, stummes -e)"""
+    double: frozenset          # letzter Buchstabe verdoppelt und in dieser Klasse
+    stem_ends: str             # Stamm endet auf diesen String
+    last_in: frozenset         # letzter Buchstabe des Stamms in dieser Menge
+    second_last_in: frozenset  # vorletzter Buchstabe des Stamms in dieser Menge
+    drop: int                  # so viele Zeichen vom Stamm entfernen
+    append: str                # ... und diesen String anhängen
+    keep: bool                 # Wort unverändert zurückgeben
+
+
+class SuffixRule(NamedTuple):
+    """Eine Regel: Suffix, Wächter (Mindestlängen) und Aktionen"""
+    priority: int
+    suffix: str
+    strip: int       # Anzahl Zeichen, die vom Wort entfernt werden (Standard: ganzes Suffix)
+    min_length: int  # Mindestlänge des Wortes
+    min_stem: int    # kürzere Stämme -> Wort unverändert
+    append: str
+    keep: bool
+    branches: tuple
+
+
+class SuffixRuleSet:
+    """
+    Kompiliert Suffix-Regeln (siehe data/suffix_rules/*.json) in einen
+    Rückwärts-Trie über die Buchstaben der Suffixe. Ein Wort wird in einem
+    einzigen Rückwärtsdurchlauf über seine letzten Buchstaben aufgelöst:
+    von allen passenden Suffixen gewinnt die Regel mit der kleinsten
+    Priorität (Reihenfolge in der Datei), deren Wächter erfüllt ist.
+    """
+
+    def __init__(self, spec):
+        self.language = spec.get('language', DEFAULT_LANGUAGE)
+        self.classes = {name: frozenset(chars) for name, chars in spec.get('classes', {}).items()}
+
+        self.rules = tuple(self._compile_rule(priority, rule) for priority, rule in enumerate(spec['rules']))
+
+        # Knoten: (Kinder-Dictionary, Regeln mit genau diesem Suffix)
+        self._root = ({}, [])
+        for rule in self.rules:
+            node = self._root
+            for char in reversed(rule.suffix):
+                node = node[0].setdefault(char, ({}, []))
+            node[1].append(rule)
+
+    def _chars(self, value):
+        """Zeichenmenge: "@name" verweist auf eine Klasse, sonst die Zeichen selbst"""
+        if not value:
+            return frozenset()
+        if value.startswith('@'):
+            return self.classes[value[1:]]
+        return frozenset(value)
+
+    def _compile_rule(self, priority, rule):
+        suffix = rule['suffix']
+        branches = tuple(
+            SuffixBranch(
+                double=self._chars(branch.get('double')),
+                stem_ends=branch.get('stem_ends', ''),
+                last_in=self._chars(branch.get('last_in')),
+                second_last_in=self._chars(branch.get('second_last_in')),
+                drop=branch.get('drop', 0),
+                append=branch.get('append', ''),
+                keep=branch.get('keep', False),
+            )
+            for branch in rule.get('branches', ())
+        )
+        return SuffixRule(
+            priority=priority,
+            suffix=suffix,
+            strip=rule.get('strip', len(suffix)),
+            min_length=rule.get('min_length', 0),
+            min_stem=rule.get('min_stem', 0),
+            append=rule.get('append', ''),
+            keep=rule.get('keep', False),
+            branches=branches,
+        )
+
+    def find_rule(self, word):
+        """Rückwärtsdurchlauf durch den Trie: Regel mit kleinster Priorität oder None"""
+        length = len(word)
+        node = self._root
+        best = None
+        for char in reversed(word):
+            node = node[0].get(char)
+            if node is None:
+                break
+            for rule in node[1]:
+                if length >= rule.min_length and (best is None or rule.priority < best.priority):
+                    best = rule
+        return best
+
+    def apply(self, word):
+        """Gibt die Grundform nach den Suffix-Regeln zurück (oder das Wort selbst)"""
+        rule = self.find_rule(word)
+        if rule is None or rule.keep:
+            return word
+
+        stem = word[:len(word) - rule.strip]
+        for branch in rule.branches:
+            if self._matches(branch, stem):
+                if branch.keep:
+                    return word
+                return stem[:len(stem) - branch.drop] + branch.append
+
+        if len(stem) < rule.min_stem:
+            return word
+        return stem + rule.append
+
+    @staticmethod
+    def _matches(branch, stem):
+        if len(stem) < 2:
+            return False
+        last = stem[-1]
+        if branch.double and not (last == stem[-2] and last in branch.double):
+            return False
+        if branch.stem_ends and not stem.endswith(branch.stem_ends):
+            return False
+        if branch.last_in and last not in branch.last_in:
+            return False
+        if branch.second_last_in and stem[-2] not in branch.second_last_in:
+            return False
+        return True
+
+    def candidate_forms(self, lemma):
+        """
+        Erzeugt Wortformen, aus denen apply() das Lemma zurückgewinnen kann
+        (Umkehrung der Regeln). Die Menge kann Formen enthalten, die eine
+        Regel mit höherer Priorität anders auflöst; build_lemma_table()
+        prüft deshalb jede Form mit apply().
+        """
+        forms = set()
+        if not lemma:
+            return forms
+        for rule in self.rules:
+            if rule.keep:
+                continue
+            kept = rule.suffix[:len(rule.suffix) - rule.strip]
+            tail = rule.suffix[len(rule.suffix) - rule.strip:]
+            outcomes = [(branch, branch.drop, branch.append) for branch in rule.branches if not branch.keep]
+            outcomes.append((None, 0, rule.append))
+
+            for branch, drop, append in outcomes:
+                if not lemma.endswith(append):
+                    continue
+                base = lemma[:len(lemma) - len(append)]
+                if branch is not None and branch.double:
+                    if not base:
+                        continue
+                    dropped = base[-1] * drop
+                elif branch is not None and branch.stem_ends:
+                    dropped = branch.stem_ends[len(branch.stem_ends) - drop:] if drop else ''
+                elif drop:
+                    # Entfernte Zeichen unbekannt, Form nicht rekonstruierbar
+                    continue
+                else:
+                    dropped = ''
+                stem = base + dropped
+                if stem.endswith(kept):
+                    forms.add(stem + tail)
+        return forms
+
+
+_loaded_rule_sets = {}
+
+
+def load_suffix_rules(language=DEFAULT_LANGUAGE, rules_dir=SUFFIX_RULES_DIR):
+    """Lädt und kompiliert data/suffix_rules/<language>.json (einmal pro Prozess)"""
+    path = suffix_rules_path(language, rules_dir)
+    key = (os.path.abspath(path), os.path.getmtime(path))
+    rule_set = _loaded_rule_sets.get(key)
+    if rule_set is None:
+        with open(path, 'r', encoding='utf-8') as file:
+            rule_set = SuffixRuleSet(json.load(file))
+        _loaded_rule_sets[key] = rule_set
+    return rule_set
+
+
+def suffix_rules_path(language=DEFAULT_LANGUAGE, rules_dir=SUFFIX_RULES_DIR):
+    """Pfad der Regeldatei einer Sprache"""
+    return os.path.join(rules_dir, f"{language}.json")
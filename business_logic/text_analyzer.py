@@ -1,130 +1,543 @@
 # Business Logic - Textanalyse
 import csv
+import functools
+import hashlib
+import json
 import os
-
-
-class TextAnalyzer:
-    def __init__(self):
-        self.adjectives = {}
-        self.verbs = {}
-        self.irregular_verbs = {}
-        self.irregular_adjectives = {}
-        self.stopwords = set()
-
-        # Lade alle CSV-Dateien
-        self.load_stopwords()
-        self.load_irregular_verbs()
-        self.load_irregular_adjectives()
-        self.load_adjectives()
-        self.load_verbs()
-
-        # Initialisiere Suffix-Regeln
-        self._initialize_suffix_rules()
-
-    def load_stopwords(self):
-        """Lädt Stopwords aus CSV oder verwendet Default"""
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from types import MappingProxyType
+from typing import NamedTuple
+
+from business_logic.phrase_automaton import PhraseAutomaton, PhraseEntry
+from business_logic.sentiment_timeline import SentimentTimeline
+from business_logic.suffix_rules import (
+    DEFAULT_LANGUAGE,
+    SUFFIX_RULES_DIR,
+    SuffixRuleSet,
+    load_suffix_rules,
+    suffix_rules_path,
+)
+
+
+CSV_DIR = os.path.join("data", "CSV-Data")
+
+# Dateinamen der Lexika innerhalb von CSV_DIR
+LEXICON_FILES = (
+    "stopwords.csv",
+    "lemma_verbs.csv",
+    "lemma_adjectives.csv",
+    "adjectives.csv",
+    "verbs.csv",
+    "phrases.csv",
+    "modifiers.csv",
+)
+
+
+def lexicon_source_paths(csv_dir=CSV_DIR, language=DEFAULT_LANGUAGE, rules_dir=SUFFIX_RULES_DIR):
+    """Alle Dateien, aus denen ein Lexikon-Snapshot entsteht (CSV-Lexika + Suffix-Regeln)"""
+    paths = [os.path.join(csv_dir, file_name) for file_name in LEXICON_FILES]
+    paths.append(suffix_rules_path(language, rules_dir))
+    return paths
+
+
+def hash_lexicon_files(csv_dir=CSV_DIR, language=DEFAULT_LANGUAGE, rules_dir=SUFFIX_RULES_DIR):
+    """Berechnet SHA-1 Hashes aller Lexikon-Dateien (None für fehlende Dateien)"""
+    hashes = []
+    for path in lexicon_source_paths(csv_dir, language, rules_dir):
         try:
-            csv_path = os.path.join("data", "CSV-Data", "stopwords.csv")
-            with open(csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    self.stopwords.add(row['word'].strip().lower())
-            print(f"Stopwords geladen: {len(self.stopwords)} Wörter")
+            with open(path, 'rb') as file:
+                hashes.append(hashlib.sha1(file.read()).hexdigest())
         except FileNotFoundError:
-            # Default Stopwords
-            self.stopwords = {
-                "like", "just", "really", "very", "actually", "basically", "literally",
-                "seriously", "honestly", "obviously", "clearly", "definitely",
-                "sort", "kind", "maybe", "perhaps", "possibly", "probably",
-                "somewhat", "rather", "quite", "fairly", "pretty",
-                "so", "such", "totally", "completely", "absolutely", "entirely",
-                "extremely", "incredibly", "remarkably", "particularly",
-                "then", "now", "well", "anyway", "meanwhile", "eventually",
-                "somehow", "essentially", "practically", "virtually",
-                "apparently", "seemingly", "supposedly", "allegedly",
-                "anyhow", "fundamentally",
-                "simply", "merely", "only", "hardly", "barely", "nearly",
-                "and", "or", "is", "am", "are", "was", "were", "been", "being",
-                "for", "the", "a", "an", "to", "in", "on", "at", "of", "with"
-            }
-            print("Verwende Standard-Stopwords")
+            hashes.append(None)
+    return tuple(hashes)
+
+
+def lexicon_version(file_hashes):
+    """Kurze Versionskennung aus den Datei-Hashes"""
+    return hashlib.sha1(repr(file_hashes).encode('utf-8')).hexdigest()[:12]
+
+DEFAULT_STOPWORDS = frozenset({
+    "like", "just", "really", "very", "actually", "basically", "literally",
+    "seriously", "honestly", "obviously", "clearly", "definitely",
+    "sort", "kind", "maybe", "perhaps", "possibly", "probably",
+    "somewhat", "rather", "quite", "fairly", "pretty",
+    "so", "such", "totally", "completely", "absolutely", "entirely",
+    "extremely", "incredibly", "remarkably", "particularly",
+    "then", "now", "well", "anyway", "meanwhile", "eventually",
+    "somehow", "essentially", "practically", "virtually",
+    "apparently", "seemingly", "supposedly", "allegedly",
+    "anyhow", "fundamentally",
+    "simply", "merely", "only", "hardly", "barely", "nearly",
+    "and", "or", "is", "am", "are", "was", "were", "been", "being",
+    "for", "the", "a", "an", "to", "in", "on", "at", "of", "with"
+})
+
+
+def load_stopwords(csv_dir=CSV_DIR):
+    """Lädt Stopwords aus CSV oder verwendet Default"""
+    stopwords = set()
+    try:
+        csv_path = os.path.join(csv_dir, "stopwords.csv")
+        with open(csv_path, 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            for row in reader:
+                stopwords.add(row['word'].strip().lower())
+        print(f"Stopwords geladen: {len(stopwords)} Wörter")
+    except FileNotFoundError:
+        stopwords = set(DEFAULT_STOPWORDS)
+        print("Verwende Standard-Stopwords")
+    return stopwords
+
+
+def load_irregular_forms(file_name, csv_dir=CSV_DIR):
+    """Lädt unregelmäßige Wortformen (form -> lemma) aus CSV"""
+    forms = {}
+    try:
+        csv_path = os.path.join(csv_dir, file_name)
+        with open(csv_path, 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            for row in reader:
+                form = row['form'].strip().lower()
+                lemma = row['lemma'].strip().lower()
+                forms[form] = lemma
+        print(f"Unregelmäßige Formen aus {file_name} geladen: {len(forms)} Formen")
+    except FileNotFoundError:
+        print(f"Datei {file_name} nicht gefunden - verwende leeres Wörterbuch")
+    return forms
+
+
+def load_scores(file_name, column, csv_dir=CSV_DIR):
+    """Lädt Wörter mit Sentiment-Scores aus CSV"""
+    scores = {}
+    try:
+        csv_path = os.path.join(csv_dir, file_name)
+        with open(csv_path, 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            for row in reader:
+                word = row[column].strip().lower()
+                scores[word] = int(row['score'])
+        print(f"Scores aus {file_name} geladen: {len(scores)} Wörter")
+    except FileNotFoundError:
+        print(f"Datei {file_name} nicht gefunden")
+    return scores
+
+
+def load_phrases(csv_dir=CSV_DIR):
+    """Lädt Mehrwort-Ausdrücke mit Wortart und Sentiment-Score"""
+    phrases = []
+    try:
+        csv_path = os.path.join(csv_dir, "phrases.csv")
+        with open(csv_path, 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            for row in reader:
+                phrases.append((row['phrase'].strip().lower(), row['type'].strip(), int(row['score'])))
+        print(f"Mehrwort-Ausdrücke geladen: {len(phrases)} Ausdrücke")
+    except FileNotFoundError:
+        print("Datei phrases.csv nicht gefunden")
+    return phrases
+
+
+def load_modifiers(csv_dir=CSV_DIR):
+    """Lädt Verneinungen und Verstärker (Faktor nur bei Verstärkern)"""
+    modifiers = []
+    try:
+        csv_path = os.path.join(csv_dir, "modifiers.csv")
+        with open(csv_path, 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            for row in reader:
+                kind = row['type'].strip()
+                factor = float(row['factor']) if kind == "intensifier" else 0.0
+                modifiers.append((row['phrase'].strip().lower(), kind, factor))
+        print(f"Modifikatoren geladen: {len(modifiers)} Einträge")
+    except FileNotFoundError:
+        print("Datei modifiers.csv nicht gefunden")
+    return modifiers
+
+
+# Wörter inkl. innerer Apostrophe/Bindestriche ("don't", "well-known");
+# alle anderen Satzzeichen trennen Tokens ("great,and" -> "great", "and").
+# Die Gruppe sorgt dafür, dass split() Tokens und Zwischenräume abwechselnd liefert.
+TOKEN_PATTERN = re.compile(r"(\w+(?:['’-]\w+)*)")
+
+
+def tokenize_text(text):
+    """
+    Zerlegt einen Text in einem Durchlauf in (start, ende, normalisierte Form).
+    start/ende sind Zeichen-Offsets im Originaltext, damit Fundstellen ohne
+    erneutes Durchsuchen markiert werden können. Die Offsets werden aus den
+    Längen der split()-Teile berechnet, das spart ein Match-Objekt pro Token.
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # Sehr selten: Kleinschreibung ändert die Länge (z.B. "İ")
+        return [(m.start(), m.end(), m.group().lower()) for m in TOKEN_PATTERN.finditer(text)]
+
+    pieces = TOKEN_PATTERN.split(lowered)
+    tokens = []
+    position = len(pieces[0])
+    for i in range(1, len(pieces), 2):
+        token = pieces[i]
+        end = position + len(token)
+        tokens.append((position, end, token))
+        position = end + len(pieces[i + 1])
+    return tokens
+
+
+# Absätze sind durch mindestens eine Leerzeile getrennt
+PARAGRAPH_SEPARATOR = re.compile(r"\n[ \t\r\f\v]*\n\s*")
+
+
+def split_paragraphs(text):
+    """Gibt die (start, ende)-Bereiche der Absätze eines Textes zurück"""
+    paragraphs = []
+    position = 0
+    for match in PARAGRAPH_SEPARATOR.finditer(text):
+        if match.start() > position:
+            paragraphs.append((position, match.start()))
+        position = match.end()
+    if position < len(text):
+        paragraphs.append((position, len(text)))
+    return paragraphs
+
+
+# Verneinungen/Verstärker wirken nicht über Satz- oder Absatzgrenzen hinweg
+SCOPE_BREAK = re.compile(r"[.!?;:]|\n\s*\n")
+
+# Maximaler Abstand (in Tokens) zwischen Modifikator und bewertetem Wort
+MODIFIER_WINDOW = 2
+
+
+def remove_spans(text, spans):
+    """Schneidet die (start, ende)-Bereiche aus dem Text und normalisiert Leerzeichen"""
+    parts = []
+    position = 0
+    for start, end, *_ in spans:
+        parts.append(text[position:start])
+        position = end
+    parts.append(text[position:])
+    return " ".join("".join(parts).split())
+
+
+def build_lemma_table(irregular_verbs, irregular_adjectives, adjectives, verbs, suffix_rules=None):
+    """
+    Baut die Vorwärts-Tabelle Wortform -> Lemma für alle akzeptierten Formen.
+    Die Reihenfolge der Einträge bildet die Prioritäten des Regelpfads ab:
+    Suffix-Regeln < Grundformen < unregelmäßige Adjektive < unregelmäßige Verben.
+    """
+    if suffix_rules is None:
+        suffix_rules = load_suffix_rules()
+    table = {}
+
+    # Suffix-Regeln: nur Formen, die die Regeln tatsächlich auf ein Lemma abbilden
+    for lemma in list(adjectives) + list(verbs):
+        if not lemma:
+            continue
+        for form in suffix_rules.candidate_forms(lemma):
+            if suffix_rules.apply(form) == lemma:
+                table[form] = lemma
+
+    for lemma in list(adjectives) + list(verbs):
+        table[lemma] = lemma
+
+    table.update(irregular_adjectives)
+    table.update(irregular_verbs)
+    return table
+
+
+def build_phrase_automaton(phrases, modifiers, lemma_table):
+    """
+    Kompiliert Mehrwort-Ausdrücke und Modifikatoren in einen Automaten.
+    Die Muster werden wie der Text lemmatisiert, damit z.B. "fell apart"
+    den Eintrag "fall apart" trifft.
+    """
+    patterns = []
+    for phrase, kind, value in list(modifiers) + list(phrases):
+        symbols = tuple(lemma_table.get(norm, norm) for _, _, norm in tokenize_text(phrase))
+        patterns.append((symbols, PhraseEntry(kind, phrase, value)))
+    return PhraseAutomaton(patterns)
+
+
+class LemmaCache:
+    """
+    Begrenzter LRU-Cache vor einer Lemma-Funktion (bereinigtes Token -> Lemma)
+    mit Zählern für Treffer, Fehlversuche und Verdrängungen. Gehört zu genau
+    einem Lexikon-Stand (z.B. der LemmaTableView eines Snapshots).
+    functools.lru_cache ist in C implementiert und threadsicher, ein Treffer
+    kostet damit kaum mehr als ein Dictionary-Lookup. Treffer und
+    Fehlversuche zählt lru_cache selbst (ohne eigenen Python-Zähler ausserhalb
+    eines Locks). Lösen mehrere Threads dasselbe neue Wort gleichzeitig auf,
+    zählt jeder einen Fehlversuch, gespeichert wird es einmal: evictions ist
+    deshalb unter Last eine obere Schranke.
+    """
+
+    def __init__(self, resolve, maxsize=50000):
+        self.maxsize = maxsize
+        self.lookup = functools.lru_cache(maxsize=maxsize)(resolve)
+
+    def clear(self):
+        """Leert den Cache und setzt die Zähler zurück"""
+        self.lookup.cache_clear()
+
+    def stats(self):
+        """Gibt Trefferquote und Zähler zur Dimensionierung des Caches zurück"""
+        info = self.lookup.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            # Jeder Fehlversuch legt einen Eintrag an; was nicht mehr im Cache ist, wurde verdrängt
+            # (gleichzeitige Fehlversuche für dasselbe Wort zählen mit, siehe Klassenbeschreibung)
+            'evictions': max(0, info.misses - info.currsize),
+            'size': info.currsize,
+            'maxsize': self.maxsize,
+            'hit_rate': info.hits / lookups if lookups else 0.0,
+        }
 
-    def load_irregular_verbs(self):
-        """Lädt unregelmäßige Verben aus CSV"""
-        try:
-            csv_path = os.path.join("data", "CSV-Data", "lemma_verbs.csv")
-            with open(csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    form = row['form'].strip().lower()
-                    lemma = row['lemma'].strip().lower()
-                    self.irregular_verbs[form] = lemma
-            print(f"Unregelmäßige Verben geladen: {len(self.irregular_verbs)} Formen")
-        except FileNotFoundError:
-            print("Datei lemma_verbs.csv nicht gefunden - verwende leeres Wörterbuch")
-            self.irregular_verbs = {}
 
-    def load_irregular_adjectives(self):
-        """Lädt unregelmäßige Adjektive aus CSV"""
-        try:
-            csv_path = os.path.join("data", "CSV-Data", "lemma_adjectives.csv")
-            with open(csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    form = row['form'].strip().lower()
-                    lemma = row['lemma'].strip().lower()
-                    self.irregular_adjectives[form] = lemma
-            print(f"Unregelmäßige Adjektive geladen: {len(self.irregular_adjectives)} Formen")
-        except FileNotFoundError:
-            print("Datei lemma_adjectives.csv nicht gefunden - verwende leeres Wörterbuch")
-            self.irregular_adjectives = {}
+class LexiconSnapshot(NamedTuple):
+    """Unveränderlicher Stand aller Lexika, wird von allen Sessions geteilt"""
+    version: str
+    stopwords: frozenset
+    irregular_verbs: MappingProxyType
+    irregular_adjectives: MappingProxyType
+    adjectives: MappingProxyType
+    verbs: MappingProxyType
+    lemma_table: MappingProxyType
+    phrase_automaton: PhraseAutomaton
+    suffix_rules: SuffixRuleSet
+
+
+class LexiconStore:
+    """
+    Prozessweiter Speicher für die Lexika.
+    Die CSV-Dateien werden nur einmal pro Prozess geladen. Ein neuer Snapshot
+    wird erst erstellt, wenn sich mtime/Grösse UND Inhalt (SHA-1) einer Datei
+    geändert haben. Der Snapshot wird atomar ausgetauscht, laufende Analysen
+    arbeiten mit ihrem alten Snapshot weiter.
+    """
+
+    def __init__(self, csv_dir=CSV_DIR, check_interval=1.0, language=DEFAULT_LANGUAGE, rules_dir=SUFFIX_RULES_DIR):
+        self.csv_dir = csv_dir
+        self.check_interval = check_interval
+        self.language = language
+        self.rules_dir = rules_dir
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._file_stats = None
+        self._file_hashes = None
+        self._last_check = 0.0
+
+    def __getstate__(self):
+        # Für Worker-Prozesse: nur die Konfiguration übertragen, nicht Lock und Snapshot
+        return {'csv_dir': self.csv_dir, 'check_interval': self.check_interval, 'language': self.language,
+                'rules_dir': self.rules_dir}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def get(self):
+        """Gibt den aktuellen Snapshot zurück und lädt bei Bedarf neu"""
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if snapshot is not None and now - self._last_check < self.check_interval:
+            return snapshot
+
+        file_stats = self._stat_files()
+        if snapshot is not None and file_stats == self._file_stats:
+            self._last_check = now
+            return snapshot
+
+        with self._lock:
+            # Ein anderer Thread kann inzwischen neu geladen haben
+            if self._snapshot is not None and file_stats == self._file_stats:
+                self._last_check = now
+                return self._snapshot
+
+            file_hashes = self._hash_files()
+            if self._snapshot is None or file_hashes != self._file_hashes:
+                try:
+                    snapshot = self._load(file_hashes)
+                except (OSError, KeyError, TypeError, ValueError) as e:
+                    # Halb geschriebene CSV oder fehlende/gerade ersetzte Regeldatei:
+                    # alten Stand behalten und später erneut prüfen
+                    if self._snapshot is None:
+                        raise
+                    print(f"Lexika konnten nicht neu geladen werden: {e}")
+                    # Nächster Versuch erst nach check_interval (wie nach einem erfolgreichen Laden)
+                    self._last_check = now
+                    return self._snapshot
+                self._snapshot = snapshot
+                self._file_hashes = file_hashes
+            self._file_stats = file_stats
+            self._last_check = now
+            return self._snapshot
+
+    def _stat_files(self):
+        """Liest mtime und Grösse aller Lexikon-Dateien"""
+        stats = []
+        for path in lexicon_source_paths(self.csv_dir, self.language, self.rules_dir):
+            try:
+                st = os.stat(path)
+                stats.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                stats.append(None)
+        return tuple(stats)
+
+    def _hash_files(self):
+        """Berechnet SHA-1 Hashes aller Lexikon-Dateien"""
+        return hash_lexicon_files(self.csv_dir, self.language, self.rules_dir)
+
+    def _load(self, file_hashes):
+        """Lädt alle CSV-Dateien in einen neuen, unveränderlichen Snapshot"""
+        version = lexicon_version(file_hashes)
+        irregular_verbs = load_irregular_forms("lemma_verbs.csv", self.csv_dir)
+        irregular_adjectives = load_irregular_forms("lemma_adjectives.csv", self.csv_dir)
+        adjectives = load_scores("adjectives.csv", "adjective", self.csv_dir)
+        verbs = load_scores("verbs.csv", "verb", self.csv_dir)
+        suffix_rules = load_suffix_rules(self.language, self.rules_dir)
+        lemma_table = build_lemma_table(irregular_verbs, irregular_adjectives, adjectives, verbs, suffix_rules)
+        phrase_automaton = build_phrase_automaton(
+            load_phrases(self.csv_dir), load_modifiers(self.csv_dir), lemma_table
+        )
+        return LexiconSnapshot(
+            version=version,
+            stopwords=frozenset(load_stopwords(self.csv_dir)),
+            irregular_verbs=MappingProxyType(irregular_verbs),
+            irregular_adjectives=MappingProxyType(irregular_adjectives),
+            adjectives=MappingProxyType(adjectives),
+            verbs=MappingProxyType(verbs),
+            lemma_table=MappingProxyType(lemma_table),
+            phrase_automaton=phrase_automaton,
+            suffix_rules=suffix_rules,
+        )
+
+
+# Wird von allen TextAnalyzer-Instanzen (und damit allen Streamlit-Sessions) geteilt
+shared_lexicon_store = LexiconStore()
+
+
+def iter_jsonl(path):
+    """Liest Texte aus einer JSONL-Datei im Format von data/*.jsonl als (id, text)"""
+    with open(path, 'r', encoding='utf-8') as file:
+        for line_no, line in enumerate(file, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            yield record.get('id', line_no), record['text']
+
+
+def iter_movie_reviews(path):
+    """Liest das NLTK movie_reviews-Verzeichnis (<kategorie>/<datei>.txt) als (id, text)"""
+    if not os.path.isdir(path):
+        raise FileNotFoundError(
+            f"movie_reviews-Korpus nicht gefunden: {path} "
+            f"(Download mit scripts/download_nltk_movie_reviews.py)"
+        )
+    for category in sorted(os.listdir(path)):
+        category_dir = os.path.join(path, category)
+        if not os.path.isdir(category_dir):
+            continue
+        for file_name in sorted(os.listdir(category_dir)):
+            if not file_name.endswith('.txt'):
+                continue
+            with open(os.path.join(category_dir, file_name), 'r', encoding='utf-8') as file:
+                yield f"{category}/{file_name}", file.read()
+
+
+def iter_corpus(source):
+    """
+    Liefert (id, text)-Paare aus einer Korpus-Quelle:
+    Verzeichnis im movie_reviews-Layout, JSONL-Datei oder Iterable aus
+    Texten bzw. (id, text)-Paaren (Texte ohne id werden durchnummeriert).
+    """
+    if isinstance(source, (str, os.PathLike)):
+        if not os.path.exists(source):
+            raise FileNotFoundError(
+                f"Korpus nicht gefunden: {source} "
+                f"(erwartet: Verzeichnis im movie_reviews-Layout oder JSONL-Datei)"
+            )
+        if os.path.isdir(source):
+            yield from iter_movie_reviews(source)
+        else:
+            yield from iter_jsonl(source)
+        return
 
-    def load_adjectives(self):
-        """Lädt Adjektive mit Sentiment-Scores"""
-        try:
-            csv_path = os.path.join("data", "CSV-Data", "adjectives.csv")
-            with open(csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    adjective = row['adjective'].strip().lower()
-                    score = int(row['score'])
-                    self.adjectives[adjective] = score
-            print(f"Adjektive geladen: {len(self.adjectives)} Wörter")
-        except FileNotFoundError:
-            print("Datei adjectives.csv nicht gefunden")
-            self.adjectives = {}
+    for index, item in enumerate(source):
+        if isinstance(item, str):
+            yield index, item
+        else:
+            doc_id, text = item
+            yield doc_id, text
 
-    def load_verbs(self):
-        """Lädt Verben mit Sentiment-Scores"""
-        try:
-            csv_path = os.path.join("data", "CSV-Data", "verbs.csv")
-            with open(csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    verb = row['verb'].strip().lower()
-                    score = int(row['score'])
-                    self.verbs[verb] = score
-            print(f"Verben geladen: {len(self.verbs)} Wörter")
-        except FileNotFoundError:
-            print("Datei verbs.csv nicht gefunden")
-            self.verbs = {}
 
-    def _initialize_suffix_rules(self):
-        """Initialisiert Suffix-Regeln"""
-        self.consonants = set('bcdfghjklmnpqrstvwxyz')
-        self.vowels = set('aeiou')
+# Analyzer pro Worker-Prozess (wird vom Pool-Initializer gesetzt)
+_worker_analyzer = None
+
+
+def _init_corpus_worker(lexicon_store):
+    """Initialisiert den Analyzer eines Worker-Prozesses (Lexika einmal pro Prozess)"""
+    global _worker_analyzer
+    if (type(lexicon_store) is LexiconStore and lexicon_store.csv_dir == shared_lexicon_store.csv_dir
+            and lexicon_store.language == shared_lexicon_store.language
+            and lexicon_store.rules_dir == shared_lexicon_store.rules_dir):
+        # Geteilten Speicher verwenden (bei fork bereits geladen)
+        lexicon_store = shared_lexicon_store
+    _worker_analyzer = TextAnalyzer(lexicon_store)
+
+
+def _analyze_chunk(texts, fields):
+    """Analysiert einen Chunk von Texten im Worker-Prozess"""
+    results = []
+    for text in texts:
+        result = _worker_analyzer.analyze_all(text)
+        if fields is not None:
+            result = {key: result[key] for key in fields}
+        results.append(result)
+    return results
+
+
+class TextAnalyzer:
+    def __init__(self, lexicon_store=None):
+        # Lexika aus dem prozessweiten Speicher holen (kein erneutes CSV-Parsing)
+        store = lexicon_store if lexicon_store is not None else shared_lexicon_store
+        snapshot = store.get()
+        self.lexicon_store = store
+        self.lexicon_version = snapshot.version
+        self.stopwords = snapshot.stopwords
+        self.irregular_verbs = snapshot.irregular_verbs
+        self.irregular_adjectives = snapshot.irregular_adjectives
+        self.adjectives = snapshot.adjectives
+        self.verbs = snapshot.verbs
+        self.lemma_table = snapshot.lemma_table
+        self.phrase_automaton = snapshot.phrase_automaton
+        self.suffix_rules = snapshot.suffix_rules
 
     def lemmatize(self, word):
         """
         Lemmatisieren eines einzelnen Wortes.
         Lemmatisiert NUR wenn das Wort ein bekanntes Verb oder Adjektiv ist.
+        Alle akzeptierten Wortformen stehen bereits in der vorberechneten
+        Lemma-Tabelle (siehe build_lemma_table), daher genügt ein einziger
+        Lookup. Unbekannte Wörter werden unverändert zurückgegeben.
+        """
+        word_clean = word.lower().strip('.,!?;:\'\"')
+        return self.lemma_table.get(word_clean, word_clean)
+
+    def _lemmatize_by_rules(self, word_clean):
+        """
+        Regelbasierter Referenzpfad (ohne Lemma-Tabelle).
         1. Prüft CSV-Wörterbücher (unregelmäßige Formen)
         2. Prüft ob Wort bereits in Grundform bekannt ist
         3. Wendet Suffix-Regeln an und prüft ob Ergebnis bekannt ist
         4. Gibt Original zurück wenn nichts gefunden wurde
+        Wird von scripts/check_lemma_table.py zum Vergleich verwendet.
         """
-        word_clean = word.lower().strip('.,!?;:\'\"')
-
         if not word_clean:
             return word_clean
 
@@ -151,197 +564,422 @@ class TextAnalyzer:
         return word_clean
 
     def _apply_suffix_rules(self, word):
-        """
-        Wendet Suffix-Regeln für regelmäßige Wortformen an.
-        Optimiert für Verben und Adjektive.
-        """
-        if len(word) <= 3:
-            return word
-
-        # -ies -> -y (tries -> try, stories -> story)
-        if word.endswith('ies') and len(word) > 4:
-            return word[:-3] + 'y'
-
-        # -iest -> -y (happiest -> happy)
-        if word.endswith('iest') and len(word) > 5:
-            return word[:-4] + 'y'
-
-        # -ier -> -y (happier -> happy)
-        if word.endswith('ier') and len(word) > 4:
-            return word[:-3] + 'y'
-
-        # -ing (Verben: running -> run, taking -> take)
-        if word.endswith('ing') and len(word) > 5:
-            stem = word[:-3]
-
-            # Verdoppelte Konsonanten (running -> run)
-            if len(stem) >= 2 and stem[-1] == stem[-2] and stem[-1] in self.consonants:
-                return stem[:-1]
-
-            # Stummes -e (taking -> take)
-            if stem[-1] in self.consonants and len(stem) >= 2:
-                if stem[-2] in self.vowels and stem[-1] in {'v', 'k', 'c', 't', 'z'}:
-                    return stem + 'e'
-
-            return stem if len(stem) >= 3 else word
-
-        # -ed (Verben: loved -> love, stopped -> stop)
-        if word.endswith('ed') and len(word) > 4:
-            stem = word[:-2]
-
-            # Verdoppelte Konsonanten (stopped -> stop)
-            if len(stem) >= 2 and stem[-1] == stem[-2] and stem[-1] in self.consonants:
-                return stem[:-1]
-
-            # -ied -> -y (tried -> try)
-            if stem.endswith('i'):
-                return stem[:-1] + 'y'
-
-            # Stummes -e (loved -> love)
-            if len(stem) >= 2 and stem[-1] in self.consonants and stem[-2] in self.vowels:
-                if stem[-1] in {'v', 'c', 'g', 'z'}:
-                    return stem + 'e'
+        """Wendet die Suffix-Regeln der Lexikon-Sprache an"""
+        return self.suffix_rules.apply(word)
 
-            return stem if len(stem) >= 3 else word
-
-        # -est (Adjektiv Superlativ: biggest -> big)
-        if word.endswith('est') and len(word) > 5:
-            stem = word[:-3]
-
-            # Verdoppelte Konsonanten (biggest -> big)
-            if len(stem) >= 2 and stem[-1] == stem[-2] and stem[-1] in self.consonants:
-                return stem[:-1]
-
-            return stem
-
-        # -er (Adjektiv Komparativ: bigger -> big)
-        if word.endswith('er') and len(word) > 4:
-            stem = word[:-2]
-
-            # Verdoppelte Konsonanten (bigger -> big)
-            if len(stem) >= 2 and stem[-1] == stem[-2] and stem[-1] in self.consonants:
-                return stem[:-1]
-
-            # Aber nicht bei -eer, -ier, etc.
-            if len(stem) >= 2 and stem[-1] in {'e', 'i', 'w'}:
-                return word
-
-            return stem if len(stem) >= 3 else word
-
-        # -s (Plural/3. Person: runs -> run, watches -> watch)
-        if word.endswith('s') and not word.endswith('ss') and len(word) > 3:
-            if word.endswith('es') and len(word) > 4:
-                if word[-3:-2] in ['s', 'x', 'z'] or word[-4:-2] in ['sh', 'ch']:
-                    return word[:-2]
-
-            return word[:-1]
-
-        return word
+    def tokenize(self, text):
+        """Zerlegt den Text in (start, ende, normalisierte Form)-Tupel"""
+        return tokenize_text(text)
 
     def lemmatize_text(self, text):
         """Lemmatisieren eines kompletten Textes"""
-        words = text.split()
-        return [(word, self.lemmatize(word)) for word in words]
+        lemma_table = self.lemma_table
+        return [
+            (text[start:end], lemma_table.get(norm, norm))
+            for start, end, norm in tokenize_text(text)
+        ]
 
     def extract_filler_words(self, text):
         """Extrahiert Füllwörter"""
-        word_lemmas = self.lemmatize_text(text)
-        return [original for original, lemma in word_lemmas if lemma in self.stopwords]
+        return [original for original, lemma in self.lemmatize_text(text) if lemma in self.stopwords]
 
     def remove_filler_words(self, text):
         """Entfernt Füllwörter"""
-        word_lemmas = self.lemmatize_text(text)
-        cleaned_words = [original for original, lemma in word_lemmas if lemma not in self.stopwords]
-        return " ".join(cleaned_words)
+        lemma_table = self.lemma_table
+        filler_spans = [
+            (start, end) for start, end, norm in tokenize_text(text)
+            if lemma_table.get(norm, norm) in self.stopwords
+        ]
+        return remove_spans(text, filler_spans)
 
     def analyze_adjectives(self, text):
         """Analysiert Adjektive im Text mit Lemmatisierung"""
-        word_lemmas = self.lemmatize_text(text)
-        adjective_counts = {}
+        adjective_counts, adjective_spans = self._count_items(text, "adjective")
+        return self._summarize_adjectives(adjective_counts, adjective_spans)
 
-        for original, lemma in word_lemmas:
-            if lemma in self.adjectives:
-                score = self.adjectives[lemma]
-                if lemma in adjective_counts:
-                    adjective_counts[lemma]['count'] += 1
-                    adjective_counts[lemma]['originals'].add(original)
-                else:
-                    adjective_counts[lemma] = {
-                        'score': score,
-                        'count': 1,
-                        'originals': {original}
-                    }
-
-        found_adjectives = [
-            (lemma, data['score'], data['count'], ', '.join(sorted(data['originals'])))
-            for lemma, data in adjective_counts.items()
+    def analyze_verbs(self, text):
+        """Analysiert Verben im Text mit Lemmatisierung"""
+        verb_counts, verb_spans = self._count_items(text, "verb")
+        return self._summarize_verbs(verb_counts, verb_spans)
+
+    def analyze_all(self, text):
+        """
+        Führt die komplette Analyse in einem einzigen Durchlauf aus.
+        Der Text wird nur einmal zerlegt und lemmatisiert; Füllwörter,
+        bereinigter Text, Adjektive, Verben und Lemmas werden dabei
+        gemeinsam gesammelt.
+        """
+        partials = [
+            (start, self._analyze_partial(text[start:end]))
+            for start, end in split_paragraphs(text)
         ]
+        return self._merge_partials(text, partials)
 
-        if found_adjectives:
-            total_score = sum(score * count for _, score, count, _ in found_adjectives)
-            total_count = sum(count for _, _, count, _ in found_adjectives)
-            avg_score = total_score / total_count
+    def sentiment_timeline(self, text, results=None):
+        """
+        Erstellt den Stimmungsverlauf (SentimentTimeline) eines Textes.
+        Mit den Ergebnissen von analyze_all()/analyze_incremental() werden
+        deren Fundstellen übernommen, sonst wird der Text einmal analysiert.
+        """
+        if results is None:
+            items = [(kind, score, start) for kind, _, score, start, _ in self.find_sentiment_items(text)]
+        else:
+            items = []
+            for kind, result, found_key in (("adjective", results['adjective_results'], 'found_adjectives'),
+                                            ("verb", results['verb_results'], 'found_verbs')):
+                scores = {key: score for key, score, _, _ in result[found_key]}
+                items.extend((kind, scores[key], start) for start, _, key in result['spans'])
+            items.sort(key=lambda item: item[2])
+        return SentimentTimeline([start for start, _, _ in tokenize_text(text)], items)
+
+    def find_sentiment_items(self, text):
+        """
+        Liefert alle bewerteten Fundstellen als (wortart, schlüssel, score, start, ende).
+        Mehrwort-Ausdrücke ("fall apart") und Modifikatoren ("not", "very")
+        werden mit dem Phrasen-Automaten in einem Durchlauf gefunden;
+        Verneinungen und Verstärker verändern den Score des folgenden Worts
+        und werden Teil des Schlüssels ("not (good)").
+        """
+        items = []
+        for offset, end in split_paragraphs(text):
+            paragraph = text[offset:end]
+            tokens = tokenize_text(paragraph)
+            lemmas = [self.lemma_table.get(norm, norm) for _, _, norm in tokens]
+            items.extend(
+                (kind, key, score, start + offset, stop + offset)
+                for kind, key, score, start, stop in self._find_items(paragraph, tokens, lemmas)
+            )
+        return items
+
+    def find_sentiment_terms(self, text):
+        """
+        Wie find_sentiment_items(), aber ohne angewendete Modifikatoren:
+        (wortart, grund-schlüssel, modifikatoren) mit den Modifikatoren als
+        Tupel von (typ, schlüssel) in Textreihenfolge. Der Score lässt sich
+        daraus mit jedem Lexikon-Stand neu berechnen (siehe BatchScorer).
+        """
+        terms = []
+        for offset, end in split_paragraphs(text):
+            paragraph = text[offset:end]
+            tokens = tokenize_text(paragraph)
+            lemmas = [self.lemma_table.get(norm, norm) for _, _, norm in tokens]
+            terms.extend(
+                (kind, key, tuple((entry.kind, entry.key) for entry in modifiers))
+                for kind, key, _, modifiers, _, _ in self._find_terms(paragraph, tokens, lemmas)
+            )
+        return terms
+
+    def _find_items(self, text, tokens, lemmas):
+        """Bewertete Fundstellen eines Absatzes (Offsets relativ zum Absatz)"""
+        items = []
+        for kind, key, score, modifiers, start, end in self._find_terms(text, tokens, lemmas):
+            if modifiers:
+                kind, key, score = self._apply_modifiers(kind, key, score, modifiers)
+            items.append((kind, key, score, start, end))
+        return items
+
+    def _find_terms(self, text, tokens, lemmas):
+        """
+        Fundstellen eines Absatzes als (wortart, schlüssel, score, modifikatoren, start, ende):
+        Score ohne Modifikatoren, modifikatoren als Tupel von PhraseEntry (Textreihenfolge)
+        """
+        adjectives = self.adjectives
+        verbs = self.verbs
+        matches = self.phrase_automaton.find_matches(lemmas)
+
+        items = []
+        pending = []  # (entry, start-offset, ende-offset, token-index nach dem Modifikator)
+        index = 0
+        while index < len(tokens):
+            match = matches.get(index)
+            start = tokens[index][0]
+            if match is not None:
+                end_index, entry = match
+                end = tokens[end_index - 1][1]
+                if entry.kind in ("negator", "intensifier"):
+                    pending.append((entry, start, end, end_index))
+                    index = end_index
+                    continue
+                hits = [(entry.kind, entry.key, entry.value)]
+            else:
+                end_index = index + 1
+                end = tokens[index][1]
+                lemma = lemmas[index]
+                hits = []
+                if lemma in adjectives:
+                    hits.append(("adjective", lemma, adjectives[lemma]))
+                if lemma in verbs:
+                    hits.append(("verb", lemma, verbs[lemma]))
+                if not hits:
+                    index = end_index
+                    continue
+
+            # Modifikatoren im Fenster vor dem Wort anwenden (nächster zuerst)
+            modifiers = [
+                (entry, mod_start) for entry, mod_start, mod_end, mod_end_index in pending
+                if index - mod_end_index <= MODIFIER_WINDOW and not SCOPE_BREAK.search(text, mod_end, start)
+            ]
+            pending = []
+            if modifiers:
+                start = modifiers[0][1]
+            entries = tuple(entry for entry, _ in modifiers)
+
+            items.extend((kind, key, score, entries, start, end) for kind, key, score in hits)
+            index = end_index
+        return items
+
+    @staticmethod
+    def _apply_modifiers(kind, key, score, modifiers):
+        """
+        Verneinung spiegelt den Score an 50, Verstärker skalieren den Abstand zu 50
+        (modifiers: PhraseEntry in Textreihenfolge, der nächste wirkt zuerst)
+        """
+        for entry in reversed(modifiers):
+            if entry.kind == "negator":
+                score = 100 - score
+            else:
+                score = min(100, max(0, round(50 + (score - 50) * entry.value)))
+        # Klammern halten den Schlüssel von gleichlautenden Mehrwort-Ausdrücken getrennt
+        prefix = " ".join(entry.key for entry in modifiers)
+        return kind, f"{prefix} ({key})", score
 
-            if avg_score >= 60:
-                sentiment = "positive"
-            elif avg_score >= 40:
-                sentiment = "neutral"
+    def analyze_incremental(self, text, paragraph_cache):
+        """
+        Wie analyze_all(), analysiert aber nur geänderte Absätze neu.
+        paragraph_cache ist ein Dictionary (z.B. aus st.session_state), das die
+        Teilergebnisse pro Absatz unter (Lexikon-Version, SHA-1 des Absatzes)
+        speichert. Nach dem Aufruf enthält es nur noch die aktuellen Absätze.
+        """
+        partials = []
+        current = {}
+        reused = 0
+        for start, end in split_paragraphs(text):
+            paragraph = text[start:end]
+            key = (self.lexicon_version, hashlib.sha1(paragraph.encode('utf-8')).hexdigest())
+            partial = paragraph_cache.get(key)
+            if partial is None:
+                partial = self._analyze_partial(paragraph)
             else:
-                sentiment = "negative"
-        else:
-            avg_score = 50
-            sentiment = "neutral"
+                reused += 1
+            current[key] = partial
+            partials.append((start, partial))
+
+        paragraph_cache.clear()
+        paragraph_cache.update(current)
+
+        results = self._merge_partials(text, partials)
+        results['paragraph_stats'] = {
+            'paragraphs': len(partials),
+            'reused': reused,
+            'analyzed': len(partials) - reused
+        }
+        return results
 
-        return {
-            'found_adjectives': found_adjectives,
-            'average_score': round(avg_score, 1),
-            'sentiment': sentiment,
-            'count': len(adjective_counts)
+    def _analyze_partial(self, text):
+        """
+        Analysiert einen Absatz zu einem zusammenführbaren Teilergebnis.
+        Die Spans sind relativ zum Absatz, die Zählungen werden beim
+        Zusammenführen addiert (siehe _merge_partials).
+        """
+        lemma_table = self.lemma_table
+        stopwords = self.stopwords
+
+        partial = {
+            'lemmatized': [],
+            'filler_words': [],
+            'filler_spans': [],
+            'adjectives': {},
+            'adjective_spans': [],
+            'verbs': {},
+            'verb_spans': []
         }
 
-    def analyze_verbs(self, text):
-        """Analysiert Verben im Text mit Lemmatisierung"""
-        word_lemmas = self.lemmatize_text(text)
+        tokens = tokenize_text(text)
+        lemmas = []
+        for start, end, norm in tokens:
+            lemma = lemma_table.get(norm, norm)
+            lemmas.append(lemma)
+            original = text[start:end]
+            partial['lemmatized'].append((original, lemma))
+
+            if lemma in stopwords:
+                partial['filler_words'].append(original)
+                partial['filler_spans'].append((start, end))
+
+        for kind, key, score, start, end in self._find_items(text, tokens, lemmas):
+            if kind == "adjective":
+                self._add_hit(partial['adjectives'], key, score, text[start:end])
+                partial['adjective_spans'].append((start, end, key))
+            else:
+                self._add_hit(partial['verbs'], key, score, text[start:end])
+                partial['verb_spans'].append((start, end, key))
+
+        return partial
+
+    def _merge_partials(self, text, partials):
+        """Führt (offset, teilergebnis)-Paare zum Ergebnis von analyze_all() zusammen"""
+        lemmatized = []
+        filler_words = []
+        filler_spans = []
+        adjective_counts = {}
+        adjective_spans = []
         verb_counts = {}
+        verb_spans = []
+
+        for offset, partial in partials:
+            lemmatized.extend(partial['lemmatized'])
+            filler_words.extend(partial['filler_words'])
+            filler_spans.extend((start + offset, end + offset) for start, end in partial['filler_spans'])
+            adjective_spans.extend((start + offset, end + offset, lemma)
+                                   for start, end, lemma in partial['adjective_spans'])
+            verb_spans.extend((start + offset, end + offset, lemma)
+                              for start, end, lemma in partial['verb_spans'])
+            self._merge_counts(adjective_counts, partial['adjectives'])
+            self._merge_counts(verb_counts, partial['verbs'])
 
-        for original, lemma in word_lemmas:
-            if lemma in self.verbs:
-                score = self.verbs[lemma]
-                if lemma in verb_counts:
-                    verb_counts[lemma]['count'] += 1
-                    verb_counts[lemma]['originals'].add(original)
-                else:
-                    verb_counts[lemma] = {
-                        'score': score,
-                        'count': 1,
-                        'originals': {original}
-                    }
-
-        found_verbs = [
+        return {
+            'filler_words': filler_words,
+            'clean_text': remove_spans(text, filler_spans),
+            'adjective_results': self._summarize_adjectives(adjective_counts, adjective_spans),
+            'verb_results': self._summarize_verbs(verb_counts, verb_spans),
+            'lemmatized': lemmatized
+        }
+
+    @staticmethod
+    def _merge_counts(counts, partial_counts):
+        """Addiert die Zählungen eines Teilergebnisses (ohne es zu verändern)"""
+        for lemma, data in partial_counts.items():
+            if lemma in counts:
+                counts[lemma]['count'] += data['count']
+                counts[lemma]['originals'] |= data['originals']
+            else:
+                counts[lemma] = {
+                    'score': data['score'],
+                    'count': data['count'],
+                    'originals': set(data['originals'])
+                }
+
+    def analyze_corpus(self, corpus, with_ids=False, processes=None, chunk_size=32,
+                       max_in_flight=None, fields=None):
+        """
+        Analysiert einen ganzen Korpus als Generator mit einem Prozess-Pool.
+        corpus: Texte, (id, text)-Paare, eine JSONL-Datei oder ein Verzeichnis
+        im movie_reviews-Layout (siehe iter_corpus).
+        Texte werden in Chunks von chunk_size an die Worker verteilt; höchstens
+        max_in_flight Chunks (Standard: 2 pro Prozess) sind gleichzeitig
+        unterwegs, damit der Speicher begrenzt bleibt. Die Ergebnisse kommen
+        in Eingabereihenfolge zurück, mit with_ids=True als (id, ergebnis).
+        fields begrenzt die zurückgegebenen Schlüssel von analyze_all().
+        """
+        items = iter_corpus(corpus)
+        fields = tuple(fields) if fields is not None else None
+
+        # Ohne Pool direkt im aktuellen Prozess analysieren
+        if processes == 1:
+            for doc_id, text in items:
+                result = self.analyze_all(text)
+                if fields is not None:
+                    result = {key: result[key] for key in fields}
+                yield (doc_id, result) if with_ids else result
+            return
+
+        processes = processes or os.cpu_count() or 1
+        max_in_flight = max_in_flight or 2 * processes
+
+        with ProcessPoolExecutor(max_workers=processes,
+                                 initializer=_init_corpus_worker,
+                                 initargs=(self.lexicon_store,)) as pool:
+            pending = deque()
+            while True:
+                # Fenster auffüllen
+                while len(pending) < max_in_flight:
+                    chunk = list(islice(items, chunk_size))
+                    if not chunk:
+                        break
+                    doc_ids = [doc_id for doc_id, _ in chunk]
+                    texts = [text for _, text in chunk]
+                    pending.append((doc_ids, pool.submit(_analyze_chunk, texts, fields)))
+
+                if not pending:
+                    break
+
+                # Ältesten Chunk abwarten, damit die Reihenfolge erhalten bleibt
+                doc_ids, future = pending.popleft()
+                for doc_id, result in zip(doc_ids, future.result()):
+                    yield (doc_id, result) if with_ids else result
+
+    def _count_items(self, text, kind):
+        """Zählt alle Fundstellen einer Wortart, samt Spans"""
+        counts = {}
+        spans = []
+        for item_kind, key, score, start, end in self.find_sentiment_items(text):
+            if item_kind == kind:
+                self._add_hit(counts, key, score, text[start:end])
+                spans.append((start, end, key))
+        return counts, spans
+
+    @staticmethod
+    def _add_hit(counts, lemma, score, original):
+        """Erhöht den Zähler eines Lemmas und merkt sich die Originalform"""
+        if lemma in counts:
+            counts[lemma]['count'] += 1
+            counts[lemma]['originals'].add(original)
+        else:
+            counts[lemma] = {
+                'score': score,
+                'count': 1,
+                'originals': {original}
+            }
+
+    @staticmethod
+    def _summarize_counts(counts, positive_label, negative_label):
+        """Berechnet gewichteten Durchschnitt und Stimmung aus den Zählungen"""
+        found = [
             (lemma, data['score'], data['count'], ', '.join(sorted(data['originals'])))
-            for lemma, data in verb_counts.items()
+            for lemma, data in counts.items()
         ]
 
-        if found_verbs:
-            total_score = sum(score * count for _, score, count, _ in found_verbs)
-            total_count = sum(count for _, _, count, _ in found_verbs)
+        if found:
+            total_score = sum(score * count for _, score, count, _ in found)
+            total_count = sum(count for _, _, count, _ in found)
             avg_score = total_score / total_count
 
             if avg_score >= 60:
-                sentiment = "positiv"
+                sentiment = positive_label
             elif avg_score >= 40:
                 sentiment = "neutral"
             else:
-                sentiment = "negativ"
+                sentiment = negative_label
         else:
             avg_score = 50
             sentiment = "neutral"
 
+        return found, round(avg_score, 1), sentiment
+
+    def _summarize_adjectives(self, adjective_counts, adjective_spans):
+        """Erstellt das Ergebnis-Dictionary der Adjektiv-Analyse"""
+        found_adjectives, avg_score, sentiment = self._summarize_counts(
+            adjective_counts, "positive", "negative"
+        )
+        return {
+            'found_adjectives': found_adjectives,
+            'average_score': avg_score,
+            'sentiment': sentiment,
+            'count': len(adjective_counts),
+            'spans': adjective_spans
+        }
+
+    def _summarize_verbs(self, verb_counts, verb_spans):
+        """Erstellt das Ergebnis-Dictionary der Verb-Analyse"""
+        found_verbs, avg_score, sentiment = self._summarize_counts(
+            verb_counts, "positiv", "negativ"
+        )
         return {
             'found_verbs': found_verbs,
-            'average_score': round(avg_score, 1),
+            'average_score': avg_score,
             'sentiment': sentiment,
-            'count': len(verb_counts)
+            'count': len(verb_counts),
+            'spans': verb_spans
         }
 
     def get_sentiment_category(self, score):
@@ -0,0 +1,106 @@
+# Business Logic - Gemeinsame Trainingsschleife für textcat und textcat_multilabel
+import random
+import time
+from typing import NamedTuple
+
+import spacy
+from spacy.training import Example
+from spacy.util import minibatch
+from thinc.api import compounding
+
+from business_logic.evaluation import evaluate_textcat
+from business_logic.rule_pipeline import RULE_BASE_MODEL, rule_pipeline_exclude
+
+# Batchgrösse wächst von 8 bis 64 Beispiele (Faktor pro Batch)
+BATCH_START = 8.0
+BATCH_STOP = 64.0
+BATCH_COMPOUND = 1.01
+# Wie die bisherigen Trainingsschleifen (nlp.update ohne drop); über TextcatTrainer(dropout=...) einstellbar
+DROPOUT = 0.0
+PATIENCE = 3
+
+
+def create_training_pipeline(tokenizer_model=RULE_BASE_MODEL):
+    """Leere englische Pipeline mit dem Tokenizer des Basismodells (dessen Komponenten werden nicht geladen)"""
+    base = spacy.load(tokenizer_model, exclude=rule_pipeline_exclude(framing=False))
+    nlp = spacy.blank("en")
+    nlp.tokenizer = base.tokenizer
+    return nlp
+
+
+class EpochResult(NamedTuple):
+    """Ergebnis einer Epoche (für Live-Diagramm und Statuszeile)"""
+    epoch: int
+    loss: float
+    evaluation: dict      # Rückgabe von evaluate_textcat()
+    seconds: float        # Laufzeit seit Trainingsbeginn
+    improved: bool        # neuer bester Macro-F1 (Checkpoint gespeichert)
+    stopped: bool         # letzte Epoche wegen Early Stopping
+
+
+class TextcatTrainer:
+    """
+    Trainiert eine textcat- oder textcat_multilabel-Komponente mit gemischten
+    Minibatches (wachsende Batchgrösse), bewertet nach jeder Epoche auf dem
+    Dev-Set und hält die Gewichte der besten Epoche (Macro-F1) im Speicher.
+    Ohne Verbesserung über patience Epochen wird abgebrochen; am Ende
+    werden die besten Gewichte wiederhergestellt.
+    """
+
+    def __init__(self, nlp, component, train_docs, dev_set, multilabel=False, patience=PATIENCE,
+                 dropout=DROPOUT, batch_start=BATCH_START, batch_stop=BATCH_STOP,
+                 batch_compound=BATCH_COMPOUND, seed=None):
+        self.nlp = nlp
+        self.component = component
+        self.dev_set = dev_set
+        self.multilabel = multilabel
+        self.patience = patience
+        self.dropout = dropout
+        self.batch_sizes = compounding(batch_start, batch_stop, batch_compound)
+        self.random = random.Random(seed)
+        # Beispiele einmal erstellen und in jeder Epoche neu mischen
+        self.examples = [Example.from_dict(doc, {"cats": doc.cats}) for doc in train_docs]
+
+        self.best_f1 = -1.0
+        self.best_epoch = 0
+        self.best_evaluation = None
+        self._best_weights = None
+
+    def epochs(self, max_epochs):
+        """Generator: trainiert bis max_epochs oder Early Stopping, liefert ein EpochResult pro Epoche"""
+        nlp = self.nlp
+        optimizer = nlp.initialize(get_examples=lambda: self.examples)
+        proc = nlp.get_pipe(self.component)
+        start = time.perf_counter()
+        epochs_without_improvement = 0
+
+        try:
+            for epoch in range(1, max_epochs + 1):
+                self.random.shuffle(self.examples)
+                losses = {}
+                for batch in minibatch(self.examples, size=self.batch_sizes):
+                    nlp.update(batch, sgd=optimizer, drop=self.dropout, losses=losses)
+
+                evaluation = evaluate_textcat(nlp, self.dev_set, self.component, multilabel=self.multilabel)
+                improved = evaluation['f1_macro'] > self.best_f1
+                if improved:
+                    self.best_f1 = evaluation['f1_macro']
+                    self.best_epoch = epoch
+                    self.best_evaluation = evaluation
+                    self._best_weights = proc.to_bytes()
+                    epochs_without_improvement = 0
+                else:
+                    epochs_without_improvement += 1
+
+                stopped = epochs_without_improvement >= self.patience
+                yield EpochResult(epoch, losses.get(self.component, 0.0), evaluation,
+                                  time.perf_counter() - start, improved, stopped)
+                if stopped:
+                    break
+        finally:
+            self.restore_best()
+
+    def restore_best(self):
+        """Setzt die Komponente auf die Gewichte der besten Epoche zurück"""
+        if self._best_weights is not None:
+            self.nlp.get_pipe(self.component).from_bytes(self._best_weights)
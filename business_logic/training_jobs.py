@@ -0,0 +1,290 @@
+# Business Logic - Trainings-Jobs in einem eigenen Worker-Prozess
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import traceback
+import uuid
+from pathlib import Path
+
+from business_logic.model_registry import MODEL_REGISTRY, save_model_version
+
+# Aufgaben, die trainiert werden können (Komponente, Factory, Daten, Zielmodell)
+TASKS = {
+    "sentiment": {
+        'component': "textcat",
+        'factory': "textcat",
+        'multilabel': False,
+        'labels': ("pos", "neg", "neu"),
+        'train_path': "data/sentiment_train.jsonl",
+        'dev_path': "data/sentiment_dev.jsonl",
+        'model_dir': "models/textcat-mini",
+    },
+    "frames": {
+        'component': "framecat",
+        'factory': "textcat_multilabel",
+        'multilabel': True,
+        'labels': None,  # aus den Trainingsdaten
+        'train_path': "data/frames_train.jsonl",
+        'dev_path': "data/frames_dev.jsonl",
+        'model_dir': "models/frames-mini",
+    },
+}
+
+# Status eines Jobs
+QUEUED = "wartend"
+RUNNING = "läuft"
+DONE = "fertig"
+CANCELLED = "abgebrochen"
+FAILED = "fehler"
+FINISHED = (DONE, CANCELLED, FAILED)
+
+
+class TrainingJob:
+    """Zustand eines Jobs im Streamlit-Prozess (wird aus den Ereignissen des Workers aktualisiert)"""
+
+    def __init__(self, job_id, task, epochs, patience):
+        self.job_id = job_id
+        self.task = task
+        self.epochs = epochs
+        self.patience = patience
+        self.status = QUEUED
+        self.history = []        # ein Dictionary pro Epoche (epoch, loss, accuracy, f1_macro, ...)
+        self.message = ""
+        self.model_dir = None    # Versionsverzeichnis nach erfolgreichem Training
+        self.report = None       # sklearn-Report der besten Epoche
+        self.best_epoch = None
+        self.best_f1 = None
+        self.cache_message = ""  # Hinweis zum DocBin-Cache (Treffer bzw. neu tokenisiert)
+        self.submitted_at = time.time()
+
+    @property
+    def finished(self):
+        return self.status in FINISHED
+
+
+# ----------------------------------------------------
+# Worker-Prozess
+# ----------------------------------------------------
+def _drain(cancel_queue, cancelled):
+    """Übernimmt alle Abbruch-Anfragen aus der Queue in die Menge cancelled"""
+    while True:
+        try:
+            cancelled.add(cancel_queue.get_nowait())
+        except queue.Empty:
+            return
+
+
+def _run_job(job, events, cancel_queue, cancelled):
+    """Trainiert einen Job und meldet jede Epoche; speichert das beste Modell als neue Version"""
+    from business_logic.docbin_cache import cache_summary, cached_docs
+    from business_logic.evaluation import DevSet
+    from business_logic.training import TextcatTrainer, create_training_pipeline
+
+    task = TASKS[job['task']]
+    nlp = create_training_pipeline()
+    train_docs, train_info = cached_docs(nlp, task['train_path'])
+    dev_docs, dev_info = cached_docs(nlp, task['dev_path'])
+    events.put({'job_id': job['job_id'], 'type': "data", 'cache_message': cache_summary([train_info, dev_info])})
+    labels = task['labels'] or sorted({label for doc in train_docs for label in doc.cats})
+
+    textcat = nlp.add_pipe(task['factory'], name=task['component'])
+    for label in labels:
+        textcat.add_label(label)
+    dev_set = DevSet(dev_docs, [doc.cats for doc in dev_docs], labels)
+
+    trainer = TextcatTrainer(nlp, task['component'], train_docs, dev_set, multilabel=task['multilabel'],
+                             patience=job['patience'])
+    epochs = trainer.epochs(job['epochs'])
+    for result in epochs:
+        evaluation = result.evaluation
+        events.put({
+            'job_id': job['job_id'], 'type': "epoch",
+            'metrics': {
+                'epoch': result.epoch,
+                'loss': result.loss,
+                'accuracy': evaluation['accuracy'],
+                'f1_macro': evaluation['f1_macro'],
+                'eval_docs_per_second': evaluation['docs_per_second'],
+                'seconds': result.seconds,
+                'improved': result.improved,
+                'stopped': result.stopped,
+            },
+        })
+        _drain(cancel_queue, cancelled)
+        if job['job_id'] in cancelled:
+            epochs.close()
+            events.put({'job_id': job['job_id'], 'type': "cancelled",
+                        'message': f"Abgebrochen nach Epoche {result.epoch}, Modell nicht gespeichert."})
+            return
+
+    model_dir = save_model_version(nlp, task['model_dir'])
+    events.put({
+        'job_id': job['job_id'], 'type': "done",
+        'model_dir': str(model_dir),
+        'base_dir': task['model_dir'],
+        'best_epoch': trainer.best_epoch,
+        'best_f1': trainer.best_f1,
+        'report': trainer.best_evaluation['report'] if trainer.best_evaluation else None,
+    })
+
+
+def _worker_main(jobs, events, cancel_queue, root_dir):
+    """Einstiegspunkt des Worker-Prozesses: arbeitet die Job-Queue nacheinander ab"""
+    os.chdir(root_dir)
+    cancelled = set()
+    while True:
+        job = jobs.get()
+        if job is None:
+            return
+        _drain(cancel_queue, cancelled)
+        if job['job_id'] in cancelled:
+            events.put({'job_id': job['job_id'], 'type': "cancelled", 'message': "Abgebrochen, bevor das Training begann."})
+            continue
+        events.put({'job_id': job['job_id'], 'type': "started"})
+        try:
+            _run_job(job, events, cancel_queue, cancelled)
+        except Exception as e:
+            events.put({'job_id': job['job_id'], 'type': "error", 'message': f"{e}",
+                        'traceback': traceback.format_exc()})
+
+
+# ----------------------------------------------------
+# Steuerung im Streamlit-Prozess
+# ----------------------------------------------------
+class TrainingJobRunner:
+    """
+    Führt Trainings in einem eigenen Prozess aus, damit die Streamlit-Session
+    nicht blockiert und ein Training weiterläuft, wenn der Browser die
+    Verbindung verliert. Jobs werden nacheinander abgearbeitet (Job-Queue),
+    der Worker meldet jede Epoche über eine Ereignis-Queue; ein Thread im
+    Streamlit-Prozess überträgt die Ereignisse in die TrainingJob-Objekte.
+    Abbrechen wirkt nach der laufenden Epoche.
+    """
+
+    def __init__(self, root_dir=None):
+        self.root_dir = str(root_dir or Path(__file__).parent.parent)
+        self._context = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._process = None
+        self._job_queue = None
+        self._event_queue = None
+        self._cancel_queue = None
+        self._listener = None
+
+    def _ensure_worker(self):
+        """Startet den Worker (neu), falls er nicht läuft; offene Jobs werden neu eingereiht"""
+        if self._process is not None and self._process.is_alive():
+            return
+        context = self._context
+        self._job_queue = context.Queue()
+        self._event_queue = context.Queue()
+        self._cancel_queue = context.Queue()
+        self._process = context.Process(
+            target=_worker_main,
+            args=(self._job_queue, self._event_queue, self._cancel_queue, self.root_dir),
+            name="training-worker",
+            daemon=True,
+        )
+        self._process.start()
+        for job in self._jobs.values():
+            if job.status == RUNNING:
+                job.status, job.message = FAILED, "Worker-Prozess wurde beendet."
+            elif job.status == QUEUED:
+                self._job_queue.put(self._job_message(job))
+
+        self._listener = threading.Thread(target=self._listen, args=(self._process, self._event_queue),
+                                          name="training-events", daemon=True)
+        self._listener.start()
+
+    @staticmethod
+    def _job_message(job):
+        return {'job_id': job.job_id, 'task': job.task, 'epochs': job.epochs, 'patience': job.patience}
+
+    def submit(self, task, epochs, patience):
+        """Reiht ein Training ein und gibt die Job-ID zurück"""
+        if task not in TASKS:
+            raise ValueError(f"Unbekannte Trainingsaufgabe '{task}'")
+        job = TrainingJob(uuid.uuid4().hex[:8], task, int(epochs), int(patience))
+        with self._lock:
+            self._jobs[job.job_id] = job
+            if self._process is not None and self._process.is_alive():
+                self._job_queue.put(self._job_message(job))
+            else:
+                self._ensure_worker()
+        return job.job_id
+
+    def cancel(self, job_id):
+        """Bricht einen wartenden oder laufenden Job ab (laufende nach der aktuellen Epoche)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.finished:
+                return
+            job.message = "Abbruch angefordert..."
+            if self._process is not None and self._process.is_alive():
+                self._cancel_queue.put(job_id)
+            else:
+                job.status = CANCELLED
+
+    def get(self, job_id):
+        return self._jobs.get(job_id)
+
+    def _listen(self, process, events):
+        """Überträgt die Ereignisse des Workers in die Job-Zustände"""
+        while True:
+            try:
+                event = events.get(timeout=1.0)
+            except queue.Empty:
+                if not process.is_alive():
+                    with self._lock:
+                        for job in self._jobs.values():
+                            if job.status == RUNNING:
+                                job.status, job.message = FAILED, "Worker-Prozess wurde unerwartet beendet."
+                    return
+                continue
+            with self._lock:
+                self._apply(event)
+
+    def _apply(self, event):
+        job = self._jobs.get(event['job_id'])
+        if job is None:
+            return
+        kind = event['type']
+        if kind == "started":
+            job.status = RUNNING
+            job.message = ""
+        elif kind == "data":
+            job.cache_message = event['cache_message']
+        elif kind == "epoch":
+            job.history.append(event['metrics'])
+        elif kind == "done":
+            job.status = DONE
+            job.model_dir = event['model_dir']
+            job.best_epoch = event['best_epoch']
+            job.best_f1 = event['best_f1']
+            job.report = event['report']
+            job.message = f"Beste Epoche {job.best_epoch} (F1-Macro {job.best_f1:.4f}) gespeichert in {job.model_dir}"
+            # Geladene Pipelines mit diesem Modell beim nächsten Zugriff neu laden
+            MODEL_REGISTRY.invalidate(event['base_dir'])
+        elif kind == "cancelled":
+            job.status = CANCELLED
+            job.message = event['message']
+        elif kind == "error":
+            job.status = FAILED
+            job.message = event['message']
+            print(event.get('traceback', ""))
+
+
+_runner = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner():
+    """Ein Job-Runner pro Streamlit-Prozess (von allen Sessions geteilt)"""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = TrainingJobRunner()
+        return _runner
@@ -15,10 +15,27 @@ from business_logic import text_analyzer
 # usw.
 
 
+import html
+import pandas as pd
 import streamlit as st
+from business_logic.sentiment_timeline import split_sentences
 from business_logic.text_analyzer import TextAnalyzer
 
 
+def highlight_spans(text, spans):
+    """Markiert die (start, ende, farbe)-Bereiche im Text als HTML"""
+    parts = []
+    position = 0
+    for start, end, color in sorted(spans):
+        if start < position:
+            continue  # Wort ist Adjektiv und Verb: nur einmal markieren
+        parts.append(html.escape(text[position:start]))
+        parts.append(f"<mark style='background-color: {color};'>{html.escape(text[start:end])}</mark>")
+        position = end
+    parts.append(html.escape(text[position:]))
+    return "".join(parts).replace("\n", "<br>")
+
+
 st.set_page_config(
     page_title="Basic Text Analyzer",
     page_icon="📑",
@@ -76,6 +93,10 @@ if 'first_name' not in st.session_state:
     st.session_state.first_name = ""
 if 'last_name' not in st.session_state:
     st.session_state.last_name = ""
+if 'paragraph_cache' not in st.session_state:
+    st.session_state.paragraph_cache = {}
+if 'timeline' not in st.session_state:
+    st.session_state.timeline = None
 
 # Titel und Beschreibung
 col1, col2 = st.columns([1, 8])
@@ -86,6 +107,7 @@ with col2:
 st.markdown("""
 Analysiere deinen Text basierend auf Adjektiven und/oder Verben. Achtung: Nur englischsprachige Texte können berücksichtigt werden.
 Die Analyse verwendet Lemmatisierung, um verschiedene Wortformen zu erkennen (z.B. "running" → "run", "loved" → "love").
+Mehrwort-Ausdrücke ("fell apart") werden als Ganzes bewertet, Verneinungen und Verstärker ("not very good") verändern den Score des folgenden Worts.
 """)
 st.markdown("---")
 
@@ -134,6 +156,8 @@ if clear_button:
     st.session_state.lemmatized = []
     st.session_state.first_name = ""
     st.session_state.last_name = ""
+    st.session_state.paragraph_cache = {}
+    st.session_state.timeline = None
     st.rerun()
 
 # Analyse durchführen
@@ -146,14 +170,19 @@ if analyze_button:
 
         # Analyse durchführen
         with st.spinner("Text wird analysiert..."):
-            found_fillers = analyzer.extract_filler_words(text)
-            clean_text = analyzer.remove_filler_words(text)
-            adjective_results = analyzer.analyze_adjectives(text)
-            verb_results = analyzer.analyze_verbs(text)
+            # Ein einziger Durchlauf; unveränderte Absätze kommen aus dem Cache
+            results = analyzer.analyze_incremental(text, st.session_state.paragraph_cache)
+            found_fillers = results['filler_words']
+            clean_text = results['clean_text']
+            adjective_results = results['adjective_results']
+            verb_results = results['verb_results']
+
+            # Scores pro Token mit Präfixsummen (übernimmt die Fundstellen, keine zweite Analyse)
+            timeline = analyzer.sentiment_timeline(text, results)
 
             # Lemmatisierung für Anzeige (optional)
             if show_lemmatization:
-                lemmatized = analyzer.lemmatize_text(text)
+                lemmatized = results['lemmatized']
             else:
                 lemmatized = []
 
@@ -163,11 +192,17 @@ if analyze_button:
         st.session_state.adjective_results = adjective_results
         st.session_state.verb_results = verb_results
         st.session_state.lemmatized = lemmatized
+        st.session_state.timeline = timeline
         st.session_state.first_name = first_name
         st.session_state.last_name = last_name
 
         # Erfolgsmeldung
-        st.success("Analyse abgeschlossen.")
+        paragraph_stats = results['paragraph_stats']
+        if paragraph_stats['reused']:
+            st.success(f"Analyse abgeschlossen. {paragraph_stats['analyzed']} von "
+                       f"{paragraph_stats['paragraphs']} Absätzen wurden neu analysiert.")
+        else:
+            st.success("Analyse abgeschlossen.")
 
 # Ergebnisse anzeigen (wenn Analyse durchgeführt wurde)
 if st.session_state.analysis_done:
@@ -209,6 +244,16 @@ if st.session_state.analysis_done:
         else:
             st.info("Keine Lemmatisierung nötig, da alle Wörter bereits in ihrer Grundform.")
 
+    # Fundstellen im Text markieren (Offsets aus der Analyse, kein erneutes Suchen)
+    marked_spans = []
+    if show_adjectives:
+        marked_spans += [(start, end, "#FFE08A") for start, end, _ in st.session_state.adjective_results.get('spans', [])]
+    if show_verbs:
+        marked_spans += [(start, end, "#A8D8FF") for start, end, _ in st.session_state.verb_results.get('spans', [])]
+    if marked_spans:
+        with st.expander("Fundstellen im Text anzeigen (gelb = Adjektive, blau = Verben)"):
+            st.markdown(highlight_spans(st.session_state.text, marked_spans), unsafe_allow_html=True)
+
     # Adjektiv-Analyse
     if show_adjectives and st.session_state.adjective_results.get('count', 0) > 0:
         st.markdown("---")
@@ -366,6 +411,40 @@ if st.session_state.analysis_done:
                 help="Durchschnitt aus Adjektiv- und Verb-Sentiment"
             )
 
+    # Stimmungsverlauf über die Textposition
+    timeline = st.session_state.timeline
+    kinds = [kind for kind, shown in (("adjective", show_adjectives), ("verb", show_verbs)) if shown]
+    if timeline is not None and kinds and any(timeline.window(0, len(timeline), kind)[1] for kind in kinds):
+        st.markdown("---")
+        st.subheader("Stimmungsverlauf")
+
+        n_tokens = len(timeline)
+        window_size = st.slider(
+            "Fenstergrösse (Wörter)", min_value=1, max_value=max(2, n_tokens),
+            value=min(n_tokens, max(20, n_tokens // 10)),
+            help="Durchschnittsscore über ein gleitendes Fenster; Lücken = keine Treffer im Fenster"
+        )
+        # Höchstens ~300 Punkte zeichnen, jedes Fenster kostet dank Präfixsummen O(1)
+        step = max(1, (n_tokens - window_size) // 300)
+
+        series = {"Adjektive": "adjective", "Verben": "verb"}
+        series = {label: kind for label, kind in series.items() if kind in kinds}
+        if len(kinds) == 2:
+            series["Gesamt"] = None
+        chart_data = {}
+        positions = []
+        for label, kind in series.items():
+            averages = timeline.sliding_averages(window_size, step, kind)
+            positions = [start for start, _ in averages]
+            chart_data[label] = [average for _, average in averages]
+        st.line_chart(pd.DataFrame(chart_data, index=pd.Index(positions, name="Wortposition")))
+
+        with st.expander("Score pro Satz anzeigen"):
+            kind = kinds[0] if len(kinds) == 1 else None
+            for start, end, average in timeline.span_averages(split_sentences(st.session_state.text), kind):
+                if average is not None:
+                    st.write(f"**{average:.0f}**: {st.session_state.text[start:end]}")
+
 
 # Footer
 st.markdown("---")
@@ -2,16 +2,7 @@ import sys
 import os
 from pathlib import Path
 import streamlit as st
-import spacy
-from spacy.tokens import DocBin
-from spacy.training import Example
-from spacy.util import minibatch
-import random
-import numpy as np
-import json
 import pandas as pd
-from typing import Dict, List
-from sklearn.metrics import f1_score, classification_report, accuracy_score
 
 # --- PFAD-FIX START (Robust für Streamlit Multi-Page Apps) ---
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -27,7 +18,12 @@ if root_dir not in sys.path:
 components_available = False
 try:
     # Nur der Import registriert die @Language.factory-Komponenten bei SpaCy
-    from business_logic.components import create_framing_component, create_sentiment_rule
+    from business_logic.components import FRAME_LABELS, create_framing_component, create_sentiment_rule, load_frame_cues
+    from business_logic.rule_pipeline import rule_model_path
+    from business_logic.composed_pipeline import create_composed_pipeline
+    from business_logic.model_registry import MODEL_REGISTRY, get_model, model_exists
+    from business_logic.training import PATIENCE
+    from business_logic.training_jobs import FAILED, RUNNING, get_job_runner
     components_available = True
 except ImportError as e:
     st.error(f"FATAL: Konnte Komponenten nicht importieren. Fehler: {e}") 
@@ -92,6 +88,57 @@ Hier können die NLP-Modelle trainiert und die gesamte Pipeline getestet werden.
 Diese Seite dient auch dazu, die zugrundeliegenden Prozesse der Sprachverarbeitung mit NLP zu verstehen.
 """)
 
+# ------------------------------------------------------------------------------
+# TRAININGS-JOBS (Worker-Prozess, von allen Sessions geteilt)
+# ------------------------------------------------------------------------------
+job_runner = get_job_runner()
+
+
+@st.fragment(run_every=1.0)
+def show_training_job(session_key, chart_columns, show_report=False):
+    """Zeigt Fortschritt, Live-Diagramm und Ergebnis des Jobs dieser Session (aktualisiert sich jede Sekunde)"""
+    job = job_runner.get(st.session_state.get(session_key))
+    if job is None:
+        return
+
+    if job.cache_message:
+        st.info(job.cache_message)
+
+    if job.history:
+        # Live-Diagramm (Loss normalisiert)
+        df_metrics = pd.DataFrame(job.history).set_index("epoch")[chart_columns]
+        df_metrics['loss'] = df_metrics['loss'] / max(df_metrics['loss'].max(), 1)
+        st.line_chart(df_metrics)
+        last = job.history[-1]
+        st.progress(min(last['epoch'] / job.epochs, 1.0) if not job.finished else 1.0)
+        st.text(f"Epoche {last['epoch']}/{job.epochs} | Loss: {last['loss']:.4f} | Accuracy: {last['accuracy']:.2%} "
+                f"| F1-Macro: {last['f1_macro']:.4f} | Evaluation: {last['eval_docs_per_second']:.0f} Dok/s")
+        if last['stopped']:
+            st.info(f"Early Stopping nach Epoche {last['epoch']}: {job.patience} Epochen ohne Verbesserung.")
+
+    if not job.finished:
+        waiting = "Training läuft..." if job.status == RUNNING else "Training wartet auf den Worker..."
+        st.markdown(f"*{job.message or waiting}*")
+        if st.button("Training abbrechen", key=f"cancel_{session_key}"):
+            job_runner.cancel(job.job_id)
+    elif job.status == FAILED:
+        st.error(f"Fehler: {job.message}")
+    elif job.model_dir:
+        st.success(f"Training abgeschlossen! {job.message}")
+        if show_report and job.report:
+            st.markdown("**Detaillierter Abschlussbericht:**")
+            st.dataframe(pd.DataFrame(job.report).transpose(), width='stretch')
+    else:
+        st.warning(job.message)
+
+
+@st.cache_data
+def frame_cue_examples(per_frame=4):
+    """Frames (in der Reihenfolge von FRAME_LABELS) mit einigen Stichwörtern aus frame_cues.csv"""
+    cues = load_frame_cues()
+    return [(label.replace("_", " ").title(), sorted(cues[label])[:per_frame]) for label in FRAME_LABELS]
+
+
 # Tabs für die verschiedenen Funktionen
 tab_run, tab_train_sent, tab_train_frames = st.tabs(["Pipeline Ausführen", "Sentiment Model trainieren", "Framing Model trainieren"])
 
@@ -109,7 +156,7 @@ with tab_run:
 
     sent_model_path = Path("models/textcat-mini")
     frames_model_path = Path("models/frames-mini")
-    models_exist = sent_model_path.exists() and frames_model_path.exists()
+    models_exist = model_exists(sent_model_path) and model_exists(frames_model_path)
 
 
     if not models_exist:
@@ -137,7 +184,7 @@ with tab_run:
         st.markdown("1. **Tokenizer:** Der Satz wird in einzelne Wörter (Tokens) zerlegt. Aus 'It's' wird 'It' und ''s'.")
         st.markdown(" ")
         st.markdown(" ")
-        st.markdown("2. **Tagger & Parser:** Die Grammatik wird analysiert. Das Modell erkennt Verben, Substantive und deren Beziehung zueinander. ")
+        st.markdown("2. **Tagger & Lemmatizer:** Der Tagger bestimmt die Wortart jedes Tokens (Verb, Substantiv, Adjektiv, ...), der Lemmatizer führt die Wörter auf ihre Grundform zurück. Parser und Named Entity Recognition werden nicht geladen, da die Analyse sie nicht benötigt.")
         st.markdown(" ")
         st.markdown(" ")
         st.markdown("3. **Stopwords:** Unwichtige Füllwörter (wie 'the', 'is', 'at') werden markiert, damit sich das Modell auf den Inhalt konzentriert.")
@@ -145,7 +192,10 @@ with tab_run:
         st.markdown(" ")
         st.markdown("4. **TextCat (Text Categorizer):** Hier greifen die trainierten Modelle. Sie weisen dem gesamten Text Wahrscheinlichkeiten für bestimmte Kategorien (Positiv/Negativ oder Frames) zu.")
         st.markdown(" ")
-        st.markdown("5. **Custom Components:** Custom Components: Am Schluss laufen die eigenen Module für Sentiment und Framing. Das Sentiment-Modul durchsucht den Text nach positiven Begriffen wie great, good, excellent, love, amazing sowie nach negativen Begriffen wie bad, terrible, hate, awful, waste. Das Framing-Modul analysiert, ob der Text Begriffe enthält, die auf bestimmte Frames hinweisen. Beispiele: Konfliktframe mit vs, battle, fight, clash, Wirtschaftsframe mit cost, market, jobs, growth, workloads, Human Interest Frame mit child, family, story, heart. Hier wird das gleiche Vorgehen wie bei den Regeln in Phase 1 angewendet.")
+        st.markdown("5. **Custom Components:** Custom Components: Am Schluss laufen die eigenen Module für Sentiment und Framing. Das Sentiment-Modul durchsucht den Text nach positiven Begriffen wie great, good, excellent, love, amazing sowie nach negativen Begriffen wie bad, terrible, hate, awful, waste. Das Framing-Modul analysiert, ob der Text Begriffe enthält, die auf bestimmte Frames hinweisen. Hier wird das gleiche Vorgehen wie bei den Regeln in Phase 1 angewendet.")
+        frame_examples = frame_cue_examples()
+        st.markdown(f"Das Framing-Modul kennt {len(frame_examples)} Frames (Beispiele aus frame_cues.csv):")
+        st.markdown("\n".join(f"* **{label}:** {', '.join(cues)}" for label, cues in frame_examples))
 
         
     st.markdown("---")
@@ -160,29 +210,22 @@ with tab_run:
     if pipeline_button and models_exist:
         with st.spinner("Pipeline läuft... Tokenisierung... Analyse..."):
             try:
-                # 1. ML-Modelle laden (minimal)
-                nlp_sent = spacy.load("models/textcat-mini")
-                nlp_frames = spacy.load("models/frames-mini")
-
-                # 2. Regel-Pipeline erstellen (mit vollem englischen Modell für Lemmatisierung)
-                nlp_rules = spacy.load("en_core_web_sm")
-                
-                # 3. Custom Components zur Regel-Pipeline hinzufügen
-                if components_available:
-                    if "framing_component" not in nlp_rules.pipe_names:
-                        nlp_rules.add_pipe("framing_component", last=True) 
-                    if "sentiment_rule" not in nlp_rules.pipe_names:
-                        nlp_rules.add_pipe("sentiment_rule", last=True)
-                
-                # 4. Analyse durchführen
-                d_sent = nlp_sent(user_text)    # ML Sentiment Doc
-                d_frames = nlp_frames(user_text) # ML Frame Doc
-                d_rules = nlp_rules(user_text)  # Rule-Based Doc (mit Lemmatizer)
+                # 1. Eine Pipeline für alles laden (einmal pro Prozess, neu nur nach einem Training):
+                #    textcat (textcat-mini), framecat (frames-mini), Lemmatizer aus en_core_web_sm
+                #    ohne parser/ner und die Custom Components
+                nlp = get_model((sent_model_path, frames_model_path, rule_model_path()),
+                                loader=create_composed_pipeline)
+
+                # 2. Analyse durchführen: ein Tokenizer-Durchlauf füllt doc.cats und doc._
+                doc = nlp(user_text)
+                d_rules = doc  # Rule-Based (mit Lemmatizer)
+                sent_cats = {label: doc.cats[label] for label in nlp.get_pipe("textcat").labels}
+                frame_cats = {label: doc.cats[label] for label in nlp.get_pipe("framecat").labels}
 
                 # Ergebnisse extrahieren (ML)
-                sent_pred = max(d_sent.cats, key=d_sent.cats.get)
-                sent_score = d_sent.cats[sent_pred]
-                frames_pred = {k: float(v) for k, v in d_frames.cats.items() if v >= 0.5}
+                sent_pred = max(sent_cats, key=sent_cats.get)
+                sent_score = sent_cats[sent_pred]
+                frames_pred = {k: float(v) for k, v in frame_cats.items() if v >= 0.5}
 
                 # Darstellung
                 st.subheader("Analyse Ergebnisse (ML Modelle)")
@@ -200,7 +243,7 @@ with tab_run:
                             st.warning(f"Klasse: {sent_pred.upper()} ({sent_score:.2%})")
                     
                     with st.expander("Details anzeigen"):
-                        st.json(d_sent.cats)
+                        st.json(sent_cats)
 
                     # Custom Rule-Based Output (Sentiment)
                     if components_available and d_rules.has_extension("sentiment_rule"):
@@ -224,7 +267,7 @@ with tab_run:
                     else:
                         st.write("Keine dominanten Frames gefunden.")
                     with st.expander("Details anzeigen"):
-                        st.json(d_frames.cats)
+                        st.json(frame_cats)
                         
                     # Custom Rule-Based Output (Framing)
                     if components_available and d_rules.has_extension("frames"):
@@ -245,6 +288,15 @@ with tab_run:
             except Exception as e:
                 st.error(f"Fehler beim Ausführen: {e}")
 
+    # Geladene Modelle (prozessweit geteilt, über alle Sessions)
+    model_stats = MODEL_REGISTRY.stats()
+    if model_stats:
+        with st.expander(f"Geladene Modelle ({len(model_stats)})"):
+            st.dataframe(pd.DataFrame(model_stats).rename(columns={
+                'name': 'Modell', 'version': 'Version', 'pipe_names': 'Komponenten',
+                'load_seconds': 'Ladezeit (s)', 'loaded_at': 'Geladen um', 'hits': 'Aufrufe',
+            }), width='stretch', hide_index=True)
+
 # -----------------------------------------------------------------------------
 # TAB 2: SENTIMENT TRAINING
 # -----------------------------------------------------------------------------
@@ -278,109 +330,21 @@ with tab_train_sent:
         ### 3. Was passiert in einem Trainings-Zyklus (Epoche)?
         Eine Epoche bedeutet, dass das Modell alle Trainingsdaten einmal gesehen hat.
         1.  **Shuffle:** Daten mischen, damit das Modell nicht die Reihenfolge auswendig lernt.
-        2.  **Mini-Batch:** Wir nehmen eine kleine Gruppe Texte (z.B. 8 Stück).
+        2.  **Mini-Batch:** Wir nehmen eine kleine Gruppe Texte. Die Gruppen wachsen im Lauf des Trainings von 8 auf 64 Texte: zuerst viele kleine, schnelle Schritte, später stabilere.
         3.  **Prediction (Vorhersage):** Das Modell rät für diese 8 Texte.
         4.  **Loss Berechnung:** Wir vergleichen das Raten mit der Lösung.
         5.  **Backpropagation (Lernen):** Das ist der wichtigste Schritt! Man rechnnet zurück: *"Welches Gewicht war schuld am Fehler?"* und gewichten es ein winziges Stück weniger oder mehr (Gradient Descent).
         """)
 
     epochs_sent = st.number_input("Anzahl Epochen (Durchläufe)", min_value=1, max_value=50, value=10, key="epochs_sent")
+    patience_sent = st.number_input("Early Stopping: Abbruch nach so vielen Epochen ohne Verbesserung (F1-Macro)",
+                                    min_value=1, max_value=50, value=PATIENCE, key="patience_sent")
     
     if st.button("Training starten (Sentiment)", key="btn_train_sent"):
-        
-        # UI Elemente für Live-Updates
-        chart_placeholder = st.empty()
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        # Datenspeicher für Diagramm
-        metrics_history = {"epoch": [], "loss": [], "accuracy": []}
-
-        # Hilfsfunktionen
-        def read_jsonl(path):
-            for line in Path(path).read_text(encoding="utf-8").splitlines():
-                yield json.loads(line)
-
-        def make_docbin(nlp, path):
-            db = DocBin()
-            for ex in read_jsonl(path):
-                doc = nlp.make_doc(ex["text"])
-                doc.cats = ex["cats"]
-                db.add(doc)
-            return db
-
-        def evaluate_model(nlp, docs):
-            correct = 0
-            total = 0
-            for d in docs:
-                pred = nlp(d.text)
-                p = max(pred.cats, key=pred.cats.get)
-                g = max(d.cats, key=d.cats.get)
-                correct += int(p == g)
-                total += 1
-            return correct / max(total, 1)
-
-        try:
-            with st.spinner("Daten werden gelernt..."):
-                # Setup
-                base = spacy.load("en_core_web_sm")
-                nlp = spacy.blank("en")
-                nlp.tokenizer = base.tokenizer
-
-                if "textcat" not in nlp.pipe_names:
-                    textcat = nlp.add_pipe("textcat")
-                    textcat.add_label("pos")
-                    textcat.add_label("neg")
-                    textcat.add_label("neu")
-
-                # Daten laden
-                if not os.path.exists("data/sentiment_train.jsonl"):
-                    st.error("Trainingsdaten fehlen!")
-                    st.stop()
-                
-                train_db = make_docbin(nlp, "data/sentiment_train.jsonl")
-                dev_db = make_docbin(nlp, "data/sentiment_dev.jsonl")
-                train_docs = list(train_db.get_docs(nlp.vocab))
-                dev_docs = list(dev_db.get_docs(nlp.vocab))
+        # Training läuft im Worker-Prozess; die Seite bleibt bedienbar
+        st.session_state["job_sent"] = job_runner.submit("sentiment", epochs_sent, patience_sent)
 
-                optimizer = nlp.initialize(get_examples=lambda: (Example.from_dict(d, {"cats": d.cats}) for d in train_docs))
-
-                # Trainings-Loop
-                for epoch in range(epochs_sent):
-                    random.shuffle(train_docs)
-                    losses = {}
-                    
-                    # Batch Training
-                    for batch in minibatch(train_docs, size=8):
-                        examples = [Example.from_dict(d, {"cats": d.cats}) for d in batch]
-                        nlp.update(examples, sgd=optimizer, losses=losses)
-
-                    # Metriken berechnen
-                    current_loss = losses.get('textcat', 0)
-                    current_acc = evaluate_model(nlp, dev_docs)
-                    
-                    # Historie updaten
-                    metrics_history["epoch"].append(epoch + 1)
-                    metrics_history["loss"].append(current_loss)
-                    metrics_history["accuracy"].append(current_acc)
-                    
-                    # Live-Diagramm zeichnen (Loss normalisiert)
-                    df_metrics = pd.DataFrame(metrics_history).set_index("epoch")
-                    df_metrics['loss'] = df_metrics['loss'] / max(df_metrics['loss'].max(), 1)
-                    chart_placeholder.line_chart(df_metrics)
-                    
-                    
-                    status_text.text(f"Epoche {epoch+1}/{epochs_sent} | Loss: {current_loss:.4f} | Accuracy: {current_acc:.2%}")
-                    progress_bar.progress((epoch + 1) / epochs_sent)
-
-                # Speichern
-                output_dir = Path("models/textcat-mini")
-                output_dir.mkdir(parents=True, exist_ok=True)
-                nlp.to_disk(output_dir)
-                st.success(f"Training abgeschlossen! Modell gespeichert in: {output_dir}")
-
-        except Exception as e:
-            st.error(f"Fehler: {e}")
+    show_training_job("job_sent", ["loss", "accuracy", "f1_macro"])
 
 # -----------------------------------------------------------------------------
 # TAB 3: FRAMES TRAINING
@@ -402,109 +366,13 @@ with tab_train_frames:
         """)
 
     epochs_frames = st.number_input("Anzahl Epochen", min_value=1, max_value=50, value=12, key="epochs_frames")
+    patience_frames = st.number_input("Early Stopping: Abbruch nach so vielen Epochen ohne Verbesserung (F1-Macro)",
+                                      min_value=1, max_value=50, value=PATIENCE, key="patience_frames")
 
     if st.button("Training starten (Frames)", key="btn_train_frames"):
-        
-        chart_placeholder_f = st.empty()
-        progress_bar_f = st.progress(0)
-        status_text_f = st.empty()
-        
-        # Wir tracken hier Loss und den Macro-F1 Score
-        metrics_history_f = {"epoch": [], "loss": [], "f1_macro": []}
-
-        # Hilfsfunktionen für Frames
-        def read_jsonl_f(path):
-            lines = Path(path).read_text(encoding="utf-8").splitlines()
-            return [json.loads(li) for li in lines]
-
-        def collect_labels(examples):
-            labels = set()
-            for ex in examples:
-                for k in ex["cats"].keys():
-                    labels.add(k)
-            return sorted(labels)
-        
-        def to_y(examples, labels):
-            y = []
-            for ex in examples:
-                y.append([int(round(ex["cats"].get(lbl, 0.0))) for lbl in labels])
-            return np.array(y, dtype=int)
-
-        def predict_multilabel(nlp, examples, labels, threshold=0.5):
-            y_pred = []
-            for ex in examples:
-                doc = nlp(ex["text"])
-                row = []
-                for lbl in labels:
-                    p = float(doc.cats.get(lbl, 0.0))
-                    row.append(1 if p >= threshold else 0)
-                y_pred.append(row)
-            return np.array(y_pred, dtype=int)
-
-        try:
-            with st.spinner("Training läuft..."):
-                base = spacy.load("en_core_web_sm")
-                nlp = spacy.blank("en")
-                nlp.tokenizer = base.tokenizer
-
-                if not os.path.exists("data/frames_train.jsonl"):
-                    st.error("Daten fehlen!")
-                    st.stop()
-
-                train_raw = read_jsonl_f("data/frames_train.jsonl")
-                dev_raw = read_jsonl_f("data/frames_dev.jsonl")
-                labels = collect_labels(train_raw)
-
-                if "framecat" not in nlp.pipe_names:
-                    textcat = nlp.add_pipe("textcat_multilabel", name="framecat")
-                    for lbl in labels:
-                        textcat.add_label(lbl)
-
-                train_examples = [Example.from_dict(nlp.make_doc(ex["text"]), {"cats": ex["cats"]}) for ex in train_raw]
-                
-                optimizer = nlp.initialize(get_examples=lambda: train_examples)
+        st.session_state["job_frames"] = job_runner.submit("frames", epochs_frames, patience_frames)
 
-                for epoch in range(epochs_frames):
-                    losses = {}
-                    # Update (hier vereinfacht ohne Minibatch-Loop für Übersichtlichkeit, aber intern optimiert Spacy)
-                    nlp.update(train_examples, sgd=optimizer, losses=losses)
-                    
-                    # Metriken berechnen
-                    loss_val = losses.get('framecat', 0)
-                    
-                    # Schnelle Evaluation auf Dev-Set für Diagramm
-                    y_true = to_y(dev_raw, labels)
-                    y_pred = predict_multilabel(nlp, dev_raw, labels)
-                    f1 = f1_score(y_true, y_pred, average='macro', zero_division=0)
-
-                    # Historie
-                    metrics_history_f["epoch"].append(epoch + 1)
-                    metrics_history_f["loss"].append(loss_val)
-                    metrics_history_f["f1_macro"].append(f1)
-
-                    # Update Chart (Loss normalisiert)
-                    df_f = pd.DataFrame(metrics_history_f).set_index("epoch")
-                    df_f['loss'] = df_f['loss'] / max(df_f['loss'].max(), 1)
-                    chart_placeholder_f.line_chart(df_f)
-                    
-                    
-                    status_text_f.text(f"Epoche {epoch+1}/{epochs_frames} | Loss: {loss_val:.4f} | F1-Macro: {f1:.4f}")
-                    progress_bar_f.progress((epoch + 1) / epochs_frames)
-
-                # Speichern
-                out_dir = Path("models/frames-mini")
-                out_dir.mkdir(parents=True, exist_ok=True)
-                nlp.to_disk(out_dir)
-                st.success(f"Training fertig! Gespeichert in {out_dir}")
-                
-                # Abschlussbericht
-                st.markdown("**Detaillierter Abschlussbericht:**")
-                report_dict = classification_report(y_true, y_pred, target_names=labels, zero_division=0, output_dict=True)
-                report_df = pd.DataFrame(report_dict).transpose()
-                st.dataframe(report_df, width='stretch')
-
-        except Exception as e:
-            st.error(f"Fehler: {e}")
+    show_training_job("job_frames", ["loss", "f1_macro"], show_report=True)
 
 # Footer
 st.markdown("---")
@@ -0,0 +1,130 @@
+import csv
+import json
+import sys
+import time
+from enum import Enum
+from itertools import islice
+from pathlib import Path
+
+import typer
+
+# ----------------------------------------------------
+# 1. SETUP & PFADE
+# ----------------------------------------------------
+# Batch-Inferenz mit models/textcat-mini und models/frames-mini ausserhalb von Streamlit,
+# z.B. für das nächtliche Scoring des ganzen Archivs. Die Eingabe (JSONL oder CSV) wird
+# gestreamt, durch nlp.pipe() geschickt und Zeile für Zeile als JSONL geschrieben:
+# der Speicherbedarf hängt nicht von der Grösse der Datei ab.
+# Aufruf aus dem Projektverzeichnis:
+#   python scripts/batch_inference.py archiv.jsonl vorhersagen.jsonl --batch-size 256 --n-process 4
+#   python scripts/batch_inference.py archiv.csv vorhersagen.jsonl --text-field body --id-field article_id
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from business_logic.composed_pipeline import (
+    FRAMES_MODEL_DIR,
+    SENT_MODEL_DIR,
+    create_composed_pipeline,
+    create_ml_pipeline,
+)
+from business_logic.model_registry import resolve_model_dir
+from business_logic.rule_pipeline import RULE_BASE_MODEL
+
+app = typer.Typer(add_completion=False, help="Batch-Inferenz für Sentiment- und Frame-Modelle")
+
+
+class InputFormat(str, Enum):
+    auto = "auto"
+    jsonl = "jsonl"
+    csv = "csv"
+
+
+def iter_records(path, input_format, text_field, id_field):
+    """Liest (id, text)-Paare aus einer JSONL- oder CSV-Datei, eine Zeile nach der anderen"""
+    if input_format == InputFormat.auto:
+        input_format = InputFormat.csv if path.suffix.lower() == ".csv" else InputFormat.jsonl
+
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        if input_format == InputFormat.csv:
+            rows = enumerate(csv.DictReader(file), start=2)  # Zeile 1 ist der Header
+        else:
+            rows = ((line_no, json.loads(line)) for line_no, line in enumerate(file, start=1) if line.strip())
+        for line_no, record in rows:
+            text = record.get(text_field)
+            if text is None:
+                raise typer.BadParameter(f"Feld '{text_field}' fehlt in Zeile {line_no} von {path}")
+            yield record.get(id_field, line_no), text
+
+
+def prediction(doc, record_id, sent_labels, frame_labels, threshold):
+    """Eine Ausgabezeile: Sentiment-Klasse, Frames über dem Schwellwert und alle Wahrscheinlichkeiten"""
+    sentiment = {label: round(doc.cats[label], 6) for label in sent_labels}
+    frames = {label: round(doc.cats[label], 6) for label in frame_labels}
+    result = {
+        'id': record_id,
+        'sentiment': max(sentiment, key=sentiment.get),
+        'sentiment_scores': sentiment,
+        'frames': [label for label, score in frames.items() if score >= threshold],
+        'frame_scores': frames,
+    }
+    return result
+
+
+@app.command()
+def main(
+    input_path: Path = typer.Argument(..., exists=True, dir_okay=False, help="Eingabe (JSONL oder CSV)"),
+    output_path: Path = typer.Argument(..., dir_okay=False, help="Ausgabe (JSONL, eine Vorhersage pro Zeile)"),
+    input_format: InputFormat = typer.Option(InputFormat.auto, "--format", help="Format der Eingabe (auto: nach Endung)"),
+    text_field: str = typer.Option("text", help="Feld/Spalte mit dem Text"),
+    id_field: str = typer.Option("id", help="Feld/Spalte mit der ID (sonst Zeilennummer)"),
+    batch_size: int = typer.Option(256, min=1, help="Texte pro Batch in nlp.pipe()"),
+    n_process: int = typer.Option(1, min=1, help="Anzahl Prozesse für nlp.pipe()"),
+    threshold: float = typer.Option(0.5, help="Schwellwert für die Frames"),
+    sent_model: Path = typer.Option(ROOT_DIR / SENT_MODEL_DIR, help="Sentiment-Modell (textcat)"),
+    frames_model: Path = typer.Option(ROOT_DIR / FRAMES_MODEL_DIR, help="Frame-Modell (textcat_multilabel)"),
+    rules: bool = typer.Option(False, help="Zusätzlich die Regel-Komponenten (braucht en_core_web_sm)"),
+    rule_model: str = typer.Option(RULE_BASE_MODEL, help="Basismodell für die Regel-Komponenten"),
+    limit: int = typer.Option(None, min=1, help="Nur die ersten N Texte"),
+):
+    start = time.perf_counter()
+    try:
+        if rules:
+            nlp = create_composed_pipeline(sent_model, frames_model, rule_model)
+        else:
+            nlp = create_ml_pipeline(sent_model, frames_model)
+    except OSError as e:
+        typer.echo(f"[FEHLER] Modell konnte nicht geladen werden: {e}", err=True)
+        raise typer.Exit(1)
+    load_seconds = time.perf_counter() - start
+    typer.echo(f"Pipeline geladen ({load_seconds:.2f}s): {', '.join(nlp.pipe_names)}")
+    # Im UI trainierte Modelle: create_ml_pipeline lädt die Version aus <modell>.current
+    typer.echo(f"Modelle: {resolve_model_dir(sent_model)}, {resolve_model_dir(frames_model)}")
+
+    sent_labels = nlp.get_pipe("textcat").labels
+    frame_labels = nlp.get_pipe("framecat").labels
+    records = islice(iter_records(input_path, input_format, text_field, id_field), limit)
+    # ID neben dem Text durch die Pipeline reichen (as_tuples), statt alle IDs zu sammeln
+    texts = ((text, record_id) for record_id, text in records)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    n_docs = 0
+    start = time.perf_counter()
+    with open(output_path, 'w', encoding='utf-8') as out:
+        for doc, record_id in nlp.pipe(texts, as_tuples=True, batch_size=batch_size, n_process=n_process):
+            result = prediction(doc, record_id, sent_labels, frame_labels, threshold)
+            if rules:
+                result['rule_frames'] = doc._.frames
+                result['rule_sentiment'] = doc._.sentiment_rule
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            n_docs += 1
+            if n_docs % 10000 == 0:
+                typer.echo(f"  {n_docs} Texte, {n_docs / (time.perf_counter() - start):.0f} Texte/s")
+    seconds = time.perf_counter() - start
+
+    typer.echo(f"[OK] {n_docs} Vorhersagen nach {output_path} geschrieben "
+               f"({seconds:.2f}s, {n_docs / max(seconds, 1e-9):.1f} Texte/s, "
+               f"batch_size={batch_size}, n_process={n_process})")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,65 @@
+import sys
+import time
+from pathlib import Path
+
+# ----------------------------------------------------
+# 1. SETUP & PFADE
+# ----------------------------------------------------
+# Vergleicht Einzelpfad (analyze_adjectives/analyze_verbs) und BatchScorer
+# auf den 2000 movie_reviews. Aufruf: python scripts/benchmark_batch_scoring.py
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from business_logic.text_analyzer import TextAnalyzer, iter_movie_reviews
+from business_logic.batch_scoring import BatchScorer
+
+CORPUS_DIR = ROOT_DIR / "data/nltk_data/corpora/movie_reviews"
+
+try:
+    texts = [text for _, text in iter_movie_reviews(CORPUS_DIR)]
+except FileNotFoundError as error:
+    print(f"[FEHLER] {error}")
+    sys.exit(1)
+analyzer = TextAnalyzer()
+scorer = BatchScorer(analyzer)
+print(f"Dokumente: {len(texts)}")
+
+# ----------------------------------------------------
+# 2. EINZELPFAD
+# ----------------------------------------------------
+start = time.perf_counter()
+expected = [(analyzer.analyze_adjectives(t), analyzer.analyze_verbs(t)) for t in texts]
+python_seconds = time.perf_counter() - start
+
+# ----------------------------------------------------
+# 3. MATRIX-PFAD
+# ----------------------------------------------------
+start = time.perf_counter()
+counts = scorer.count_matrix(texts)
+count_seconds = time.perf_counter() - start
+
+start = time.perf_counter()
+scores = scorer.score_matrix(counts)
+score_seconds = time.perf_counter() - start
+
+# ----------------------------------------------------
+# 4. VERGLEICH
+# ----------------------------------------------------
+mismatches = 0
+for i, (adjectives, verbs) in enumerate(expected):
+    for part, result in (('adjectives', adjectives), ('verbs', verbs)):
+        got = scores[part]
+        if (got['average_score'][i] != result['average_score']
+                or got['sentiment'][i] != result['sentiment']
+                or got['count'][i] != result['count']):
+            mismatches += 1
+
+print(f"Einzelpfad:          {python_seconds:.3f} s ({len(texts) / python_seconds:.0f} Dok/s)")
+print(f"Zählmatrix bauen:    {count_seconds:.3f} s ({len(texts) / count_seconds:.0f} Dok/s)")
+print(f"Matrix bewerten:     {score_seconds * 1000:.2f} ms ({len(texts) / score_seconds:.0f} Dok/s)")
+print(f"Matrix: {counts.shape[0]}x{counts.shape[1]}, {counts.nnz} Einträge")
+
+if mismatches:
+    print(f"[FEHLER] {mismatches} Abweichungen zum Einzelpfad")
+    sys.exit(1)
+print("[OK] Ergebnisse identisch mit dem Einzelpfad.")
@@ -0,0 +1,108 @@
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# ----------------------------------------------------
+# 1. SETUP & PFADE
+# ----------------------------------------------------
+# Vergleicht CSV-Laden (LexiconStore) mit dem mmap-Binärformat:
+# Ladezeit, Lookup-Durchsatz und Speicher (RSS) pro Worker-Prozess.
+# Das Binärformat sucht jedes Wort binär (deutlich langsamer als ein Dictionary);
+# "kalt" misst den ersten Durchlauf, "warm" den zweiten mit gefülltem Lookup-Cache.
+# Aufruf: python scripts/benchmark_binary_lexicon.py --entries 200000 --workers 4
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.insert(0, str(ROOT_DIR / "scripts"))
+
+from business_logic.binary_lexicon import BinaryLexiconStore, compile_lexicon
+from business_logic.suffix_rules import DEFAULT_LANGUAGE, SUFFIX_RULES_DIR
+from business_logic.text_analyzer import LexiconStore
+from synthetic_lexicon import write_synthetic_lexicon
+
+
+def memory_usage():
+    """RSS in MB: gesamt, privat (anonym) und geteilt (Datei-Seiten); nur Linux liefert alle Werte"""
+    values = {}
+    try:
+        with open("/proc/self/status", encoding="ascii") as file:
+            for line in file:
+                key, _, value = line.partition(":")
+                if key in ("VmRSS", "RssAnon", "RssFile"):
+                    values[key] = int(value.split()[0]) / 1024
+    except FileNotFoundError:
+        values["VmRSS"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return values
+
+
+def worker(kind, source, words, queue):
+    """Lädt das Lexikon in einem frischen Prozess und berührt alle Einträge"""
+    before = memory_usage()
+    start = time.perf_counter()
+    if kind == "csv":
+        store = LexiconStore(source, rules_dir=str(ROOT_DIR / SUFFIX_RULES_DIR))
+    else:
+        store = BinaryLexiconStore(source)
+    snapshot = store.get()
+    load_seconds = time.perf_counter() - start
+
+    timings = []
+    for _ in range(2):
+        start = time.perf_counter()
+        total = 0
+        for word in words:
+            total += snapshot.adjectives[word]
+        timings.append(time.perf_counter() - start)
+
+    after = memory_usage()
+    queue.put({
+        "load_seconds": load_seconds,
+        "cold_per_second": len(words) / timings[0],
+        "warm_per_second": len(words) / timings[1],
+        "rss_mb": after.get("VmRSS", 0) - before.get("VmRSS", 0),
+        "private_mb": after.get("RssAnon", 0) - before.get("RssAnon", 0),
+        "shared_mb": after.get("RssFile", 0) - before.get("RssFile", 0),
+    })
+
+
+def run(kind, source, words, workers):
+    """Startet die Worker nacheinander im spawn-Modus (saubere Prozesse)"""
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    results = []
+    for _ in range(workers):
+        process = context.Process(target=worker, args=(kind, source, words, queue))
+        process.start()
+        results.append(queue.get())
+        process.join()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark CSV vs. mmap-Lexikon")
+    parser.add_argument("--entries", type=int, default=200000, help="Einträge pro Lexikon (Adjektive/Verben)")
+    parser.add_argument("--workers", type=int, default=2, help="Anzahl Worker-Prozesse")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_dir = os.path.join(tmp, "csv")
+        adjectives, _ = write_synthetic_lexicon(csv_dir, args.entries)
+        binary_path = os.path.join(tmp, "lexicon.bin")
+
+        start = time.perf_counter()
+        compile_lexicon(csv_dir, binary_path, DEFAULT_LANGUAGE, str(ROOT_DIR / SUFFIX_RULES_DIR))
+        compile_seconds = time.perf_counter() - start
+
+        sample = adjectives[::max(1, len(adjectives) // 20000)]
+        print(f"\nEinträge: {args.entries} Adjektive + {args.entries} Verben, "
+              f"Binärdatei: {os.path.getsize(binary_path) / 1e6:.1f} MB, kompiliert in {compile_seconds:.2f} s")
+        print(f"{'Format':<8}{'Laden [s]':>11}{'kalt/s':>12}{'warm/s':>12}{'RSS [MB]':>10}{'privat':>9}{'geteilt':>9}")
+        for kind, source in (("csv", csv_dir), ("binary", binary_path)):
+            for result in run(kind, source, sample, args.workers):
+                print(f"{kind:<8}{result['load_seconds']:>11.3f}"
+                      f"{result['cold_per_second']:>12.0f}{result['warm_per_second']:>12.0f}"
+                      f"{result['rss_mb']:>10.1f}{result['private_mb']:>9.1f}{result['shared_mb']:>9.1f}")
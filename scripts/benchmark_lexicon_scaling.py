@@ -0,0 +1,112 @@
+import argparse
+import multiprocessing
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# ----------------------------------------------------
+# 1. SETUP & PFADE
+# ----------------------------------------------------
+# Skalierungs-Benchmark: Dictionary-Lexika (LexiconStore) gegen die kompakte,
+# array-basierte Speicherung (CompactLexiconStore) bei 1k bis 1M Einträgen.
+# Gemessen werden Ladezeit, Speicher (RSS pro Prozess), Lemma-Lookups/s und
+# die Trefferquote des LemmaCache der kompakten Lemma-Tabelle.
+# Aufruf: python scripts/benchmark_lexicon_scaling.py --sizes 1000 10000 100000 1000000
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.insert(0, str(ROOT_DIR / "scripts"))
+
+from benchmark_binary_lexicon import memory_usage
+from business_logic.compact_lexicon import CompactLexiconStore
+from business_logic.suffix_rules import SUFFIX_RULES_DIR
+from business_logic.text_analyzer import LexiconStore, TextAnalyzer
+from synthetic_lexicon import write_synthetic_lexicon
+
+SAMPLE_SIZE = 20000
+
+
+def sample_words(adjectives, verbs, seed=0):
+    """Gemischte Stichprobe: Grundformen, regelmäßige und unregelmäßige Formen, unbekannte Wörter"""
+    rng = random.Random(seed)
+    lemmas = rng.sample(adjectives + verbs, min(SAMPLE_SIZE // 2, len(adjectives) + len(verbs)))
+    words = []
+    for lemma in lemmas:
+        words.append(rng.choice((lemma, lemma + "s", lemma + "ed", lemma + "ing", lemma[::-1] + "x")))
+        words.append("".join(rng.sample(lemma, len(lemma))) + "q")
+    return words
+
+
+def worker(layout, csv_dir, words, queue):
+    """Lädt die Lexika in einem frischen Prozess und misst die Lookups"""
+    before = memory_usage()
+    start = time.perf_counter()
+    # Der spawn-Prozess startet nicht zwingend im Projektverzeichnis
+    rules_dir = str(ROOT_DIR / SUFFIX_RULES_DIR)
+    store_class = LexiconStore if layout == "dict" else CompactLexiconStore
+    store = store_class(csv_dir, rules_dir=rules_dir)
+    analyzer = TextAnalyzer(store)
+    load_seconds = time.perf_counter() - start
+    after = memory_usage()
+
+    timings = []
+    for _ in range(2):
+        start = time.perf_counter()
+        lemmas = [analyzer.lemmatize(word) for word in words]
+        timings.append(time.perf_counter() - start)
+
+    cache = getattr(analyzer.lemma_table, 'cache', None)
+    queue.put({
+        "cache": cache.stats() if cache is not None else None,
+        "load_seconds": load_seconds,
+        "rss_mb": after.get("VmRSS", 0) - before.get("VmRSS", 0),
+        "cold_per_second": len(words) / timings[0],
+        "warm_per_second": len(words) / timings[1],
+        "lemmas": lemmas,
+    })
+
+
+def run(layout, csv_dir, words):
+    """Startet einen Worker im spawn-Modus (sauberer Prozess ohne geladene Lexika)"""
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=worker, args=(layout, csv_dir, words, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Skalierungs-Benchmark Dictionary vs. kompakte Lexika")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000, 1000000],
+                        help="Einträge pro Lexikon (Adjektive/Verben)")
+    parser.add_argument("--dict-limit", type=int, default=100000,
+                        help="Dictionary-Layout nur bis zu dieser Grösse messen (Speicherbedarf)")
+    args = parser.parse_args()
+
+    print(f"{'Einträge':>10} {'Layout':<8}{'Laden [s]':>11}{'RSS [MB]':>10}{'kalt/s':>11}{'warm/s':>11}"
+          f"{'Cache-Treffer':>15}")
+    failed = False
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as csv_dir:
+            adjectives, verbs = write_synthetic_lexicon(csv_dir, size)
+            words = sample_words(adjectives, verbs)
+            results = {}
+            for layout in ("dict", "compact"):
+                if layout == "dict" and size > args.dict_limit:
+                    continue
+                result = results[layout] = run(layout, csv_dir, words)
+                cache = result['cache']
+                hit_rate = f"{cache['hit_rate']:.1%} ({cache['size']})" if cache else "-"
+                print(f"{size:>10} {layout:<8}{result['load_seconds']:>11.2f}{result['rss_mb']:>10.1f}"
+                      f"{result['cold_per_second']:>11.0f}{result['warm_per_second']:>11.0f}{hit_rate:>15}")
+
+            if "dict" in results and results["dict"]["lemmas"] != results["compact"]["lemmas"]:
+                print(f"[FEHLER] Lemmas weichen bei {size} Einträgen voneinander ab.")
+                failed = True
+
+    if failed:
+        sys.exit(1)
+    print("[OK] Kompakte Lexika liefern dieselben Lemmas wie die Dictionaries.")
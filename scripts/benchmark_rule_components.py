@@ -0,0 +1,140 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import spacy
+
+# ----------------------------------------------------
+# 1. SETUP & PFADE
+# ----------------------------------------------------
+# Vergleicht die Regel-Komponenten (framing_component, sentiment_rule) in Dok/s:
+#   vorher:    String-Vergleiche (token.lemma_.lower() / token.lower_ in String-Dictionaries)
+#   Hash-IDs:  Integer-Lookups über token.lemma / token.lower (use_array=False, Standard für framing_component)
+#   Array:     vektorisiert über doc.to_array([LOWER, LEMMA]) (use_array=True, Standard für sentiment_rule)
+# Die Docs werden einmal vorverarbeitet, gemessen wird nur die Komponente.
+# Aufruf aus dem Projektverzeichnis: python scripts/benchmark_rule_components.py
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from business_logic.components import FRAME_LABELS, FramingComponent, SentimentRuleComponent
+from business_logic.text_analyzer import iter_jsonl
+
+DEV_PATH = ROOT_DIR / "data/sentiment_dev.jsonl"
+
+
+def best_of(repeat, function):
+    """Führt function repeat-mal aus und gibt die kürzeste Laufzeit zurück (nach einem Aufwärmlauf)"""
+    function()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def string_frames(docs, framing):
+    """Referenz: bisherige String-Lookups (Index Stichwort -> Frame-IDs)"""
+    cue_index = {}
+    for frame_id, label in enumerate(FRAME_LABELS):
+        for cue in framing.frames[label]:
+            cue_index.setdefault(cue, []).append(frame_id)
+    vectors = []
+    for doc in docs:
+        frame_ids = []
+        covered = set()
+        for span in framing._phrase_spans(doc):
+            frame_ids.extend(cue_index[span.text.lower()])
+            covered.update(range(span.start, span.end))
+        for t in doc:
+            if t.i in covered:
+                continue
+            ids = cue_index.get(t.lemma_.lower()) or cue_index.get(t.lower_)
+            if ids:
+                frame_ids.extend(ids)
+        vector = np.bincount(np.asarray(frame_ids, dtype=np.intp), minlength=len(FRAME_LABELS))
+        doc._.frame_vector = vector
+        doc._.frames = dict(zip(FRAME_LABELS, vector.tolist()))
+        vectors.append(vector)
+    return vectors
+
+
+def string_sentiment(docs, rule):
+    """Referenz: bisherige String-Lookups (Wort -> +1/-1)"""
+    word_scores = {}
+    for word in rule.pos_words:
+        word_scores[word] = word_scores.get(word, 0) + 1
+    for word in rule.neg_words:
+        word_scores[word] = word_scores.get(word, 0) - 1
+    scores = []
+    for doc in docs:
+        doc._.sentiment_rule = sum(word_scores.get(t.lower_, 0) for t in doc)
+        scores.append(doc._.sentiment_rule)
+    return scores
+
+
+def component_frames(docs, framing):
+    return [doc._.frame_vector for doc in framing.pipe(docs)]
+
+
+def component_sentiment(docs, rule):
+    return [doc._.sentiment_rule for doc in rule.pipe(docs)]
+
+
+# ----------------------------------------------------
+# 2. DOCS VORBEREITEN
+# ----------------------------------------------------
+parser = argparse.ArgumentParser(description="Benchmark der Regel-Komponenten (Strings vs. Hash-IDs vs. Arrays)")
+parser.add_argument("--repeat", type=int, default=5, help="Wiederholungen pro Messung (bester Wert zählt)")
+parser.add_argument("--scale", type=int, default=20, help="Dev-Set so oft wiederholen (kurze Texte)")
+args = parser.parse_args()
+
+try:
+    nlp = spacy.load("en_core_web_sm", exclude=["parser", "ner"])
+    print("Vorverarbeitung mit en_core_web_sm (Lemmas vom Lemmatizer)")
+except OSError:
+    nlp = spacy.blank("en")
+    print("en_core_web_sm nicht installiert: spacy.blank('en'), Lemmas fehlen (Vergleich über LOWER)")
+
+texts = [text for _, text in iter_jsonl(DEV_PATH)] * args.scale
+docs = list(nlp.pipe(texts))
+n_tokens = sum(len(doc) for doc in docs)
+print(f"{len(docs)} Dokumente, {n_tokens} Tokens ({DEV_PATH.name} x {args.scale})")
+
+framing = {use_array: FramingComponent(nlp, "framing_component", use_array=use_array) for use_array in (False, True)}
+rules = {use_array: SentimentRuleComponent(nlp, "sentiment_rule", use_array=use_array) for use_array in (False, True)}
+
+# ----------------------------------------------------
+# 3. GLEICHHEIT PRÜFEN
+# ----------------------------------------------------
+expected_frames = [vector.tolist() for vector in string_frames(docs, framing[False])]
+expected_scores = string_sentiment(docs, rules[False])
+for use_array in (False, True):
+    frames = [vector.tolist() for vector in component_frames(docs, framing[use_array])]
+    scores = component_sentiment(docs, rules[use_array])
+    if frames != expected_frames or scores != expected_scores:
+        print(f"[FEHLER] Ergebnisse mit use_array={use_array} weichen von den String-Lookups ab.")
+        sys.exit(1)
+
+# ----------------------------------------------------
+# 4. MESSUNGEN
+# ----------------------------------------------------
+variants = [
+    ("framing_component", "vorher (Strings)", lambda: string_frames(docs, framing[False])),
+    ("framing_component", "Hash-IDs", lambda: component_frames(docs, framing[False])),
+    ("framing_component", "Array (to_array)", lambda: component_frames(docs, framing[True])),
+    ("sentiment_rule", "vorher (Strings)", lambda: string_sentiment(docs, rules[False])),
+    ("sentiment_rule", "Hash-IDs", lambda: component_sentiment(docs, rules[False])),
+    ("sentiment_rule", "Array (to_array)", lambda: component_sentiment(docs, rules[True])),
+]
+
+print(f"\n{'Komponente':<20}{'Variante':<20}{'Dok/s':>12}{'Faktor':>10}")
+reference = {}
+for component, name, function in variants:
+    docs_per_second = len(docs) / best_of(args.repeat, function)
+    reference.setdefault(component, docs_per_second)
+    print(f"{component:<20}{name:<20}{docs_per_second:>12.0f}{docs_per_second / reference[component]:>9.2f}x")
+
+print("\n[OK] String-, Hash- und Array-Variante liefern identische Ergebnisse.")
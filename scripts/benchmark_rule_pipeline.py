@@ -0,0 +1,111 @@
+import argparse
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# ----------------------------------------------------
+# 1. SETUP & PFADE
+# ----------------------------------------------------
+# Vergleicht die bisherige Regel-Pipeline (volles en_core_web_sm inkl. parser/ner)
+# mit create_rule_pipeline() aus business_logic/rule_pipeline.py:
+# Ladezeit, zusätzlicher Speicher (Max-RSS) und Latenz pro Dokument (nlp(text)).
+# Jede Variante läuft in einem eigenen Prozess, damit sich Ladezeit und Speicher
+# nicht gegenseitig beeinflussen. Zusätzlich wird geprüft, dass beide Varianten
+# dieselben Frames und Sentiment-Scores liefern.
+# Aufruf aus dem Projektverzeichnis: python scripts/benchmark_rule_pipeline.py
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+DEV_PATH = ROOT_DIR / "data/sentiment_dev.jsonl"
+VARIANTS = ("voll", "schlank")
+
+
+def max_rss_mb():
+    """Bisher maximal belegter Speicher des Prozesses in MB (Linux: ru_maxrss in KB)"""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1e6 if sys.platform == "darwin" else rss / 1e3
+
+
+# ----------------------------------------------------
+# 2. MESSUNG IN EINEM KINDPROZESS
+# ----------------------------------------------------
+def measure(variant, model, limit):
+    import spacy
+    from business_logic.rule_pipeline import create_rule_pipeline
+    from business_logic.text_analyzer import iter_jsonl
+
+    texts = [text for _, text in iter_jsonl(DEV_PATH)][:limit]
+    rss_before = max_rss_mb()
+    start = time.perf_counter()
+    if variant == "voll":
+        # Bisheriges Vorgehen der ML-Seite
+        nlp = spacy.load(model)
+        nlp.add_pipe("framing_component", last=True)
+        nlp.add_pipe("sentiment_rule", last=True)
+    else:
+        nlp = create_rule_pipeline(model)
+    load_seconds = time.perf_counter() - start
+    rss_loaded = max_rss_mb()
+
+    nlp(texts[0])  # Aufwärmen
+    latencies = []
+    results = []
+    for text in texts:
+        start = time.perf_counter()
+        doc = nlp(text)
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append([doc._.frame_vector.tolist(), doc._.sentiment_rule])
+
+    return {
+        "pipe_names": nlp.pipe_names,
+        "load_seconds": load_seconds,
+        "memory_mb": rss_loaded - rss_before,
+        "latency_ms_median": statistics.median(latencies),
+        "latency_ms_p95": statistics.quantiles(latencies, n=20)[-1],
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Volle vs. schlanke Regel-Pipeline")
+    parser.add_argument("--model", default="en_core_web_sm", help="Basismodell (Paketname oder Pfad)")
+    parser.add_argument("--limit", type=int, default=None, help="Nur die ersten N Dokumente des Dev-Sets")
+    parser.add_argument("--child", choices=VARIANTS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child, args.model, args.limit)))
+        sys.exit(0)
+
+    # ----------------------------------------------------
+    # 3. VARIANTEN AUSFÜHREN & VERGLEICHEN
+    # ----------------------------------------------------
+    measurements = {}
+    for variant in VARIANTS:
+        command = [sys.executable, __file__, "--child", variant, "--model", args.model]
+        if args.limit:
+            command += ["--limit", str(args.limit)]
+        process = subprocess.run(command, cwd=ROOT_DIR, capture_output=True, text=True)
+        if process.returncode != 0:
+            print(f"[FEHLER] Variante '{variant}' fehlgeschlagen:\n{process.stderr.strip()}")
+            sys.exit(1)
+        measurements[variant] = json.loads(process.stdout.strip().splitlines()[-1])
+
+    for variant, result in measurements.items():
+        print(f"{variant}: {', '.join(result['pipe_names'])}")
+
+    print(f"\n{'Metrik':<24}{'voll':>12}{'schlank':>12}{'Faktor':>10}")
+    for name, unit in (("load_seconds", "s"), ("memory_mb", "MB"),
+                       ("latency_ms_median", "ms"), ("latency_ms_p95", "ms")):
+        full, lean = measurements["voll"][name], measurements["schlank"][name]
+        factor = f"{full / lean:>9.2f}x" if lean else f"{'-':>10}"
+        print(f"{name + ' (' + unit + ')':<24}{full:>12.3f}{lean:>12.3f}{factor}")
+
+    if measurements["voll"]["results"] != measurements["schlank"]["results"]:
+        print("[FEHLER] Die schlanke Pipeline liefert andere Frames/Sentiment-Scores als die volle.")
+        sys.exit(1)
+    print(f"\n[OK] Identische Ergebnisse auf {len(measurements['voll']['results'])} Dokumenten.")
@@ -0,0 +1,230 @@
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+# ----------------------------------------------------
+# 1. SETUP & PFADE
+# ----------------------------------------------------
+# Benchmark-Suite für die Hot Paths des TextAnalyzer (Phase 1):
+# Lexikon laden, lemmatize/lemmatize_text (Tokens/s),
+# analyze_adjectives/analyze_verbs (Dok/s) und Spitzenspeicher.
+# Ergebnisse werden als JSON geschrieben und mit einer gespeicherten
+# Baseline verglichen; bei einer Verschlechterung über dem Schwellwert
+# endet das Skript mit Exit-Code 1. Jede Zeitmessung ist der Median aus
+# --repeat Proben, jede Probe läuft mindestens --min-time Sekunden. Geprüft
+# wird die Laufzeit relativ zu einer Kalibrierung (siehe unten), damit
+# Schwankungen der Maschine keine Regression vortäuschen; Metriken im Bereich
+# weniger Millisekunden (Lexikon laden) werden nur angezeigt.
+#
+# Aufruf (aus einem beliebigen Verzeichnis, alle Pfade relativ zu ROOT_DIR):
+#   python scripts/benchmark_text_analyzer.py --save-baseline   (Baseline anlegen)
+#   python scripts/benchmark_text_analyzer.py --threshold 0.15  (gegen Baseline prüfen)
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from business_logic.suffix_rules import SUFFIX_RULES_DIR
+from business_logic.text_analyzer import CSV_DIR, LexiconStore, TextAnalyzer, iter_jsonl, iter_movie_reviews
+
+CORPORA = {
+    "movie_reviews": lambda: iter_movie_reviews(ROOT_DIR / "data/nltk_data/corpora/movie_reviews"),
+    "sentiment_train": lambda: iter_jsonl(ROOT_DIR / "data/sentiment_train.jsonl"),
+}
+RESULTS_DIR = ROOT_DIR / "benchmarks"
+DEFAULT_OUTPUT = RESULTS_DIR / "text_analyzer_latest.json"
+DEFAULT_BASELINE = RESULTS_DIR / "text_analyzer_baseline.json"
+
+
+# Kalibrierung: fester Python-Workload (Kleinschreibung + Dictionary-Lookup wie in lemmatize).
+# Auf geteilten Maschinen schwankt die Geschwindigkeit zwischen Läufen um 30% und mehr;
+# geprüft wird deshalb die Laufzeit relativ zu dieser Kalibrierung, gemessen direkt davor.
+CALIBRATION_WORDS = [f"Word{i % 5000}" for i in range(50000)]
+CALIBRATION_TABLE = {f"word{i}": i for i in range(0, 5000, 2)}
+
+
+def calibration_workload():
+    get = CALIBRATION_TABLE.get
+    for word in CALIBRATION_WORDS:
+        get(word.lower(), word)
+
+
+def time_per_call(min_time, function):
+    """Wiederholt function, bis min_time Sekunden vergangen sind; gibt die Sekunden pro Aufruf zurück"""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        function()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / calls
+
+
+def measure(repeat, min_time, function):
+    """
+    Laufzeit eines Aufrufs von function (nach einem Aufwärmlauf) als Median
+    aus repeat Proben, jede Probe mindestens min_time Sekunden. Gibt
+    (Sekunden, Sekunden relativ zur Kalibrierung) zurück.
+    """
+    function()
+    seconds, relative = [], []
+    for _ in range(repeat):
+        reference = time_per_call(min_time, calibration_workload)
+        elapsed = time_per_call(min_time, function)
+        seconds.append(elapsed)
+        relative.append(elapsed / reference)
+    return statistics.median(seconds), statistics.median(relative)
+
+
+def metric(value, unit, higher_is_better, relative=None, gated=True):
+    """
+    relative: Wert bezogen auf die Kalibrierung (wird gegen die Baseline geprüft);
+    gated=False: nur anzeigen, nicht gegen den Schwellwert prüfen
+    """
+    result = {"value": round(value, 4), "unit": unit, "higher_is_better": higher_is_better, "gated": gated}
+    if relative is not None:
+        result["relative"] = round(relative, 6)
+    return result
+
+
+def rate(units, unit, timing):
+    """Durchsatz-Metrik (units pro Sekunde) aus dem Ergebnis von measure()"""
+    seconds, relative = timing
+    return metric(units / seconds, unit, True, relative=units / relative)
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ----------------------------------------------------
+# 2. MESSUNGEN
+# ----------------------------------------------------
+def run_benchmarks(repeat, limit, min_time):
+    metrics = {}
+    csv_dir = str(ROOT_DIR / CSV_DIR)
+    rules_dir = str(ROOT_DIR / SUFFIX_RULES_DIR)
+
+    # Lexikon laden: jedes Mal ein neuer Store, damit die CSV-Dateien wirklich gelesen werden
+    # (wenige Millisekunden, schwankt stark mit dem Dateisystem-Cache: wird nicht geprüft)
+    seconds, _ = measure(repeat, min_time, lambda: LexiconStore(csv_dir, rules_dir=rules_dir).get())
+    metrics["lexicon_load_seconds"] = metric(seconds, "s", False, gated=False)
+
+    analyzer = TextAnalyzer(LexiconStore(csv_dir, rules_dir=rules_dir))
+    for corpus, load in CORPORA.items():
+        texts = [text for _, text in load()][:limit]
+        words = [word for text in texts for word in text.split()]
+        n_tokens = sum(len(analyzer.tokenize(text)) for text in texts)
+        print(f"{corpus}: {len(texts)} Dokumente, {n_tokens} Tokens")
+
+        timing = measure(repeat, min_time, lambda: [analyzer.lemmatize(word) for word in words])
+        metrics[f"{corpus}.lemmatize_tokens_per_s"] = rate(len(words), "Tokens/s", timing)
+
+        timing = measure(repeat, min_time, lambda: [analyzer.lemmatize_text(text) for text in texts])
+        metrics[f"{corpus}.lemmatize_text_tokens_per_s"] = rate(n_tokens, "Tokens/s", timing)
+
+        timing = measure(repeat, min_time, lambda: [analyzer.analyze_adjectives(text) for text in texts])
+        metrics[f"{corpus}.analyze_adjectives_docs_per_s"] = rate(len(texts), "Dok/s", timing)
+
+        timing = measure(repeat, min_time, lambda: [analyzer.analyze_verbs(text) for text in texts])
+        metrics[f"{corpus}.analyze_verbs_docs_per_s"] = rate(len(texts), "Dok/s", timing)
+
+    # Spitzenspeicher separat messen (tracemalloc verlangsamt die Zeitmessungen)
+    texts = [text for _, text in CORPORA["movie_reviews"]()][:limit]
+    tracemalloc.start()
+    analyzer = TextAnalyzer(LexiconStore(csv_dir, rules_dir=rules_dir))
+    for text in texts:
+        analyzer.analyze_adjectives(text)
+        analyzer.analyze_verbs(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    metrics["peak_memory_mb"] = metric(peak / 1e6, "MB", False)
+    return metrics
+
+
+# ----------------------------------------------------
+# 3. VERGLEICH MIT DER BASELINE
+# ----------------------------------------------------
+def compare(metrics, baseline, threshold):
+    """Gibt die Liste der Metriken zurück, die um mehr als threshold schlechter sind"""
+    regressions = []
+    print(f"\n{'Metrik':<48}{'Baseline':>14}{'Aktuell':>14}{'Änderung':>10}")
+    for name, current in metrics.items():
+        reference = baseline.get(name)
+        if reference is None or not reference["value"]:
+            print(f"{name:<48}{'-':>14}{current['value']:>14.2f}")
+            continue
+        # Relativ zur Kalibrierung vergleichen, wenn beide Läufe den Wert haben
+        key = "relative" if "relative" in current and "relative" in reference else "value"
+        change = current[key] / reference[key] - 1
+        worse = -change if current["higher_is_better"] else change
+        regression = current.get("gated", True) and worse > threshold
+        flag = "  <-- Regression" if regression else ("" if current.get("gated", True) else "  (nicht geprüft)")
+        print(f"{name:<48}{reference['value']:>14.2f}{current['value']:>14.2f}{change:>+10.1%}{flag}")
+        if regression:
+            regressions.append(name)
+    print("(Änderung bezogen auf die Kalibrierung, wo beide Läufe sie enthalten)")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark-Suite für den TextAnalyzer")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="JSON-Datei für die Ergebnisse")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Gespeicherte Baseline (JSON)")
+    parser.add_argument("--threshold", type=float, default=0.20,
+                        help="Erlaubte Verschlechterung pro Metrik (0.20 = 20%%)")
+    parser.add_argument("--repeat", type=int, default=5, help="Proben pro Messung (Median zählt)")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Mindestdauer einer Probe in Sekunden")
+    parser.add_argument("--limit", type=int, default=None, help="Nur die ersten N Dokumente pro Korpus")
+    parser.add_argument("--save-baseline", action="store_true", help="Ergebnisse zusätzlich als Baseline speichern")
+    args = parser.parse_args()
+
+    try:
+        metrics = run_benchmarks(args.repeat, args.limit, args.min_time)
+    except FileNotFoundError as error:
+        print(f"[FEHLER] {error}")
+        sys.exit(1)
+    result = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "min_time": args.min_time,
+            "limit": args.limit,
+        },
+        "metrics": metrics,
+    }
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    print(f"Ergebnisse gespeichert: {args.output}")
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(result, indent=2), encoding="utf-8")
+        print(f"Baseline gespeichert: {args.baseline}")
+        sys.exit(0)
+
+    if not args.baseline.exists():
+        print(f"Keine Baseline gefunden ({args.baseline}). Mit --save-baseline anlegen.")
+        sys.exit(0)
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare(metrics, baseline["metrics"], args.threshold)
+    if regressions:
+        print(f"[FEHLER] {len(regressions)} Metrik(en) mehr als {args.threshold:.0%} schlechter als die Baseline "
+              f"(Commit {baseline['meta'].get('commit')}).")
+        sys.exit(1)
+    print(f"[OK] Keine Regression über {args.threshold:.0%} gegenüber der Baseline.")
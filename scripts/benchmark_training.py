@@ -0,0 +1,108 @@
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import spacy
+from spacy.training import Example
+from spacy.util import fix_random_seed, minibatch
+
+# ----------------------------------------------------
+# 1. SETUP & PFADE
+# ----------------------------------------------------
+# Vergleicht die bisherigen Trainingsschleifen der ML-Seite mit TextcatTrainer
+# (business_logic/training.py): Zeit bis zum Erreichen eines Ziel-Macro-F1 auf dem
+# Dev-Set und bester Macro-F1.
+#   frames:    bisher ein nlp.update() mit allen Beispielen pro Epoche
+#   sentiment: bisher Minibatches der Grösse 8 ohne Early Stopping
+# Aufruf aus dem Projektverzeichnis:
+#   python scripts/benchmark_training.py --task frames --target 0.30
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from business_logic.docbin_cache import cached_docs
+from business_logic.evaluation import DevSet, evaluate_textcat
+from business_logic.training import TextcatTrainer
+
+TASKS = {
+    # Komponente, Factory, multilabel, Trainings- und Dev-Daten
+    "frames": ("framecat", "textcat_multilabel", True, "data/frames_train.jsonl", "data/frames_dev.jsonl"),
+    "sentiment": ("textcat", "textcat", False, "data/sentiment_train.jsonl", "data/sentiment_dev.jsonl"),
+}
+
+
+def setup(task):
+    component, factory, multilabel, train_path, dev_path = TASKS[task]
+    nlp = spacy.blank("en")
+    train_docs, _ = cached_docs(nlp, ROOT_DIR / train_path)
+    dev_docs, _ = cached_docs(nlp, ROOT_DIR / dev_path)
+    labels = sorted({label for doc in train_docs for label in doc.cats})
+    textcat = nlp.add_pipe(factory, name=component)
+    for label in labels:
+        textcat.add_label(label)
+    dev_set = DevSet(dev_docs, [doc.cats for doc in dev_docs], labels)
+    return nlp, component, multilabel, train_docs, dev_set
+
+
+def run_previous(task, max_epochs, seed):
+    """Bisherige Schleife der jeweiligen Registerkarte: (Epoche, Sekunden, F1) pro Epoche"""
+    fix_random_seed(seed)
+    nlp, component, multilabel, train_docs, dev_set = setup(task)
+    examples = [Example.from_dict(doc, {"cats": doc.cats}) for doc in train_docs]
+    optimizer = nlp.initialize(get_examples=lambda: examples)
+    start = time.perf_counter()
+    history = []
+    for epoch in range(1, max_epochs + 1):
+        if task == "frames":
+            nlp.update(examples, sgd=optimizer, losses={})
+        else:
+            random.shuffle(examples)
+            for batch in minibatch(examples, size=8):
+                nlp.update(batch, sgd=optimizer, losses={})
+        f1 = evaluate_textcat(nlp, dev_set, component, multilabel=multilabel)['f1_macro']
+        history.append((epoch, time.perf_counter() - start, f1))
+    return history
+
+
+def run_trainer(task, max_epochs, seed, patience):
+    fix_random_seed(seed)
+    nlp, component, multilabel, train_docs, dev_set = setup(task)
+    trainer = TextcatTrainer(nlp, component, train_docs, dev_set, multilabel=multilabel,
+                             patience=patience, seed=seed)
+    history = [(result.epoch, result.seconds, result.evaluation['f1_macro']) for result in trainer.epochs(max_epochs)]
+    # Nach dem Training sind die Gewichte der besten Epoche aktiv
+    restored = evaluate_textcat(nlp, dev_set, component, multilabel=multilabel)['f1_macro']
+    return history, trainer.best_epoch, restored
+
+
+def time_to_target(history, target):
+    for epoch, seconds, f1 in history:
+        if f1 >= target:
+            return epoch, seconds
+    return None, None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bisherige Trainingsschleife vs. TextcatTrainer")
+    parser.add_argument("--task", choices=sorted(TASKS), default="frames")
+    parser.add_argument("--target", type=float, default=0.30, help="Ziel-Macro-F1 auf dem Dev-Set")
+    parser.add_argument("--epochs", type=int, default=12, help="Maximale Anzahl Epochen")
+    parser.add_argument("--patience", type=int, default=3, help="Early Stopping nach N Epochen ohne Verbesserung")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    previous = run_previous(args.task, args.epochs, args.seed)
+    trainer_history, best_epoch, restored_f1 = run_trainer(args.task, args.epochs, args.seed, args.patience)
+
+    print(f"\n{'Schleife':<14}{'Epochen':>9}{'Zeit (s)':>10}{'bester F1':>11}{'Ziel erreicht':>22}")
+    for name, history in (("bisher", previous), ("Trainer", trainer_history)):
+        epoch, seconds = time_to_target(history, args.target)
+        reached = f"Epoche {epoch}, {seconds:.1f}s" if epoch else "nicht erreicht"
+        print(f"{name:<14}{len(history):>9}{history[-1][1]:>10.1f}{max(f1 for _, _, f1 in history):>11.4f}{reached:>22}")
+
+    print(f"\nTrainer: beste Epoche {best_epoch}, F1 nach Wiederherstellung {restored_f1:.4f}")
+    if abs(restored_f1 - max(f1 for _, _, f1 in trainer_history)) > 1e-9:
+        print("[FEHLER] Die wiederhergestellten Gewichte entsprechen nicht der besten Epoche.")
+        sys.exit(1)
+    print("[OK] Beste Epoche wiederhergestellt.")
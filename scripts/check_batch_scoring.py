@@ -0,0 +1,115 @@
+import csv
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# ----------------------------------------------------
+# 1. SETUP & PFADE
+# ----------------------------------------------------
+# Prüft, dass der BatchScorer nach einer Änderung von Scores und
+# Verstärkungsfaktoren ohne neue Zählung dieselben Ergebnisse liefert wie der
+# Einzelpfad mit dem neuen Lexikon. Arbeitet auf einer Kopie der Lexika.
+# Aufruf: python scripts/check_batch_scoring.py [--limit 300]
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from business_logic.batch_scoring import BatchScorer
+from business_logic.suffix_rules import SUFFIX_RULES_DIR
+from business_logic.text_analyzer import CSV_DIR, LexiconStore, TextAnalyzer, iter_movie_reviews
+
+CORPUS_DIR = ROOT_DIR / "data/nltk_data/corpora/movie_reviews"
+LIMIT = int(sys.argv[sys.argv.index("--limit") + 1]) if "--limit" in sys.argv else 300
+
+# Texte mit Verneinungen, Verstärkern und Mehrwort-Ausdrücken zusätzlich zum Korpus
+EXTRA_TEXTS = [
+    "The plot is not good and the acting is really terrible.",
+    "A very beautiful film. It did not fall apart, it was extremely good.",
+    "I hate it. No, I do not hate it at all.",
+]
+
+
+def rewrite_csv(path, update):
+    """Liest eine CSV-Datei, ändert jede Zeile mit update(row) und schreibt sie neu"""
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        reader = csv.DictReader(file)
+        fields = reader.fieldnames
+        rows = [update(row) for row in reader]
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def shifted(column, delta):
+    def update(row):
+        if row[column].strip():
+            row[column] = str(min(100, max(0, int(row[column]) + delta)))
+        return row
+    return update
+
+
+def scaled_factor(row):
+    if row['type'].strip() == "intensifier":
+        row['factor'] = str(round(float(row['factor']) * 1.25, 3))
+    return row
+
+
+def compare(analyzer, scores, texts):
+    """Anzahl Abweichungen zwischen BatchScorer und analyze_adjectives/analyze_verbs"""
+    mismatches = 0
+    for i, text in enumerate(texts):
+        for part, result in (('adjectives', analyzer.analyze_adjectives(text)),
+                             ('verbs', analyzer.analyze_verbs(text))):
+            got = scores[part]
+            if (got['average_score'][i] != result['average_score']
+                    or got['sentiment'][i] != result['sentiment']
+                    or got['count'][i] != result['count']):
+                mismatches += 1
+    return mismatches
+
+
+try:
+    texts = EXTRA_TEXTS + [text for _, text in iter_movie_reviews(CORPUS_DIR)][:LIMIT]
+except FileNotFoundError as error:
+    print(f"[FEHLER] {error}")
+    sys.exit(1)
+errors = []
+with tempfile.TemporaryDirectory() as tmp:
+    csv_dir = Path(tmp) / "CSV-Data"
+    shutil.copytree(ROOT_DIR / CSV_DIR, csv_dir)
+    store = LexiconStore(str(csv_dir), check_interval=0, rules_dir=str(ROOT_DIR / SUFFIX_RULES_DIR))
+
+    # ----------------------------------------------------
+    # 2. EINMAL ZÄHLEN UND BEWERTEN
+    # ----------------------------------------------------
+    scorer = BatchScorer(TextAnalyzer(store))
+    counts = scorer.count_matrix(texts)
+    before = scorer.score_matrix(counts)
+    if compare(TextAnalyzer(store), before, texts):
+        errors.append("Vor der Änderung weicht der BatchScorer vom Einzelpfad ab.")
+
+    # ----------------------------------------------------
+    # 3. SCORES ÄNDERN, OHNE NEU ZU ZÄHLEN
+    # ----------------------------------------------------
+    old_version = store.get().version
+    rewrite_csv(csv_dir / "adjectives.csv", shifted('score', 7))
+    rewrite_csv(csv_dir / "verbs.csv", shifted('score', -9))
+    rewrite_csv(csv_dir / "phrases.csv", shifted('score', 11))
+    rewrite_csv(csv_dir / "modifiers.csv", scaled_factor)
+    if store.get().version == old_version:
+        errors.append("Der LexiconStore hat die geänderten Lexika nicht geladen.")
+
+    after = scorer.score_matrix(counts)
+    mismatches = compare(TextAnalyzer(store), after, texts)
+    if mismatches:
+        errors.append(f"Nach der Änderung: {mismatches} Abweichungen zum Einzelpfad mit dem neuen Lexikon.")
+    if (after['adjectives']['average_score'] == before['adjectives']['average_score']).all():
+        errors.append("Die Änderung hat keinen Adjektiv-Score verändert (Test ohne Aussage).")
+
+if errors:
+    for error in errors:
+        print(f"[FEHLER] {error}")
+    sys.exit(1)
+print(f"[OK] Neue Scores ohne neue Zählung identisch mit dem Einzelpfad ({len(texts)} Texte, "
+      f"Matrix {counts.shape[0]}x{counts.shape[1]}).")
@@ -0,0 +1,104 @@
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import spacy
+
+# ----------------------------------------------------
+# 1. SETUP & PFADE
+# ----------------------------------------------------
+# Vergleicht die zusammengesetzte Pipeline (business_logic/composed_pipeline.py)
+# mit dem bisherigen Aufbau der ML-Seite aus drei Pipelines
+# (textcat-mini, frames-mini, Regel-Pipeline), die den Text je einmal tokenisieren:
+#   - Vorhersagen (doc.cats, Tags/Lemmas, doc._.frames, doc._.sentiment_rule) identisch
+#   - End-to-End-Latenz pro Text
+# Aufruf aus dem Projektverzeichnis: python scripts/check_composed_pipeline.py
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from business_logic.composed_pipeline import FRAMES_MODEL_DIR, SENT_MODEL_DIR, create_composed_pipeline
+from business_logic.model_registry import resolve_model_dir
+from business_logic.rule_pipeline import RULE_BASE_MODEL, create_rule_pipeline
+from business_logic.text_analyzer import iter_jsonl
+
+DEV_PATHS = (ROOT_DIR / "data/sentiment_dev.jsonl", ROOT_DIR / "data/frames_dev.jsonl")
+TOLERANCE = 1e-6
+
+parser = argparse.ArgumentParser(description="Zusammengesetzte Pipeline vs. drei einzelne Pipelines")
+parser.add_argument("--sent-model", default=str(ROOT_DIR / SENT_MODEL_DIR))
+parser.add_argument("--frames-model", default=str(ROOT_DIR / FRAMES_MODEL_DIR))
+parser.add_argument("--rule-model", default=RULE_BASE_MODEL)
+parser.add_argument("--limit", type=int, default=None, help="Nur die ersten N Texte")
+args = parser.parse_args()
+
+texts = [text for path in DEV_PATHS for _, text in iter_jsonl(path)][:args.limit]
+
+# ----------------------------------------------------
+# 2. PIPELINES LADEN
+# ----------------------------------------------------
+try:
+    # Aktuelle Version, falls das Modell im UI neu trainiert wurde (<modell>.current)
+    nlp_sent = spacy.load(resolve_model_dir(args.sent_model))
+    nlp_frames = spacy.load(resolve_model_dir(args.frames_model))
+    nlp_rules = create_rule_pipeline(args.rule_model)
+    nlp = create_composed_pipeline(args.sent_model, args.frames_model, args.rule_model)
+except OSError as e:
+    print(f"[FEHLER] Modell konnte nicht geladen werden: {e}")
+    sys.exit(1)
+
+print(f"Zusammengesetzt: {', '.join(nlp.pipe_names)}")
+print(f"{len(texts)} Texte aus {', '.join(path.name for path in DEV_PATHS)}")
+
+
+def run_separate(text):
+    return nlp_sent(text), nlp_frames(text), nlp_rules(text)
+
+
+def cats_equal(expected, actual):
+    return all(abs(actual[label] - score) <= TOLERANCE for label, score in expected.items())
+
+
+# ----------------------------------------------------
+# 3. VORHERSAGEN VERGLEICHEN
+# ----------------------------------------------------
+mismatches = []
+for text in texts:
+    d_sent, d_frames, d_rules = run_separate(text)
+    doc = nlp(text)
+    if not cats_equal(d_sent.cats, doc.cats) or not cats_equal(d_frames.cats, doc.cats):
+        mismatches.append((text, "cats"))
+    elif [(t.tag_, t.lemma_) for t in d_rules] != [(t.tag_, t.lemma_) for t in doc]:
+        mismatches.append((text, "Tags/Lemmas"))
+    elif d_rules._.frames != doc._.frames or d_rules._.sentiment_rule != doc._.sentiment_rule:
+        mismatches.append((text, "Regel-Komponenten"))
+
+if mismatches:
+    print(f"[FEHLER] {len(mismatches)} Texte mit abweichenden Vorhersagen:")
+    for text, what in mismatches[:20]:
+        print(f"  {what}: {text[:80]!r}")
+    sys.exit(1)
+
+# ----------------------------------------------------
+# 4. LATENZ PRO TEXT
+# ----------------------------------------------------
+def latencies(function):
+    function(texts[0])  # Aufwärmen
+    timings = []
+    for text in texts:
+        start = time.perf_counter()
+        function(text)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+separate = latencies(run_separate)
+composed = latencies(nlp)
+print(f"\n{'Aufbau':<20}{'Median (ms)':>14}{'p95 (ms)':>12}{'Texte/s':>12}")
+for name, timings in (("drei Pipelines", separate), ("zusammengesetzt", composed)):
+    print(f"{name:<20}{statistics.median(timings):>14.3f}{statistics.quantiles(timings, n=20)[-1]:>12.3f}"
+          f"{len(timings) / (sum(timings) / 1000):>12.0f}")
+print(f"Faktor (Median): {statistics.median(separate) / statistics.median(composed):.2f}x")
+
+print(f"\n[OK] Identische Vorhersagen auf {len(texts)} Texten.")
@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+
+# ----------------------------------------------------
+# 1. SETUP & PFADE
+# ----------------------------------------------------
+# Vergleicht die vorberechnete Lemma-Tabelle mit dem regelbasierten Pfad.
+# Aufruf aus dem Projektverzeichnis: python scripts/check_lemma_table.py
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from business_logic.text_analyzer import TextAnalyzer
+
+CORPUS_DIR = ROOT_DIR / "data/nltk_data/corpora/movie_reviews"
+PUNCTUATION = '.,!?;:\'"'
+
+# ----------------------------------------------------
+# 2. TESTWÖRTER SAMMELN
+# ----------------------------------------------------
+analyzer = TextAnalyzer()
+
+words = set(analyzer.lemma_table)
+for lemma in list(analyzer.adjectives) + list(analyzer.verbs):
+    words.update(analyzer.suffix_rules.candidate_forms(lemma))
+    # Zusätzliche Endungen, die keine gültige Form ergeben sollten
+    words.update(lemma + suffix for suffix in ("ss", "ies", "ied", "iest", "ier", "d", "r", "st"))
+
+for path in CORPUS_DIR.glob("*/*.txt"):
+    for word in path.read_text(encoding="utf-8").split():
+        words.add(word.lower().strip(PUNCTUATION))
+
+print(f"Vergleiche {len(words)} Wortformen...")
+
+# ----------------------------------------------------
+# 3. VERGLEICH
+# ----------------------------------------------------
+mismatches = []
+for word in sorted(words):
+    expected = analyzer._lemmatize_by_rules(word)
+    actual = analyzer.lemmatize(word)
+    if expected != actual:
+        mismatches.append((word, expected, actual))
+
+if mismatches:
+    print(f"[FEHLER] {len(mismatches)} Abweichungen gefunden:")
+    for word, expected, actual in mismatches[:50]:
+        print(f"  {word}: Regeln={expected} Tabelle={actual}")
+    sys.exit(1)
+
+print(f"[OK] Lemma-Tabelle ({len(analyzer.lemma_table)} Formen) entspricht dem Regelpfad.")
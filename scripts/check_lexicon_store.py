@@ -0,0 +1,80 @@
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# ----------------------------------------------------
+# 1. SETUP & PFADE
+# ----------------------------------------------------
+# Prüft den Hot-Reload des LexiconStore auf einer Kopie der Lexika:
+#   - fehlt eine Quelldatei, liefert get() weiter den letzten Snapshot
+#   - ein fehlgeschlagenes Neuladen wird erst nach check_interval wiederholt
+#   - ist die Datei unverändert zurück, bleibt der Snapshot ohne weiteres Laden bestehen
+# Aufruf: python scripts/check_lexicon_store.py
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from business_logic.suffix_rules import SUFFIX_RULES_DIR
+from business_logic.text_analyzer import CSV_DIR, LexiconStore, TextAnalyzer
+
+CHECK_INTERVAL = 0.5
+
+
+class CountingStore(LexiconStore):
+    """LexiconStore, der seine _load()-Aufrufe zählt"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.loads = 0
+
+    def _load(self, file_hashes):
+        self.loads += 1
+        return super()._load(file_hashes)
+
+
+errors = []
+with tempfile.TemporaryDirectory() as tmp:
+    csv_dir = Path(tmp) / "CSV-Data"
+    rules_dir = Path(tmp) / "suffix_rules"
+    shutil.copytree(ROOT_DIR / CSV_DIR, csv_dir)
+    shutil.copytree(ROOT_DIR / SUFFIX_RULES_DIR, rules_dir)
+    rules_file = rules_dir / "en.json"
+    rules_backup = Path(tmp) / "en.json"
+
+    store = CountingStore(str(csv_dir), check_interval=CHECK_INTERVAL, rules_dir=str(rules_dir))
+    snapshot = store.get()
+
+    # ----------------------------------------------------
+    # 2. QUELLDATEI ENTFERNEN
+    # ----------------------------------------------------
+    shutil.move(rules_file, rules_backup)
+    time.sleep(CHECK_INTERVAL)
+    for _ in range(50):
+        if TextAnalyzer(store).lexicon_version != snapshot.version:
+            errors.append("Nach dem Entfernen der Regeldatei wurde der Snapshot gewechselt.")
+            break
+    if store.loads != 2:
+        errors.append(f"50 Aufrufe ohne Regeldatei: {store.loads - 1} Ladeversuche (erwartet: 1)")
+
+    time.sleep(CHECK_INTERVAL)
+    store.get()
+    if store.loads != 3:
+        errors.append(f"Nach check_interval: {store.loads - 2} weitere Ladeversuche (erwartet: 1)")
+
+    # ----------------------------------------------------
+    # 3. QUELLDATEI WIEDERHERSTELLEN
+    # ----------------------------------------------------
+    shutil.move(rules_backup, rules_file)
+    time.sleep(CHECK_INTERVAL)
+    for _ in range(50):
+        store.get()
+    # Inhalt wie vorher: kein neuer Snapshot und keine weiteren Ladeversuche nötig
+    if store.get() is not snapshot or store.loads != 3:
+        errors.append(f"Nach dem Wiederherstellen: {store.loads - 3} weitere Ladeversuche (erwartet: 0)")
+
+if errors:
+    for error in errors:
+        print(f"[FEHLER] {error}")
+    sys.exit(1)
+print("[OK] LexiconStore behält den letzten Snapshot und wiederholt fehlgeschlagene Ladeversuche erst nach check_interval.")
@@ -0,0 +1,106 @@
+import csv
+import sys
+from pathlib import Path
+
+# ----------------------------------------------------
+# 1. SETUP & PFADE
+# ----------------------------------------------------
+# Vergleicht die tabellengesteuerten Suffix-Regeln (data/suffix_rules/en.json)
+# mit der früheren, fest programmierten if-Kaskade.
+# Aufruf aus dem Projektverzeichnis: python scripts/check_suffix_rules.py
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from business_logic.suffix_rules import SUFFIX_RULES_DIR, load_suffix_rules
+
+CSV_DIR = ROOT_DIR / "data/CSV-Data"
+CORPUS_DIR = ROOT_DIR / "data/nltk_data/corpora/movie_reviews"
+PUNCTUATION = '.,!?;:\'"'
+
+CONSONANTS = frozenset('bcdfghjklmnpqrstvwxyz')
+VOWELS = frozenset('aeiou')
+
+
+def cascade_suffix_rules(word):
+    """Referenz: die bisherige Kaskade aus TextAnalyzer._apply_suffix_rules"""
+    if len(word) <= 3:
+        return word
+    if word.endswith('ies') and len(word) > 4:
+        return word[:-3] + 'y'
+    if word.endswith('iest') and len(word) > 5:
+        return word[:-4] + 'y'
+    if word.endswith('ier') and len(word) > 4:
+        return word[:-3] + 'y'
+    if word.endswith('ing') and len(word) > 5:
+        stem = word[:-3]
+        if len(stem) >= 2 and stem[-1] == stem[-2] and stem[-1] in CONSONANTS:
+            return stem[:-1]
+        if stem[-1] in CONSONANTS and len(stem) >= 2:
+            if stem[-2] in VOWELS and stem[-1] in {'v', 'k', 'c', 't', 'z'}:
+                return stem + 'e'
+        return stem if len(stem) >= 3 else word
+    if word.endswith('ed') and len(word) > 4:
+        stem = word[:-2]
+        if len(stem) >= 2 and stem[-1] == stem[-2] and stem[-1] in CONSONANTS:
+            return stem[:-1]
+        if stem.endswith('i'):
+            return stem[:-1] + 'y'
+        if len(stem) >= 2 and stem[-1] in CONSONANTS and stem[-2] in VOWELS:
+            if stem[-1] in {'v', 'c', 'g', 'z'}:
+                return stem + 'e'
+        return stem if len(stem) >= 3 else word
+    if word.endswith('est') and len(word) > 5:
+        stem = word[:-3]
+        if len(stem) >= 2 and stem[-1] == stem[-2] and stem[-1] in CONSONANTS:
+            return stem[:-1]
+        return stem
+    if word.endswith('er') and len(word) > 4:
+        stem = word[:-2]
+        if len(stem) >= 2 and stem[-1] == stem[-2] and stem[-1] in CONSONANTS:
+            return stem[:-1]
+        if len(stem) >= 2 and stem[-1] in {'e', 'i', 'w'}:
+            return word
+        return stem if len(stem) >= 3 else word
+    if word.endswith('s') and not word.endswith('ss') and len(word) > 3:
+        if word.endswith('es') and len(word) > 4:
+            if word[-3:-2] in ['s', 'x', 'z'] or word[-4:-2] in ['sh', 'ch']:
+                return word[:-2]
+        return word[:-1]
+    return word
+
+
+# ----------------------------------------------------
+# 2. TESTWÖRTER SAMMELN
+# ----------------------------------------------------
+rules = load_suffix_rules("en", str(ROOT_DIR / SUFFIX_RULES_DIR))
+
+words = set()
+for file_name in ("lemma_verbs.csv", "lemma_adjectives.csv", "adjectives.csv", "verbs.csv"):
+    with open(CSV_DIR / file_name, 'r', encoding='utf-8') as file:
+        for row in csv.reader(file):
+            words.update(value.strip().lower() for value in row[:2] if value.strip())
+lemmas = set(words)
+for lemma in lemmas:
+    # Alle Formen, die die Regeln erzeugen, plus Endungen, die nicht zurückführen sollten
+    words.update(rules.candidate_forms(lemma))
+    words.update(lemma + suffix for suffix in ("s", "es", "ss", "ing", "ed", "er", "est", "ies", "ied", "d", "r", "st"))
+
+for path in CORPUS_DIR.glob("*/*.txt"):
+    for word in path.read_text(encoding="utf-8").split():
+        words.add(word.lower().strip(PUNCTUATION))
+
+print(f"Vergleiche {len(words)} Wortformen...")
+
+# ----------------------------------------------------
+# 3. VERGLEICH
+# ----------------------------------------------------
+mismatches = [(word, cascade_suffix_rules(word), rules.apply(word))
+              for word in sorted(words) if cascade_suffix_rules(word) != rules.apply(word)]
+
+if mismatches:
+    print(f"[FEHLER] {len(mismatches)} Abweichungen gefunden:")
+    for word, expected, actual in mismatches[:50]:
+        print(f"  {word}: Kaskade={expected} Regeln={actual}")
+    sys.exit(1)
+
+print(f"[OK] Suffix-Regeln ({len(rules.rules)} Regeln) entsprechen der bisherigen Kaskade.")
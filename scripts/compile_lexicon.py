@@ -0,0 +1,28 @@
+import argparse
+import sys
+from pathlib import Path
+
+# ----------------------------------------------------
+# 1. SETUP & PFADE
+# ----------------------------------------------------
+# Kompiliert data/CSV-Data/*.csv in eine mmap-fähige Binärdatei.
+# Aufruf aus dem Projektverzeichnis: python scripts/compile_lexicon.py
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from business_logic.binary_lexicon import BINARY_LEXICON_PATH, compile_lexicon
+from business_logic.suffix_rules import DEFAULT_LANGUAGE, SUFFIX_RULES_DIR
+from business_logic.text_analyzer import CSV_DIR
+
+parser = argparse.ArgumentParser(description="Kompiliert die CSV-Lexika in ein Binärformat")
+parser.add_argument("--csv-dir", default=CSV_DIR, help="Verzeichnis mit den CSV-Dateien")
+parser.add_argument("--output", default=BINARY_LEXICON_PATH, help="Zieldatei")
+parser.add_argument("--language", default=DEFAULT_LANGUAGE, help="Sprache der Suffix-Regeln")
+parser.add_argument("--rules-dir", default=SUFFIX_RULES_DIR, help="Verzeichnis mit den Suffix-Regeln")
+args = parser.parse_args()
+
+# ----------------------------------------------------
+# 2. KOMPILIEREN
+# ----------------------------------------------------
+compile_lexicon(args.csv_dir, args.output, args.language, args.rules_dir)
+print("[OK] Fertig. Verwendung: TextAnalyzer(BinaryLexiconStore())")
@@ -0,0 +1,49 @@
+import csv
+import os
+import random
+import shutil
+from pathlib import Path
+
+# ----------------------------------------------------
+# Erzeugt künstliche Lexika in Originalformat (für Benchmarks)
+# ----------------------------------------------------
+ROOT_DIR = Path(__file__).parent.parent
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def random_words(count, seed=0):
+    """Erzeugt count verschiedene, zufällige Kleinbuchstaben-Wörter"""
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choice(LETTERS) for _ in range(rng.randint(4, 12))))
+    return sorted(words)
+
+
+def write_synthetic_lexicon(csv_dir, entries, seed=0):
+    """
+    Schreibt adjectives.csv/verbs.csv mit je entries Einträgen sowie
+    unregelmäßige Formen (eine pro vier Lemmas) nach csv_dir.
+    Die Stopwords werden aus data/CSV-Data übernommen.
+    """
+    os.makedirs(csv_dir, exist_ok=True)
+    rng = random.Random(seed)
+    words = random_words(2 * entries, seed)
+    adjectives, verbs = words[0::2], words[1::2]
+
+    for file_name, column, lexicon in (("adjectives.csv", "adjective", adjectives), ("verbs.csv", "verb", verbs)):
+        with open(os.path.join(csv_dir, file_name), 'w', encoding='utf-8', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow([column, "score"])
+            for word in lexicon:
+                writer.writerow([word, rng.randint(0, 100)])
+
+    for file_name, lexicon in (("lemma_adjectives.csv", adjectives), ("lemma_verbs.csv", verbs)):
+        with open(os.path.join(csv_dir, file_name), 'w', encoding='utf-8', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(["form", "lemma"])
+            for word in lexicon[::4]:
+                writer.writerow([word[::-1] + "x", word])
+
+    shutil.copy(ROOT_DIR / "data/CSV-Data/stopwords.csv", os.path.join(csv_dir, "stopwords.csv"))
+    return adjectives, verbs